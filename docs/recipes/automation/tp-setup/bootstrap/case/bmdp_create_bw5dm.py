@@ -89,6 +89,8 @@ if __name__ == "__main__":
         exit(1)
     print("GITHUB_TOKEN is set. Proceeding with the script...")
 
+    # no browser in this case, the steps are recorded only when a browser is launched
+    Util.trace_step("deploy BW5 domains")
     helm_command = create_helm_command()
     ColorLogger.info(f"Generating shell script in system tmp folder for BW5 domain deployment.")
     script_path = Util.save_command_to_file(helm_command, "bmdp_create_bw5dm.sh")
@@ -96,6 +98,7 @@ if __name__ == "__main__":
     Helper.run_shell_file(script_path)
     ColorLogger.success("BW5 domain deployment script executed successfully.")
 
+    Util.trace_step("restart Hawk Console")
     restart_hawk_console_result = restart_hawk_console()
     if restart_hawk_console_result is not None:
         ColorLogger.info("Restart Hawk Console result:" + restart_hawk_console_result)
@@ -8,17 +8,21 @@ from page_object.po_dataplane import PageObjectDataPlane
 if __name__ == "__main__":
     page = Util.browser_launch()
     try:
+        Util.trace_step("login")
         po_auth = PageObjectAuth(page)
         po_auth.login()
         po_auth.login_check()
 
+        Util.trace_step("set user permission")
         po_user_management = PageObjectUserManagement(page)
         po_user_management.set_user_permission()
 
+        Util.trace_step("create data plane")
         po_dp = PageObjectDataPlane(page)
         po_dp.goto_left_navbar_dataplane()
         po_dp.k8s_create_bmdp(ENV.TP_AUTO_K8S_BMDP_NAME)
 
+        Util.trace_step("logout")
         po_auth.logout()
     except Exception as e:
         current_filename = Path(__file__).stem
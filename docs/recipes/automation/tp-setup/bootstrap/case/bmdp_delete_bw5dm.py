@@ -17,9 +17,12 @@ def check_bw5dm_status():
         sys.exit(0)
 
 if __name__ == "__main__":
+    # no browser in this case, the steps are recorded only when a browser is launched
+    Util.trace_step("check BW5 domains")
     check_bw5dm_status()
     print("BW5 domain is deployed. Uninstalling...")
 
+    Util.trace_step("uninstall BW5 domains")
     helm_command = delete_bw5dm_command()
     script_path = Util.save_command_to_file(helm_command, "bmdp_delete_bw5dm.sh")
     ColorLogger.info(f"Script generated at: {script_path}")
@@ -7,13 +7,16 @@ from page_object.po_dataplane import PageObjectDataPlane
 if __name__ == "__main__":
     page = Util.browser_launch()
     try:
+        Util.trace_step("login")
         po_auth = PageObjectAuth(page)
         po_auth.login()
 
+        Util.trace_step("delete data plane")
         po_dp = PageObjectDataPlane(page)
         # config global dataplane
         po_dp.k8s_delete_dataplane(ENV.TP_AUTO_K8S_BMDP_NAME)
 
+        Util.trace_step("logout")
         po_auth.logout()
     except Exception as e:
         current_filename = Path(__file__).stem
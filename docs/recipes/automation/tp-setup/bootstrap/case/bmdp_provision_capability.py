@@ -11,12 +11,14 @@ from page_object.po_bmdp_config import PageObjectBMDPConfiguration
 if __name__ == "__main__":
     page = Util.browser_launch()
     try:
+        Util.trace_step("login")
         po_auth = PageObjectAuth(page)
         po_auth.login()
         po_dp = PageObjectDataPlane(page)
         po_bmdp_config = PageObjectBMDPConfiguration(page)
         # for provision RVDM capability
         if ENV.TP_AUTO_IS_ENABLE_RVDM:
+            Util.trace_step("config BW5 RVDM")
             po_dp.goto_dataplane(ENV.TP_AUTO_K8S_BMDP_NAME)
             po_bmdp_config.goto_dataplane_config()
             po_bmdp_config.dp_config_bw5_rvdm(ENV.TP_AUTO_K8S_BMDP_BW5_RVDM)
@@ -24,10 +26,12 @@ if __name__ == "__main__":
             po_bmdp_config.goto_products("BW5") # "BW5" for BW5, "BE" for be, "BW6" for BW6
             po_bmdp_config.check_bmdp_app_status_by_app_name("BW5", ENV.TP_AUTO_K8S_BMDP_BW5_RVDM, "mySleep")
         if ENV.TP_AUTO_IS_ENABLE_EMSDM:
+            Util.trace_step("config EMS")
             po_dp.goto_dataplane(ENV.TP_AUTO_K8S_BMDP_NAME)
             po_bmdp_config.goto_dataplane_config()
             po_bmdp_config.dp_config_ems(ENV.TP_BMDP_IMAGE_TAG_EMS)
         if ENV.TP_AUTO_IS_ENABLE_EMSDM:
+            Util.trace_step("config BW5 EMSDM")
             po_dp.goto_dataplane(ENV.TP_AUTO_K8S_BMDP_NAME)
             po_bmdp_config.goto_dataplane_config()
             po_bmdp_config.dp_config_bw5_emsdm(ENV.TP_AUTO_K8S_BMDP_BW5_EMSDM)
@@ -35,6 +39,7 @@ if __name__ == "__main__":
             po_bmdp_config.goto_products("BW5")
             po_bmdp_config.check_bmdp_app_status_by_app_name("BW5", ENV.TP_AUTO_K8S_BMDP_BW5_EMSDM, "mySleep")
         if ENV.TP_AUTO_IS_ENABLE_BW6DM:
+            Util.trace_step("config BW6")
             po_dp.goto_dataplane(ENV.TP_AUTO_K8S_BMDP_NAME)
             po_bmdp_config.goto_dataplane_config()
             po_bmdp_config.dp_config_bw6(ENV.TP_AUTO_K8S_BMDP_BW6DM)
@@ -42,6 +47,7 @@ if __name__ == "__main__":
             po_bmdp_config.goto_products("BW6")
             po_bmdp_config.check_bmdp_app_status_by_app_name("BW6", ENV.TP_AUTO_K8S_BMDP_BW6DM, "mySleep.application")
 
+        Util.trace_step("logout")
         po_auth.logout()
     except Exception as e:
         current_filename = Path(__file__).stem
@@ -10,17 +10,21 @@ from page_object.po_dp_config import PageObjectDataPlaneConfiguration
 if __name__ == "__main__":
     page = Util.browser_launch()
     try:
+        Util.trace_step("login")
         po_auth = PageObjectAuth(page)
         po_auth.login()
         po_auth.login_check()
 
+        Util.trace_step("set user permission")
         po_user_management = PageObjectUserManagement(page)
         po_user_management.set_user_permission()
 
+        Util.trace_step("config global data plane o11y")
         po_dp_config = PageObjectDataPlaneConfiguration(page)
         # config global dataplane
         po_dp_config.o11y_config_dataplane_resource(ENV.TP_AUTO_DP_NAME_GLOBAL)
 
+        Util.trace_step("logout")
         po_auth.logout()
     except Exception as e:
         current_filename = Path(__file__).stem
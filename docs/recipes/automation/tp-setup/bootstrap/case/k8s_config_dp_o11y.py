@@ -9,19 +9,23 @@ from page_object.po_dp_config import PageObjectDataPlaneConfiguration
 if __name__ == "__main__":
     page = Util.browser_launch()
     try:
+        Util.trace_step("login")
         po_auth = PageObjectAuth(page)
         po_auth.login()
         po_auth.login_check()
 
+        Util.trace_step("set user permission")
         po_user_management = PageObjectUserManagement(page)
         po_user_management.set_user_permission()
 
+        Util.trace_step("config data plane o11y")
         po_dp = PageObjectDataPlane(page)
         po_dp_config = PageObjectDataPlaneConfiguration(page)
         po_dp.goto_dataplane(ENV.TP_AUTO_K8S_DP_NAME)
         po_dp_config.goto_dataplane_config()
         po_dp_config.o11y_config_dataplane_resource(ENV.TP_AUTO_K8S_DP_NAME)
 
+        Util.trace_step("logout")
         po_auth.logout()
     except Exception as e:
         current_filename = Path(__file__).stem
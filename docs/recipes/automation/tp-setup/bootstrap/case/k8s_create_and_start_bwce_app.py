@@ -17,11 +17,13 @@ if __name__ == "__main__":
 
     page = Util.browser_launch()
     try:
+        Util.trace_step("login")
         po_auth = PageObjectAuth(page)
         po_auth.login()
 
         if FORCE_RUN_AUTOMATION:
             print("FORCE_RUN_AUTOMATION is set to True. Running automation with pre-check and pre-set.")
+            Util.trace_step("config data plane resources")
             po_dp = PageObjectDataPlane(page)
             po_dp_config = PageObjectDataPlaneConfiguration(page)
             po_dp.goto_dataplane(ENV.TP_AUTO_K8S_DP_NAME)
@@ -39,18 +41,22 @@ if __name__ == "__main__":
             po_dp_config.dp_config_activation(ENV.TP_AUTO_K8S_DP_NAME, True)
             po_dp_config.o11y_config_switch_to_global(ENV.TP_AUTO_K8S_DP_NAME)
 
+        Util.trace_step("goto data plane")
         po_dp_bwce = PageObjectDataPlaneBWCE(page, CAPABILITY)
         po_dp_bwce.goto_left_navbar_dataplane()
         po_dp_bwce.goto_dataplane(ENV.TP_AUTO_K8S_DP_NAME)
         if FORCE_RUN_AUTOMATION:
             po_dp_bwce.bwce_provision_capability(ENV.TP_AUTO_K8S_DP_NAME)
             po_dp_bwce.bwce_provision_connector(ENV.TP_AUTO_K8S_DP_NAME)
+        Util.trace_step("deploy app")
         po_dp_bwce.bwce_app_build_and_deploy(ENV.TP_AUTO_K8S_DP_NAME)
         po_dp_bwce.bwce_app_deploy(ENV.TP_AUTO_K8S_DP_NAME)
 
+        Util.trace_step("config and start app")
         po_dp_bwce.bwce_app_config(ENV.TP_AUTO_K8S_DP_NAME)
         po_dp_bwce.bwce_app_start(ENV.TP_AUTO_K8S_DP_NAME)
 
+        Util.trace_step("logout")
         po_auth.logout()
     except Exception as e:
         current_filename = Path(__file__).stem
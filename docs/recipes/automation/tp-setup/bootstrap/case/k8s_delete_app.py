@@ -16,9 +16,11 @@ if __name__ == "__main__":
 
     page = Util.browser_launch()
     try:
+        Util.trace_step("login")
         po_auth = PageObjectAuth(page)
         po_auth.login()
 
+        Util.trace_step("delete app")
         po_dp = PageObjectDataPlane(page)
         po_dp.goto_left_navbar_dataplane()
         if CAPABILITY == "bwce":
@@ -30,6 +32,7 @@ if __name__ == "__main__":
         if CAPABILITY == "flogo":
             po_dp.k8s_delete_app(ENV.TP_AUTO_K8S_DP_NAME, CAPABILITY, ENV.FLOGO_APP_NAME)
 
+        Util.trace_step("logout")
         po_auth.logout()
     except Exception as e:
         current_filename = Path(__file__).stem
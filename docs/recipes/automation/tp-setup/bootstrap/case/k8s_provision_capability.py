@@ -15,9 +15,11 @@ from page_object.po_dp_tibcohub import PageObjectDataPlaneTibcoHub
 if __name__ == "__main__":
     page = Util.browser_launch()
     try:
+        Util.trace_step("login")
         po_auth = PageObjectAuth(page)
         po_auth.login()
 
+        Util.trace_step("config data plane resources")
         po_dp = PageObjectDataPlane(page)
         po_dp_config = PageObjectDataPlaneConfiguration(page)
         po_dp.goto_dataplane(ENV.TP_AUTO_K8S_DP_NAME)
@@ -26,6 +28,7 @@ if __name__ == "__main__":
 
         # for provision BWCE/BW5 capability
         if ENV.TP_AUTO_IS_PROVISION_BWCE or ENV.TP_AUTO_IS_PROVISION_BW5CE:
+            Util.trace_step("provision BWCE capability")
             capability = "bw5ce" if ENV.TP_AUTO_IS_PROVISION_BW5CE else "bwce"
 
             ingress_controller = ENV.TP_AUTO_INGRESS_CONTROLLER_BW5CE if ENV.TP_AUTO_IS_PROVISION_BW5CE else ENV.TP_AUTO_INGRESS_CONTROLLER_BWCE
@@ -43,6 +46,7 @@ if __name__ == "__main__":
 
         # for provision EMS capability
         if ENV.TP_AUTO_IS_PROVISION_EMS:
+            Util.trace_step("provision EMS capability")
             po_dp_ems = PageObjectDataPlaneEMS(page)
             po_dp_ems.goto_left_navbar_dataplane()
             po_dp_ems.goto_dataplane(ENV.TP_AUTO_K8S_DP_NAME)
@@ -51,6 +55,7 @@ if __name__ == "__main__":
 
         # for provision Flogo capability
         if ENV.TP_AUTO_IS_PROVISION_FLOGO:
+            Util.trace_step("provision Flogo capability")
             po_dp_config.dp_config_resources_ingress(
                 ENV.TP_AUTO_K8S_DP_NAME,
                 ENV.TP_AUTO_INGRESS_CONTROLLER, ENV.TP_AUTO_INGRESS_CONTROLLER_FLOGO,
@@ -64,6 +69,7 @@ if __name__ == "__main__":
 
         # for provision Pulsar capability
         if ENV.TP_AUTO_IS_PROVISION_PULSAR:
+            Util.trace_step("provision Pulsar capability")
             po_dp_pulsar = PageObjectDataPlanePulsar(page)
             po_dp_pulsar.goto_left_navbar_dataplane()
             po_dp_pulsar.goto_dataplane(ENV.TP_AUTO_K8S_DP_NAME)
@@ -72,6 +78,7 @@ if __name__ == "__main__":
 
         # for provision TibcoHub capability
         if ENV.TP_AUTO_IS_PROVISION_TIBCOHUB:
+            Util.trace_step("provision TibcoHub capability")
             po_dp_config.dp_config_resources_ingress(
                 ENV.TP_AUTO_K8S_DP_NAME,
                 ENV.TP_AUTO_INGRESS_CONTROLLER, ENV.TP_AUTO_INGRESS_CONTROLLER_TIBCOHUB,
@@ -83,6 +90,7 @@ if __name__ == "__main__":
 
             po_dp_tibcohub.tibcohub_provision_capability(ENV.TP_AUTO_K8S_DP_NAME, ENV.TP_AUTO_TIBCOHUB_CAPABILITY_HUB_NAME)
 
+        Util.trace_step("logout")
         po_auth.logout()
     except Exception as e:
         current_filename = Path(__file__).stem
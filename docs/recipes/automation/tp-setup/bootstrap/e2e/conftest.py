@@ -7,11 +7,11 @@ from page_object.po_auth import PageObjectAuth
 from page_object.po_o11y import PageObjectO11y
 
 import pytest
-from utils.helper import Helper
+from utils.cluster_discovery import cluster_discovery
 
 # TODO: this code should be moved when feature is released.
 def pytest_collection_modifyitems(config, items):
-    platform_base_version = Helper.get_cp_platform_base_version()
+    platform_base_version = cluster_discovery.get("cpPlatformBaseVersion")
 
     for item in items:
         if "test_o11y_" in item.nodeid and "-custom-o11y" not in platform_base_version:
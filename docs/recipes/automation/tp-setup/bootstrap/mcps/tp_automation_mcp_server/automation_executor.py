@@ -2,10 +2,12 @@
 
 #  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
 
+import asyncio
 import os
 import sys
 import subprocess
 import json
+import time
 import urllib.request
 import urllib.parse
 import urllib.error
@@ -18,6 +20,9 @@ from .server_lifecycle import ensure_server_ready
 
 logger = logging.getLogger('tibco-platform-provisioner-executor')
 
+# Local flask server URL (using port 3120 as seen in server.py)
+AUTOMATION_SERVER_URL = "https://automation.localhost.dataplanes.pro"
+
 async def run_automation_task(case: str, params: Optional[Dict[str, Any]] = None) -> str:
     """Run an automation task by making an API call to the bootstrap server.
 
@@ -64,90 +69,18 @@ async def run_automation_task(case: str, params: Optional[Dict[str, Any]] = None
     # Format parameters for URL
     query_params = urllib.parse.urlencode(request_params)
 
-    # Local flask server URL (using port 3120 as seen in server.py)
-    flask_url = f"https://automation.localhost.dataplanes.pro/run-gui-script?{query_params}"
+    # Submit the job once, then follow its output. The job keeps running on the server if the stream breaks,
+    # so a broken stream is resumed with Last-Event-ID instead of starting the case again.
+    submit_url = f"{AUTOMATION_SERVER_URL}/jobs?{query_params}"
 
-    logger.info("Running automation task: %s", case)
-    logger.info("API URL: %s", flask_url)
+    def submit_and_follow():
+        logger.info("Running automation task: %s", case)
+        logger.info("API URL: %s", submit_url)
 
-    # Retry mechanism for IncompleteRead errors
-    max_retries = 3
-    retry_count = 0
-    
-    while retry_count < max_retries:
         try:
-            # Create request with timeout
-            req = urllib.request.Request(flask_url)
-
-            # Use urllib to make the HTTP request with timeout
-            with urllib.request.urlopen(req, timeout=1800) as response:  # 30 minutes timeout
-                # Check HTTP status
-                if response.getcode() != 200:
-                    error_msg = f"HTTP {response.getcode()}: Server returned error status"
-                    logger.error(error_msg)
-                    return error_msg
-
-                # Read response data with chunked reading for better reliability
-                response_data = b""
-                chunk_size = 8192  # 8KB chunks
-                
-                try:
-                    while True:
-                        chunk = response.read(chunk_size)
-                        if not chunk:
-                            break
-                        response_data += chunk
-                    
-                    output = response_data.decode('utf-8', errors='replace')  # Handle encoding issues gracefully
-                    
-                except IncompleteRead as e:
-                    # Handle partial data from IncompleteRead
-                    logger.warning("IncompleteRead encountered, using partial data: %s", str(e))
-                    partial_data = e.partial
-                    if response_data:
-                        response_data += partial_data
-                    else:
-                        response_data = partial_data
-                    output = response_data.decode('utf-8', errors='replace')
-                    
-                except UnicodeDecodeError as e:
-                    logger.error("Unicode decode error: %s", str(e))
-                    # Try with different encoding as fallback
-                    try:
-                        output = response_data.decode('latin1', errors='replace')
-                    except UnicodeDecodeError:
-                        output = str(response_data)
-
-                # Log the complete output
-                logger.info("Automation task completed. Output length: %d characters", len(output))
-                if len(output) > 1000:
-                    logger.info("Output preview: %s...%s", output[:500], output[-500:])
-                else:
-                    logger.info("Complete output: %s", output)
-
-                return output
-                
-        except IncompleteRead as e:
-            retry_count += 1
-            error_msg = f"IncompleteRead error on attempt {retry_count}/{max_retries}: {str(e)}"
-            logger.warning(error_msg)
-            
-            if retry_count >= max_retries:
-                # Last attempt failed, try to use partial data if available
-                if hasattr(e, 'partial') and e.partial:
-                    try:
-                        output = e.partial.decode('utf-8', errors='replace')
-                        logger.info("Using partial data from final attempt: %d characters", len(output))
-                        return output
-                    except UnicodeDecodeError:
-                        return f"Error: {error_msg} - Could not decode partial data"
-                return f"Error: {error_msg} after {max_retries} attempts"
-            else:
-                logger.info("Retrying request in 2 seconds...")
-                import time
-                time.sleep(2)  # Wait before retry
-                continue
-                
+            req = urllib.request.Request(submit_url, method="POST")
+            with urllib.request.urlopen(req, timeout=60) as response:
+                job = json.loads(response.read().decode('utf-8'))
         except urllib.error.HTTPError as e:
             error_msg = f"HTTP Error {e.code}: {e.reason}"
             logger.error(error_msg)
@@ -156,18 +89,111 @@ async def run_automation_task(case: str, params: Optional[Dict[str, Any]] = None
             error_msg = f"Error connecting to automation server: {str(e)}"
             logger.error(error_msg)
             return error_msg
-        except UnicodeDecodeError as e:
-            error_msg = f"Error decoding server response: {str(e)}"
-            logger.error(error_msg)
-            return error_msg
         except Exception as e:
-            # Catch any other exceptions not specifically handled above
             error_msg = f"Automation task failed: {str(e)}"
             logger.error(error_msg)
             return error_msg
-    
-    # Should not reach here, but just in case
-    return "Error: Unexpected error in retry loop"
+
+        events_url = f"{AUTOMATION_SERVER_URL}{job['eventsUrl']}"
+        logger.info("Automation job %s submitted, events: %s", job['jobId'], events_url)
+
+        # Retry mechanism for broken streams, the counter is reset whenever new output is received
+        max_retries = 3
+        retry_count = 0
+        lines = []
+        last_event_id = 0
+
+        while True:
+            received = False
+            try:
+                req = urllib.request.Request(events_url, headers={
+                    "Accept": "text/event-stream",
+                    "Last-Event-ID": str(last_event_id),
+                })
+                # the server sends a keep-alive comment every 15 seconds, a silent connection is broken
+                with urllib.request.urlopen(req, timeout=300) as response:
+                    event_id, event_type, data = None, "message", []
+                    for raw_line in response:
+                        line = raw_line.decode('utf-8', errors='replace').rstrip("\r\n")
+                        if line:
+                            field, _, value = line.partition(":")
+                            value = value[1:] if value.startswith(" ") else value
+                            if field == "id":
+                                event_id = value
+                            elif field == "event":
+                                event_type = value
+                            elif field == "data":
+                                data.append(value)
+                            continue
+
+                        # an empty line dispatches the event
+                        if event_type == "end":
+                            output = "\n".join(lines)
+                            logger.info("Automation task completed: %s. Output length: %d characters",
+                                        "\n".join(data), len(output))
+                            if len(output) > 1000:
+                                logger.info("Output preview: %s...%s", output[:500], output[-500:])
+                            else:
+                                logger.info("Complete output: %s", output)
+                            return output
+                        if event_type == "message" and data:
+                            lines.append("\n".join(data))
+                            received = True
+                        if event_id is not None and event_id.isdigit():
+                            last_event_id = int(event_id)
+                        event_id, event_type, data = None, "message", []
+
+                error_msg = "Event stream closed before the job ended"
+
+            except urllib.error.HTTPError as e:
+                error_msg = f"HTTP Error {e.code}: {e.reason}"
+                logger.error(error_msg)
+                return error_msg
+            except (IncompleteRead, urllib.error.URLError, OSError) as e:
+                error_msg = f"Event stream interrupted: {str(e)}"
+            except Exception as e:
+                # Catch any other exceptions not specifically handled above
+                error_msg = f"Automation task failed: {str(e)}"
+                logger.error(error_msg)
+                return error_msg
+
+            retry_count = 0 if received else retry_count + 1
+            logger.warning("%s, attempt %d/%d", error_msg, retry_count, max_retries)
+            if retry_count >= max_retries:
+                output = "\n".join(lines)
+                return f"{output}\nError: {error_msg} after {max_retries} attempts" if output else f"Error: {error_msg}"
+            logger.info("Resuming job %s after event %d in 2 seconds...", job['jobId'], last_event_id)
+            time.sleep(2)
+
+    # urlopen and the retry delay block until the job ends, do not block the event loop
+    return await asyncio.to_thread(submit_and_follow)
+
+async def get_report_changes(after_version: Optional[int] = None, job_versions: Optional[Dict[str, int]] = None,
+                             timeout: int = 30) -> Dict[str, Any]:
+    """Wait for changes of the report written by the automation cases (GET /report/changes).
+
+    Args:
+        after_version: Report version already seen, None to get the whole report
+        job_versions: Job id to version of the job changes already seen
+        timeout: Max seconds to wait for a change
+
+    Returns:
+        version, complete, changes (report when not complete), jobChanges and jobs of the running jobs
+
+    Raises:
+        urllib.error.URLError: If API connection fails
+    """
+    query = [("timeout", timeout)]
+    if after_version is not None:
+        query.append(("after", after_version))
+    query += [("job", f"{job_id}:{version}") for job_id, version in (job_versions or {}).items()]
+    url = f"{AUTOMATION_SERVER_URL}/report/changes?{urllib.parse.urlencode(query)}"
+
+    def request():
+        with urllib.request.urlopen(url, timeout=timeout + 30) as response:
+            return json.loads(response.read().decode('utf-8'))
+    # the request is held by the server until there is a change, do not block the event loop
+    return await asyncio.to_thread(request)
 
 def run_bash_script(script_name: str, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Run bash script and return the result (deprecated - kept for compatibility)"""
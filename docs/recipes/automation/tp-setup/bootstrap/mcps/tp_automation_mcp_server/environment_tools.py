@@ -2,24 +2,61 @@
 
 #  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
 
+import json
 import logging
+from typing import Dict, Optional
 
-from .automation_executor import run_automation_task, execute_module
+from .automation_executor import run_automation_task, execute_module, get_report_changes
 from .config import DEFAULT_VALUES
 
 logger = logging.getLogger('tibco-platform-provisioner-environment')
 
-async def show_environment() -> str:
+async def show_environment(output_format: str = "text") -> str:
     """Show Current Environment (Login CP/Elastic Credentials)
 
+    Args:
+        output_format: "text" for the console report, "json" for the same information as a JSON document
+
     Returns:
         Information about the current environment
     """
+    params = {"TP_AUTO_ENV_INFO_FORMAT": output_format}
     try:
-        return await run_automation_task("page_env")
+        output = await run_automation_task("page_env", params)
     except Exception as e:
         logger.error("Failed to run through API, trying direct module execution: %s", e)
-        return await execute_module("page_env")
+        output = await execute_module("page_env", params)
+    if output_format != "json":
+        return output
+
+    # page_env prints the JSON document as its last line
+    for line in reversed(output.splitlines()):
+        if line.startswith("{"):
+            try:
+                return json.dumps(json.loads(line), indent=2)
+            except ValueError:
+                break
+    return output
+
+async def watch_environment(after_version: int = -1, job_versions: Optional[Dict[str, int]] = None,
+                            timeout: int = 30) -> str:
+    """Wait for changes of the environment report, instead of calling show_environment() again
+
+    Args:
+        after_version: Report version returned by the previous call, -1 to get the whole report
+        job_versions: "jobs" returned by the previous call, changes of running jobs already seen
+        timeout: Max seconds to wait for a change
+
+    Returns:
+        JSON with the report version, the changes after after_version (or the whole report)
+        and the changes of the running jobs
+    """
+    try:
+        result = await get_report_changes(None if after_version < 0 else after_version, job_versions, timeout)
+        return json.dumps(result, indent=2)
+    except Exception as e:
+        logger.error("Failed to get report changes: %s", e)
+        return f"Error: Failed to get report changes: {e}"
 
 async def create_subscription(email: str = "") -> str:
     """Create new subscription with User Email
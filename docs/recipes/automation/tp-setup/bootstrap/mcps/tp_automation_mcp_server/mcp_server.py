@@ -3,13 +3,13 @@
 #  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
 
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 from mcp.server.fastmcp import FastMCP
 from starlette.applications import Starlette
 from .server_lifecycle import lifespan, ensure_server_ready, get_server_status, is_server_initialized
 from .config import DEFAULT_VALUES, CASE_TO_MODULE, MCP_TRANSPORT, MCP_SERVER_HOST, MCP_SERVER_PORT, MCP_HTTP_BEARER_TOKEN
-from .environment_tools import show_environment, create_subscription, config_o11y_widget, config_global_o11y
+from .environment_tools import show_environment, watch_environment, create_subscription, config_o11y_widget, config_global_o11y
 from .dataplane_tools import create_k8s_dataplane, config_dataplane_o11y, delete_dataplane
 from .capability_tools import provision_bwce, provision_ems, provision_flogo, provision_pulsar, provision_tibcohub
 from .application_tools import create_start_bwce_app, create_start_flogo_app, delete_bwce_app, delete_flogo_app
@@ -48,7 +48,7 @@ mcp_kwargs = {
         It is designed for DevOps to automate the setup of TIBCO Platform environments.
         TIBCO Platform consist two main components: Control Plane (CP) and Data Plane (DP).
         This MCP automation server is designed to run automation for DP mainly.
-        Call show_environment() to get the current environment.
+        Call show_environment() to get the current environment, watch_environment_changes() to follow its changes.
         """,
     "bearer_token": MCP_HTTP_BEARER_TOKEN
 }
@@ -63,13 +63,33 @@ mcp = AuthenticatedFastMCP(**mcp_kwargs)
 
 # Environment Management Actions
 @mcp.tool()
-async def show_current_environment() -> str:
+async def show_current_environment(output_format: str = "text") -> str:
     """Show Current Environment (Login CP/Elastic Credentials)
 
+    Args:
+        output_format: "text" for the console report, "json" for the same information as a JSON document
+            (controlPlane, login, observability, dataPlanes with their capabilities and apps)
+
     Returns:
         Information about the current environment
     """
-    return await show_environment()
+    return await show_environment(output_format)
+
+@mcp.tool()
+async def watch_environment_changes(after_version: int = -1, job_versions: Optional[Dict[str, int]] = None,
+                                    timeout: int = 30) -> str:
+    """Wait for changes of the environment report (data planes, capabilities, apps) written by running cases
+
+    Args:
+        after_version: Report version returned by the previous call, -1 to get the whole report
+        job_versions: "jobs" returned by the previous call, changes of running jobs already seen
+        timeout: Max seconds to wait for a change
+
+    Returns:
+        JSON with the report version, the changes after after_version (or the whole report)
+        and the changes of the running jobs
+    """
+    return await watch_environment(after_version, job_versions, timeout)
 
 @mcp.tool()
 async def create_user_subscription(email: str = "") -> str:
@@ -9,10 +9,14 @@ if __name__ == "__main__":
     page = Util.browser_launch()
     po_auth = PageObjectAuth(page)
     try:
+        Util.trace_step("check host prefix")
         if not po_auth.is_host_prefix_exist(ENV.DP_HOST_PREFIX):
             if not po_auth.is_admin_user_exist():
+                Util.trace_step("activate admin user")
                 po_auth.active_user_in_mail(ENV.CP_ADMIN_EMAIL, True)
+            Util.trace_step("provision user")
             po_auth.admin_provision_user(ENV.DP_USER_EMAIL, ENV.DP_HOST_PREFIX)
+            Util.trace_step("activate user")
             po_auth.active_user_in_mail(ENV.DP_USER_EMAIL)
     except Exception as e:
         current_filename = Path(__file__).stem
@@ -17,22 +17,27 @@ if __name__ == "__main__":
         po_dp = PageObjectDataPlane(page)
         po_bmdp_config = PageObjectBMDPConfiguration(page)
 
+        Util.trace_step("login")
         po_auth.login()
         po_auth.login_check()
 
+        Util.trace_step("set user permission")
         po_user_management = PageObjectUserManagement(page)
         po_user_management.set_user_permission()
 
+        Util.trace_step("config global data plane o11y")
         # config global dataplane
         po_bmdp_config.o11y_config_dataplane_resource(ENV.TP_AUTO_DP_NAME_GLOBAL)
 
         if ENV.TP_AUTO_IS_CREATE_BMDP:
+            Util.trace_step("create BMDP")
             # for create dataplane and config dataplane resources
             po_dp.goto_left_navbar_dataplane()
             # po_dp.k8s_delete_dataplane(ENV.TP_AUTO_K8S_BMDP_NAME)
             po_dp.k8s_create_bmdp(ENV.TP_AUTO_K8S_BMDP_NAME)
 
             if ENV.TP_AUTO_IS_ENABLE_RVDM and po_bmdp_config.is_app_running("BW5", ENV.TP_AUTO_K8S_BMDP_BW5_RVDM, "mySleep") == False:
+                Util.trace_step("config BW5 RVDM")
                 po_dp.goto_dataplane(ENV.TP_AUTO_K8S_BMDP_NAME)
                 po_bmdp_config.goto_dataplane_config()
                 po_bmdp_config.dp_config_bw5_rvdm(ENV.TP_AUTO_K8S_BMDP_BW5_RVDM)
@@ -40,10 +45,12 @@ if __name__ == "__main__":
                 po_bmdp_config.goto_products("BW5") # "BW5" for BW5, "BE" for be, "BW6" for BW6
                 po_bmdp_config.check_bmdp_app_status_by_app_name("BW5", ENV.TP_AUTO_K8S_BMDP_BW5_RVDM, "mySleep")
             if ENV.TP_AUTO_IS_ENABLE_EMSDM and po_bmdp_config.is_ems_server_connected(ENV.TP_BMDP_IMAGE_TAG_EMS) == False:
+                Util.trace_step("config EMS server")
                 po_dp.goto_dataplane(ENV.TP_AUTO_K8S_BMDP_NAME)
                 po_bmdp_config.goto_dataplane_config()
                 po_bmdp_config.dp_config_ems(ENV.TP_BMDP_IMAGE_TAG_EMS)
             if ENV.TP_AUTO_IS_ENABLE_EMSDM and po_bmdp_config.is_app_running("BW5", ENV.TP_AUTO_K8S_BMDP_BW5_EMSDM, "mySleep") == False:
+                Util.trace_step("config BW5 EMSDM")
                 po_dp.goto_dataplane(ENV.TP_AUTO_K8S_BMDP_NAME)
                 po_bmdp_config.goto_dataplane_config()
                 po_bmdp_config.dp_config_bw5_emsdm(ENV.TP_AUTO_K8S_BMDP_BW5_EMSDM)
@@ -51,6 +58,7 @@ if __name__ == "__main__":
                 po_bmdp_config.goto_products("BW5")
                 po_bmdp_config.check_bmdp_app_status_by_app_name("BW5", ENV.TP_AUTO_K8S_BMDP_BW5_EMSDM, "mySleep")
             if ENV.TP_AUTO_IS_ENABLE_BW6DM and po_bmdp_config.is_app_running("BW6", ENV.TP_AUTO_K8S_BMDP_BW6DM, "mySleep.application") == False:
+                Util.trace_step("config BW6DM")
                 po_dp.goto_dataplane(ENV.TP_AUTO_K8S_BMDP_NAME)
                 po_bmdp_config.goto_dataplane_config()
                 po_bmdp_config.dp_config_bw6(ENV.TP_AUTO_K8S_BMDP_BW6DM)
@@ -58,11 +66,13 @@ if __name__ == "__main__":
                 po_bmdp_config.goto_products("BW6")
                 po_bmdp_config.check_bmdp_app_status_by_app_name("BW6", ENV.TP_AUTO_K8S_BMDP_BW6DM, "mySleep.application")
             
+            Util.trace_step("config BMDP o11y")
             po_dp.goto_dataplane(ENV.TP_AUTO_K8S_BMDP_NAME)
             po_bmdp_config.goto_dataplane_config()
             po_bmdp_config.o11y_config_dataplane_resource(ENV.TP_AUTO_K8S_BMDP_NAME)
             po_bmdp_config.o11y_config_switch_to_global(ENV.TP_AUTO_K8S_BMDP_NAME)
 
+        Util.trace_step("logout")
         po_dp.goto_left_navbar_dataplane()
         po_dp.goto_dataplane(ENV.TP_AUTO_K8S_BMDP_NAME)
         Util.screenshot_page(page, f"success-{ENV.TP_AUTO_K8S_BMDP_NAME}.png")
@@ -21,19 +21,24 @@ if __name__ == "__main__":
         po_auth = PageObjectAuth(page)
         po_dp = PageObjectDataPlane(page)
         po_dp_config = PageObjectDataPlaneConfiguration(page)
+        Util.trace_step("login")
         po_auth.login()
         po_auth.login_check()
 
+        Util.trace_step("set user permission")
         po_user_management = PageObjectUserManagement(page)
         po_user_management.set_user_permission()
 
+        Util.trace_step("config global data plane o11y")
         # config global dataplane
         po_dp_config.o11y_config_dataplane_resource(ENV.TP_AUTO_DP_NAME_GLOBAL)
 
         if ENV.TP_AUTO_IS_CREATE_DP:
+            Util.trace_step("create data plane")
             # for create dataplane and config dataplane resources
             po_dp.goto_left_navbar_dataplane()
             po_dp.k8s_create_dataplane(ENV.TP_AUTO_K8S_DP_NAME)
+            Util.trace_step("config data plane resources")
             po_dp.goto_dataplane(ENV.TP_AUTO_K8S_DP_NAME)
             po_dp_config.goto_dataplane_config()
             po_dp_config.dp_config_resources_storage(ENV.TP_AUTO_K8S_DP_NAME)
@@ -66,15 +71,18 @@ if __name__ == "__main__":
 
             # for provision Flogo capability, connector, app, and start app
             if ENV.TP_AUTO_IS_PROVISION_FLOGO:
+                Util.trace_step("provision Flogo capability")
                 po_dp_flogo = PageObjectDataPlaneFlogo(page)
                 po_dp_flogo.goto_left_navbar_dataplane()
                 po_dp_flogo.goto_dataplane(ENV.TP_AUTO_K8S_DP_NAME)
 
                 po_dp_flogo.flogo_provision_capability(ENV.TP_AUTO_K8S_DP_NAME)
+                Util.trace_step("deploy Flogo app")
                 po_dp_flogo.flogo_provision_connector(ENV.TP_AUTO_K8S_DP_NAME, ENV.FLOGO_APP_NAME)
                 po_dp_flogo.flogo_app_build_and_deploy(ENV.TP_AUTO_K8S_DP_NAME, ENV.FLOGO_APP_FILE_NAME, ENV.FLOGO_APP_NAME)
                 po_dp_flogo.flogo_app_deploy(ENV.TP_AUTO_K8S_DP_NAME, ENV.FLOGO_APP_NAME)
 
+                Util.trace_step("config and start Flogo app")
                 po_dp_flogo.flogo_app_config(ENV.TP_AUTO_K8S_DP_NAME, ENV.FLOGO_APP_NAME)
                 if ENV.TP_AUTO_START_FLOGO_APP:
                     po_dp_flogo.flogo_app_start(ENV.TP_AUTO_K8S_DP_NAME, ENV.FLOGO_APP_NAME)
@@ -84,16 +92,19 @@ if __name__ == "__main__":
             if ENV.TP_AUTO_IS_PROVISION_BWCE or ENV.TP_AUTO_IS_PROVISION_BW5CE:
                 # default capability is bwce, if TP_AUTO_IS_PROVISION_BW5CE is set, then use bw5ce
                 capability = "bw5ce" if ENV.TP_AUTO_IS_PROVISION_BW5CE else "bwce"
+                Util.trace_step(f"provision {capability} capability")
 
                 po_dp_bwce = PageObjectDataPlaneBWCE(page, capability)
                 po_dp_bwce.goto_left_navbar_dataplane()
                 po_dp_bwce.goto_dataplane(ENV.TP_AUTO_K8S_DP_NAME)
 
                 po_dp_bwce.bwce_provision_capability(ENV.TP_AUTO_K8S_DP_NAME)
+                Util.trace_step(f"deploy {capability} app")
                 po_dp_bwce.bwce_provision_connector(ENV.TP_AUTO_K8S_DP_NAME)
                 po_dp_bwce.bwce_app_build_and_deploy(ENV.TP_AUTO_K8S_DP_NAME)
                 po_dp_bwce.bwce_app_deploy(ENV.TP_AUTO_K8S_DP_NAME)
 
+                Util.trace_step(f"config and start {capability} app")
                 po_dp_bwce.bwce_app_config(ENV.TP_AUTO_K8S_DP_NAME)
                 if ENV.TP_AUTO_START_BWCE_APP or ENV.TP_AUTO_START_BW5CE_APP:
                     po_dp_bwce.bwce_app_start(ENV.TP_AUTO_K8S_DP_NAME)
@@ -101,6 +112,7 @@ if __name__ == "__main__":
 
             # for provision EMS capability
             if ENV.TP_AUTO_IS_PROVISION_EMS:
+                Util.trace_step("provision EMS capability")
                 po_dp_ems = PageObjectDataPlaneEMS(page)
                 po_dp_ems.goto_left_navbar_dataplane()
                 po_dp_ems.goto_dataplane(ENV.TP_AUTO_K8S_DP_NAME)
@@ -109,6 +121,7 @@ if __name__ == "__main__":
 
             # for provision Pulsar capability
             if ENV.TP_AUTO_IS_PROVISION_PULSAR:
+                Util.trace_step("provision Pulsar capability")
                 po_dp_pulsar = PageObjectDataPlanePulsar(page)
                 po_dp_pulsar.goto_left_navbar_dataplane()
                 po_dp_pulsar.goto_dataplane(ENV.TP_AUTO_K8S_DP_NAME)
@@ -117,12 +130,14 @@ if __name__ == "__main__":
 
             # for provision TibcoHub capability
             if ENV.TP_AUTO_IS_PROVISION_TIBCOHUB:
+                Util.trace_step("provision TibcoHub capability")
                 po_dp_tibcohub = PageObjectDataPlaneTibcoHub(page)
                 po_dp_tibcohub.goto_left_navbar_dataplane()
                 po_dp_tibcohub.goto_dataplane(ENV.TP_AUTO_K8S_DP_NAME)
 
                 po_dp_tibcohub.tibcohub_provision_capability(ENV.TP_AUTO_K8S_DP_NAME, ENV.TP_AUTO_TIBCOHUB_CAPABILITY_HUB_NAME)
 
+        Util.trace_step("logout")
         po_dp.goto_left_navbar_dataplane()
         po_dp.goto_dataplane(ENV.TP_AUTO_K8S_DP_NAME)
         Util.screenshot_page(page, f"success-{ENV.TP_AUTO_K8S_DP_NAME}.png")
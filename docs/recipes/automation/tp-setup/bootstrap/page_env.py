@@ -1,20 +1,25 @@
-import sys
 from utils.env import ENV
 from utils.color_logger import ColorLogger
+from utils.report import ReportYaml
 from utils.util import Util
 
 if __name__ == "__main__":
-    Util.print_cp_info()
-    Util.print_env_info()
+    # one snapshot for the console, report.txt and report.json
+    env_info = Util.get_env_info()
+    text = env_info.to_text()
 
     output_file = f"{ENV.TP_AUTO_REPORT_PATH}/{ENV.TP_AUTO_REPORT_TXT_FILE}"
     with open(output_file, "w", encoding="utf-8") as f:
-        # Redirect stdout to file
-        sys.stdout = f
-        Util.print_cp_info()  # This output goes to the file
-        Util.print_env_info()  # This output goes to the file
+        f.write(text + "\n")
+    json_file = f"{ENV.TP_AUTO_REPORT_PATH}/{ENV.TP_AUTO_REPORT_JSON_FILE}"
+    with open(json_file, "w", encoding="utf-8") as f:
+        f.write(env_info.to_json(indent=2) + "\n")
+    ReportYaml.export_yaml()
 
-        # Restore stdout to terminal
-        sys.stdout = sys.__stdout__
-
-    ColorLogger.success(f"Final report information saved to file: {output_file}")
+    if ENV.TP_AUTO_ENV_INFO_FORMAT == "json":
+        ColorLogger.success(f"Final report information saved to file: {output_file}, {json_file}")
+        # the last line of the output, so clients can parse it
+        print(env_info.to_json())
+    else:
+        print(text)
+        ColorLogger.success(f"Final report information saved to file: {output_file}")
@@ -16,13 +16,16 @@ if __name__ == "__main__":
         po_auth = PageObjectAuth(page)
         po_o11y = PageObjectO11y(page)
 
+        Util.trace_step("login")
         po_auth.login()
         po_auth.login_check()
 
+        Util.trace_step("reset o11y layout")
         po_o11y.goto_left_navbar_o11y()
         if po_o11y.is_support_add_widget():
             po_o11y.click_action_menu("Reset Layout", True)
             if po_o11y.is_data_plane_in_list(ENV.TP_AUTO_K8S_DP_NAME):
+                Util.trace_step("add o11y widgets of k8s data plane")
                 widget_card_data = [
                     # level1_menu, level2_menu, middle_menu, data_plane_type
                     ("Integration General", None, "Application Instances", "Kubernetes"),
@@ -40,6 +43,7 @@ if __name__ == "__main__":
                 ReportYaml.set_dataplane_info(ENV.TP_AUTO_K8S_DP_NAME, "o11yWidget", True)
 
             if po_o11y.is_data_plane_in_list(ENV.TP_AUTO_K8S_BMDP_NAME):
+                Util.trace_step("add o11y widgets of BMDP")
                 widget_card_data = [
                     # level1_menu, level2_menu, middle_menu, data_plane_type
                     ("Integration General", None, "Application Instances", "Control Tower"),
@@ -51,6 +55,7 @@ if __name__ == "__main__":
                     po_o11y.add_widget(level1_menu, level2_menu, middle_menu, data_plane_type)
                 ReportYaml.set_dataplane_info(ENV.TP_AUTO_K8S_BMDP_NAME, "o11yWidget", True)
 
+        Util.trace_step("logout")
         Util.screenshot_page(page, f"success-o11y-widgets.png")
         po_auth.logout()
     except Exception as e:
@@ -1,5 +1,8 @@
 #  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
 
+import json
+
+from utils.auth_state import auth_state_cache
 from utils.color_logger import ColorLogger
 from utils.util import Util
 from utils.env import ENV
@@ -201,8 +204,7 @@ class PageObjectAuth:
 
         self.page.locator("#nav-bar-menu-list-subscriptions", has_text="Subscriptions").click()
         print("Clicked 'Subscriptions' left sidebar menu")
-        self.page.wait_for_timeout(200)
-        if self.page.locator(".subscription-card-header .name", has_text=host_prefix).is_visible():
+        if Util.wait_for_visible(self.page.locator(".subscription-card-header .name", has_text=host_prefix), 200):
             ColorLogger.success(f"Subscription for {email} with Host prefix: {host_prefix} is already created.")
         else:
             first_name = email.split("@")[0]
@@ -257,8 +259,7 @@ class PageObjectAuth:
                 return False
 
             print("Wait to see Welcome page...")
-            self.page.wait_for_timeout(500)
-            if self.page.locator(".title", has_text="Welcome").is_visible():
+            if Util.wait_for_visible(self.page.locator(".title", has_text="Welcome"), 500):
                 self.logout()
                 ColorLogger.success(f"Host prefix {host_prefix} is already exist.")
                 return True
@@ -277,8 +278,7 @@ class PageObjectAuth:
                 return False
 
             print("Wait to see Admin Welcome page...")
-            self.page.wait_for_timeout(500)
-            if self.page.locator(".pcp-page-title", has_text="Welcome").is_visible():
+            if Util.wait_for_visible(self.page.locator(".pcp-page-title", has_text="Welcome"), 500):
                 self.logout_admin_user()
                 return True
             else:
@@ -289,6 +289,8 @@ class PageObjectAuth:
             return False
 
     def login(self):
+        if self.restore_login():
+            return True
         ColorLogger.info(f"Navigating to login page {ENV.TP_AUTO_LOGIN_URL}...")
         self.page.goto(ENV.TP_AUTO_LOGIN_URL)
         print("Wait for login page is visible...")
@@ -316,10 +318,48 @@ class PageObjectAuth:
             ReportYaml.set(".ENV.REPORT_AUTO_ACTIVE_USER", True)
             ColorLogger.success("Login successful!")
             self.page.wait_for_timeout(1000)
+            self.save_login()
         else:
             ColorLogger.warning(f"Login may successful, but user profile is not visible.")
         return True
 
+    def restore_login(self):
+        state = auth_state_cache.get(ENV.TP_AUTO_LOGIN_URL, ENV.DP_USER_EMAIL)
+        if not state:
+            return False
+        ColorLogger.info(f"Restoring the saved session of user {ENV.DP_USER_EMAIL}...")
+        context = self.page.context
+        context.add_cookies(state.get("cookies", []))
+        for origin in state.get("origins", []):
+            # local storage can only be set by a page of the origin, existing items are not overwritten
+            context.add_init_script(script=f"""
+                if (location.origin === {json.dumps(origin["origin"])}) {{
+                    for (const {{ name, value }} of {json.dumps(origin.get("localStorage", []))}) {{
+                        if (localStorage.getItem(name) === null) localStorage.setItem(name, value);
+                    }}
+                }}
+            """)
+
+        # a valid session is redirected from the login page to the user home page
+        self.page.goto(ENV.TP_AUTO_LOGIN_URL)
+        user_profile = self.page.locator("#user-profile")
+        try:
+            user_profile.or_(self.page.locator("#ta-sign-in-button")).first.wait_for(state="visible", timeout=30000)
+        except Exception as e:
+            print(f"Saved session check did not finish: {e}")
+        if user_profile.is_visible():
+            ReportYaml.set(".ENV.REPORT_AUTO_ACTIVE_USER", True)
+            ColorLogger.success(f"Login successful with the saved session of user {ENV.DP_USER_EMAIL}.")
+            return True
+
+        print(f"The saved session of user {ENV.DP_USER_EMAIL} has expired, sign in again.")
+        auth_state_cache.remove(ENV.TP_AUTO_LOGIN_URL, ENV.DP_USER_EMAIL)
+        context.clear_cookies()
+        return False
+
+    def save_login(self):
+        auth_state_cache.save(ENV.TP_AUTO_LOGIN_URL, ENV.DP_USER_EMAIL, self.page.context.storage_state())
+
     def login_check(self):
         ColorLogger.info(f"Checking if user {ENV.DP_USER_EMAIL} is login...")
         try:
@@ -332,6 +372,11 @@ class PageObjectAuth:
             Util.exit_error(f"An error occurred while verify login in {ENV.TP_AUTO_LOGIN_URL}: {ENV.DP_USER_EMAIL}, {ENV.DP_USER_PASSWORD}", self.page, "login_check_e.png")
 
     def logout(self):
+        if auth_state_cache.is_enabled:
+            # signing out would end the saved session, the browser context is closed at the end of the case anyway
+            self.save_login()
+            ColorLogger.info(f"Keep the session of user {ENV.DP_USER_EMAIL} for the next login.")
+            return
         ColorLogger.info(f"Logging out user {ENV.DP_USER_EMAIL}...")
         self.page.locator("#nav-bar-menu-list-signout").click()
         self.page.locator(".nav-bar-display-block #confirm-button", has_text="Sign Out").wait_for(state="visible")
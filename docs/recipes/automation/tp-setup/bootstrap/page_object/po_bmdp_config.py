@@ -97,8 +97,9 @@ class PageObjectBMDPConfiguration(PageObjectDataPlane):
         if domain_row.is_visible():
             if Util.check_dom_visibility(self.page, domain_row.locator("td.pl-table__cell img[src*='/connected.svg']"), 10, max_retries):
                 ColorLogger.success(f"Domain '{domain_name}' is connected.")
-                ReportYaml.set_capability(ENV.TP_AUTO_K8S_BMDP_NAME, capability)
-                ReportYaml.set_capability_info(ENV.TP_AUTO_K8S_BMDP_NAME, capability, domain_name, "Connected")
+                with ReportYaml.transaction():
+                    ReportYaml.set_capability(ENV.TP_AUTO_K8S_BMDP_NAME, capability)
+                    ReportYaml.set_capability_info(ENV.TP_AUTO_K8S_BMDP_NAME, capability, domain_name, "Connected")
                 return
             Util.exit_error(f"Domain '{domain_name}' status is disconnected.", self.page, "check_domain_status.png")
         else:
@@ -158,8 +159,9 @@ class PageObjectBMDPConfiguration(PageObjectDataPlane):
         app_row = self.page.locator("tr.pl-table__row", has=self.page.locator('td.pl-table__cell', has_text=app_name))
         if Util.check_dom_visibility(self.page, app_row.locator("td.pl-table__cell img[src*='/running.svg']"), 2, 5):
             ColorLogger.success(f"'{app_type}':'{app_name}' in domain '{domain_name}' is running.")
-            ReportYaml.set_capability_app(ENV.TP_AUTO_K8S_BMDP_NAME, "BW6", f"{app_name}")
-            ReportYaml.set_capability_app_info(ENV.TP_AUTO_K8S_BMDP_NAME, "BW6", f"{app_name}", "Status", "Running")
+            with ReportYaml.transaction():
+                ReportYaml.set_capability_app(ENV.TP_AUTO_K8S_BMDP_NAME, "BW6", f"{app_name}")
+                ReportYaml.set_capability_app_info(ENV.TP_AUTO_K8S_BMDP_NAME, "BW6", f"{app_name}", "Status", "Running")
         else:
             Util.exit_error(f"'{app_name}' in domain '{domain_name}' instance is not running.", self.page, "check_bw6_app_status_by_app_name.png")
 
@@ -256,8 +258,9 @@ class PageObjectBMDPConfiguration(PageObjectDataPlane):
         if ems_server_row.is_visible():
             if ems_health_svg and "serverGroupTable_healthIcon" in ems_health_svg:
                 ColorLogger.success(f"EMS Server '{server_group_name}' is connected.")
-                ReportYaml.set_capability(ENV.TP_AUTO_K8S_BMDP_NAME, "EMSServer")
-                ReportYaml.set_capability_info(ENV.TP_AUTO_K8S_BMDP_NAME, "EMSServer", server_group_name, "Connected")
+                with ReportYaml.transaction():
+                    ReportYaml.set_capability(ENV.TP_AUTO_K8S_BMDP_NAME, "EMSServer")
+                    ReportYaml.set_capability_info(ENV.TP_AUTO_K8S_BMDP_NAME, "EMSServer", server_group_name, "Connected")
                 return
             ColorLogger.warning(f"EMS Server '{server_group_name}' is not connected.")
         else:
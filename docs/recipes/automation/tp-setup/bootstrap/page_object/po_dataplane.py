@@ -115,8 +115,7 @@ class PageObjectDataPlane(PageObjectGlobal):
         try:
             print(f"Checking if '{capability}' is already provisioned...")
             card_id = capability.lower()
-            self.page.wait_for_timeout(3000)
-            if self.page.locator(f"capability-card #{card_id}").is_visible():
+            if Util.wait_for_visible(self.page.locator(f"capability-card #{card_id}"), 3000):
                 ColorLogger.success(f"'{capability}' is already provisioned.")
                 if capability_name == "":
                     return True
@@ -139,8 +138,7 @@ class PageObjectDataPlane(PageObjectGlobal):
         try:
             print(f"Checking if {capability} app '{app_name}' is already created...")
             self.page.locator("apps-list").wait_for(state="visible")
-            self.page.wait_for_timeout(3000)
-            if self.page.locator("#app-list-table tr.pl-table__row td.app-name", has_text=app_name).is_visible():
+            if Util.wait_for_visible(self.page.locator("#app-list-table tr.pl-table__row td.app-name", has_text=app_name), 3000):
                 ColorLogger.success(f"{capability} app '{app_name}' is already created.")
                 return True
             else:
@@ -155,8 +153,7 @@ class PageObjectDataPlane(PageObjectGlobal):
         try:
             self.goto_dataplane(dp_name)
             print(f"Checking if {capability} app '{app_name}' is already running...")
-            self.page.wait_for_timeout(3000)
-            if self.page.locator(f"#app-list-table tr.{capability.upper()}", has=self.page.locator("td.app-name", has_text=app_name)).locator("td", has_text="Running").is_visible():
+            if Util.wait_for_visible(self.page.locator(f"#app-list-table tr.{capability.upper()}", has=self.page.locator("td.app-name", has_text=app_name)).locator("td", has_text="Running"), 3000):
                 ColorLogger.success(f"{capability} app '{app_name}' is already running.")
                 ReportYaml.set_capability_app_info(dp_name, capability, app_name, "status", "Running")
                 return True
@@ -280,8 +277,7 @@ class PageObjectDataPlane(PageObjectGlobal):
         # step Preview (for 1.4 and above)
         if Util.check_dom_visibility(self.page, self.page.locator(".pl-secondarynav a.is-active", has_text="Preview"), 3, 9):
             print("Step 4: 'Preview' page is loaded")
-            self.page.wait_for_timeout(1000)
-            if self.page.locator("#data-plane-preview-btn").is_visible():
+            if Util.wait_for_visible(self.page.locator("#data-plane-preview-btn"), 1000):
                 self.page.click("#data-plane-preview-btn")
                 print("Clicked Next button, Finish step 4 Preview")
 
@@ -423,8 +419,7 @@ class PageObjectDataPlane(PageObjectGlobal):
         # step 6 Preview (for 1.4 and above)
         if Util.check_dom_visibility(self.page, self.page.locator(".pl-secondarynav a.is-active", has_text="Preview"), 3, 9):
             print("'Preview' page is loaded")
-            self.page.wait_for_timeout(1000)
-            if self.page.locator("#data-plane-preview-create-btn").is_visible():
+            if Util.wait_for_visible(self.page.locator("#data-plane-preview-create-btn"), 1000):
                 self.page.click("#data-plane-preview-create-btn")
                 print("Clicked Next button, Finish Preview")
             elif self.page.locator("#data-plane-config-prev-btn").is_visible():
@@ -507,8 +502,9 @@ class PageObjectDataPlane(PageObjectGlobal):
             Util.exit_error(f"Data Plane '{dp_name}' is not ready.", self.page, "dp_config_bmdp_status.png")
 
         ColorLogger.success(f"Data Plane '{dp_name}' is ready.")
-        ReportYaml.set_dataplane(dp_name)
-        ReportYaml.set_dataplane_info(dp_name, "status", "Running successfully")
+        with ReportYaml.transaction():
+            ReportYaml.set_dataplane(dp_name)
+            ReportYaml.set_dataplane_info(dp_name, "status", "Running successfully")
 
     def k8s_wait_tunnel_connected(self, dp_name, is_update_report=True):
         print(f"Waiting for Data Planes {dp_name} tunnel connected.")
@@ -258,8 +258,9 @@ class PageObjectDataPlaneBWCE(PageObjectDataPlane):
 
         if is_app_build_created:
             ColorLogger.success(f"{self.capability_upper} app build {app_name} is already created.")
-            ReportYaml.set_capability(dp_name, self.capability)
-            ReportYaml.set_capability_info(dp_name, self.capability, "appBuild", True)
+            with ReportYaml.transaction():
+                ReportYaml.set_capability(dp_name, self.capability)
+                ReportYaml.set_capability_info(dp_name, self.capability, "appBuild", True)
             return
 
         print(f"Start Create {self.capability_upper} app build...")
@@ -342,8 +343,7 @@ class PageObjectDataPlaneBWCE(PageObjectDataPlane):
         print(f"App Resource Configuration' page loaded")
         self.page.locator("#nameSpace input").click()
         print(f"Clicked 'Namespace' dropdown, and waiting for namespace: {ENV.TP_AUTO_K8S_DP_NAMESPACE}")
-        self.page.wait_for_timeout(1000)
-        if not self.page.locator("#nameSpace .pl-select-menu li", has_text=ENV.TP_AUTO_K8S_DP_NAMESPACE).is_visible():
+        if not Util.wait_for_visible(self.page.locator("#nameSpace .pl-select-menu li", has_text=ENV.TP_AUTO_K8S_DP_NAMESPACE), 1000):
             Util.exit_error(f"Namespace '{ENV.TP_AUTO_K8S_DP_NAMESPACE}' is not list in the dropdown.", self.page, f"{self.capability}_app_build_and_deploy.png")
 
         self.page.locator("#nameSpace .pl-select-menu li", has_text=ENV.TP_AUTO_K8S_DP_NAMESPACE).click()
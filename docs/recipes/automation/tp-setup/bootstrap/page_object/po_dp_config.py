@@ -299,8 +299,7 @@ class PageObjectDataPlaneConfiguration(PageObjectDataPlane):
         self.page.locator("#resources-menu-item .menu-item-text", has_text="Resources").click()
         print("Clicked 'Resources' left side menu")
         print(f"Resource Name: {resource_name}")
-        self.page.wait_for_timeout(5000)
-        if self.page.locator("#storage-resource-table tr td:first-child", has_text=resource_name).is_visible():
+        if Util.wait_for_visible(self.page.locator("#storage-resource-table tr td:first-child", has_text=resource_name), 5000):
             ColorLogger.success(f"Storage '{resource_name}' is already created.")
             ReportYaml.set_dataplane_info(ENV.TP_AUTO_K8S_DP_NAME, "storage", True)
         else:
@@ -211,8 +211,9 @@ class PageObjectDataPlaneFlogo(PageObjectDataPlane):
     
         if is_app_build_created:
             ColorLogger.success(f"Flogo app build {app_name} is already created.")
-            ReportYaml.set_capability(dp_name, capability)
-            ReportYaml.set_capability_info(dp_name, capability, "appBuild", True)
+            with ReportYaml.transaction():
+                ReportYaml.set_capability(dp_name, capability)
+                ReportYaml.set_capability_info(dp_name, capability, "appBuild", True)
             return
     
         print("Start Create Flogo app build...")
@@ -327,8 +328,7 @@ class PageObjectDataPlaneFlogo(PageObjectDataPlane):
     def flogo_app_build_and_deploy_select_namespace(self):
         self.page.locator("flogo-namespace-picker input").click()
         print(f"Clicked 'Namespace' dropdown, and waiting for namespace: {ENV.TP_AUTO_K8S_DP_NAMESPACE}")
-        self.page.wait_for_timeout(1000)
-        if not self.page.locator("flogo-namespace-picker .namespace-dropdown li", has_text=ENV.TP_AUTO_K8S_DP_NAMESPACE).is_visible():
+        if not Util.wait_for_visible(self.page.locator("flogo-namespace-picker .namespace-dropdown li", has_text=ENV.TP_AUTO_K8S_DP_NAMESPACE), 1000):
             Util.exit_error(f"Namespace '{ENV.TP_AUTO_K8S_DP_NAMESPACE}' is not list in the dropdown.", self.page, "flogo_app_build_and_deploy.png")
     
         self.page.locator("flogo-namespace-picker .namespace-dropdown li", has_text=ENV.TP_AUTO_K8S_DP_NAMESPACE).click()
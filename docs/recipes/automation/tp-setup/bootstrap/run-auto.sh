@@ -18,4 +18,9 @@ fi
 export TP_AUTO_TASK_FROM_LOCAL_SOURCE=${TP_AUTO_TASK_FROM_LOCAL_SOURCE:-""}
 export TP_AUTO_KUBECONFIG=${TP_AUTO_KUBECONFIG:-""}
 
-uv run -m waitress --host=0.0.0.0 --port=3120 server:app
+# TP_AUTO_SERVER_MODE=asgi serves the streaming routes on an asyncio event loop (uvicorn) instead of waitress threads
+if [[ "${TP_AUTO_SERVER_MODE}" == "asgi" ]]; then
+  uv run -m uvicorn --host=0.0.0.0 --port=3120 server_asgi:app
+else
+  uv run -m waitress --host=0.0.0.0 --port=3120 server:app
+fi
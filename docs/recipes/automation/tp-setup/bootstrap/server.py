@@ -1,25 +1,84 @@
 #  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
 
+import atexit
+import json
 import subprocess
 import sys
 import os
 import time
 import shutil
-import uuid
+import signal
+import threading
+from urllib.parse import unquote
 from flask_cors import CORS
 from flask import Flask, render_template, Response, request, jsonify, stream_with_context
-from typing import Dict
 
+from utils.browser_server import TP_AUTO_BROWSER_HEALTH_INTERVAL, TP_AUTO_BROWSER_SERVER, BrowserServer, BrowserServerPool
+from utils.discovery_cache import discovery_cache
+from utils.dns_cache import dns_cache
+from utils.env import DEFAULT_CP_DNS_DOMAIN, EnvConfig
+from utils.helper import Helper
+from utils.job_history import JobHistory, parse_time, redact_params
+from utils.job_scheduler import Job, JobScheduler
+from utils.job_workspace import JobWorkspace
+from utils.output_stream import GzipStream, accepts_gzip, read_pipe_lines
+from utils.process_tree import ProcessTree
+from utils.report_database import open_report_store
+from utils.report_document import is_sidecar
+from utils.report_watch import ReportWatcher
+from utils.snapshot_cache import SnapshotCache
 from utils.streaming_runner import StreamingRunner
 from utils.tibcop_cli import TibcopCliHandler
+from utils.upload_store import UploadStore
 from utils.util import Util
+from utils.warm_pool import WarmPool
 
 app = Flask(__name__, template_folder="templates")
 HEADER_ONE_CLICK_JOB_ID = "one_click_job_id"
 CORS(app, expose_headers=[HEADER_ONE_CLICK_JOB_ID])
 app.config['TEMPLATES_AUTO_RELOAD'] = True
 
-running_processes: Dict[str, subprocess.Popen] = {}
+# max number of automation cases running at the same time, other jobs wait in the FIFO queue
+TP_AUTO_MAX_CONCURRENT_JOBS = int(os.environ.get("TP_AUTO_MAX_CONCURRENT_JOBS") or 2)
+# interval in seconds to report queue position to the client while a job is waiting
+TP_AUTO_QUEUE_STATUS_INTERVAL = 10
+# max number of output lines kept in memory per job for replay (Last-Event-ID)
+TP_AUTO_JOB_LOG_MAX_LINES = int(os.environ.get("TP_AUTO_JOB_LOG_MAX_LINES") or 20000)
+# interval in seconds to send keep-alive to streaming clients when there is no output
+TP_AUTO_SSE_KEEPALIVE_INTERVAL = 15
+# streamed output is sent in batches, lines arriving within the interval are sent together up to the size (characters)
+TP_AUTO_STREAM_FLUSH_INTERVAL = 0.2
+TP_AUTO_STREAM_FLUSH_SIZE = 64 * 1024
+# gzip streamed output if the client accepts it
+TP_AUTO_STREAM_GZIP = os.environ.get("TP_AUTO_STREAM_GZIP", "true").lower() == "true"
+scheduler = JobScheduler(TP_AUTO_MAX_CONCURRENT_JOBS)
+# persistent history of jobs, queried by GET /jobs
+TP_AUTO_JOB_HISTORY_FILE = os.environ.get("TP_AUTO_JOB_HISTORY_FILE") or os.path.join(os.getcwd(), "history", "jobs.db")
+job_history = JobHistory(TP_AUTO_JOB_HISTORY_FILE)
+# canonical report folder, the workspaces of finished jobs are published into it
+REPORT_FOLDER = os.path.join(os.getcwd(), "report")
+REPORT_YAML_FILE = os.path.join(REPORT_FOLDER, "report.yaml")
+report_store = open_report_store(REPORT_YAML_FILE)
+# private report folders of running jobs
+JOB_WORKSPACE_PATH = os.path.join(os.getcwd(), "workspace")
+# max seconds a client can wait for report changes in one GET /report/changes request
+TP_AUTO_REPORT_POLL_MAX_TIMEOUT = 60
+# a /report/events stream holds a waitress thread, it ends after this number of keep-alives and the client reconnects
+# with the Last-Event-ID (not in ASGI mode, the streams of server_asgi.py do not hold threads)
+TP_AUTO_REPORT_EVENTS_MAX_KEEPALIVES = int(os.environ.get("TP_AUTO_REPORT_EVENTS_MAX_KEEPALIVES") or 4)
+# uploaded app files, stored by content hash
+upload_store = UploadStore('upload')
+# interval in seconds to sample memory and cpu usage of the processes of a running job
+TP_AUTO_RESOURCE_SAMPLE_INTERVAL = 2
+# fork cases from a pre-imported zygote process instead of starting a new interpreter for every job
+TP_AUTO_WARM_POOL = os.environ.get("TP_AUTO_WARM_POOL", "true").lower() == "true"
+warm_pool = WarmPool() if TP_AUTO_WARM_POOL and WarmPool.is_supported() else None
+if warm_pool is not None:
+    warm_pool.start()
+# browsers shared by the jobs, one for each set of launch options, jobs launch their own browser until it is ready
+browser_servers = BrowserServerPool(TP_AUTO_BROWSER_HEALTH_INTERVAL) if TP_AUTO_BROWSER_SERVER else None
+if browser_servers is not None:
+    atexit.register(browser_servers.stop)
 
 def set_env_vars_from_request(request_args, include_system_env=True):
     # Set request parameters as environment variables
@@ -44,6 +103,41 @@ def set_env_vars_from_request(request_args, include_system_env=True):
             print(f"{key} = {value}")
     return env_vars
 
+def get_job_browser_launch_options(env_vars):
+    """ Launch options of the browser of a job, from the cached DNS domain and address: no discovery or DNS lookup here,
+    the first job of a cluster resolves them and launches its own browser """
+    dns_domain = env_vars.get("TP_AUTO_CP_DNS_DOMAIN") or discovery_cache.get("cpDnsDomain") or DEFAULT_CP_DNS_DOMAIN
+    return BrowserServer.get_launch_options(Helper.is_headless(env_vars), dns_domain, dns_cache.get(dns_domain))
+
+def get_case_env_vars(env_vars):
+    """ Environment of a case process, with the endpoint of the shared browser """
+    if browser_servers is None:
+        return env_vars
+    return {**env_vars, **browser_servers.get_job_env(get_job_browser_launch_options(env_vars))}
+
+if browser_servers is not None:
+    # the browser of the jobs run with the environment of the server starts with the server
+    browser_servers.get_job_env(get_job_browser_launch_options(os.environ))
+
+def start_case_process(auto_case, env_vars):
+    env_vars = get_case_env_vars(env_vars)
+    if warm_pool is not None:
+        try:
+            print(f"[INFO] Fork {auto_case} from warm pool")
+            return warm_pool.spawn(auto_case, env_vars)
+        except Exception as e:
+            print(f"[WARNING] Warm pool is not available, start a new interpreter: {e}")
+
+    # Start the script using unbuffered output
+    print(f'{sys.executable}, "-u", "-m", {auto_case}')
+    return subprocess.Popen(
+        [sys.executable, "-u", "-m", auto_case],  # `-u` ensures unbuffered output
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        env=env_vars,
+        start_new_session=True  # own process group, so the job can be stopped with all its processes
+    )
+
 @app.route('/')
 def home():
     """ Render the main HTML page """
@@ -53,89 +147,427 @@ def home():
 def stop_script():
     """ Stop the currently running script """
     job_id = request.args.get("jobId")
-    process = running_processes.get(job_id)
+    job = scheduler.get_job(job_id)
+    if job and scheduler.cancel(job):
+        print(f"[INFO] Removed job {job_id} from queue")
+        return jsonify({"status": "stopped", "message": "Queued job cancelled successfully"})
+    if job and job.state == "running":
+        # run_job checks it before and after the process starts
+        job.stop_requested = True
+
+    process = job.process if job else None
     if process and process.poll() is None:  # Ensure the process is assigned
-        print(f"[INFO] Stopping process (PID: {process.pid})...")
-        process.terminate()  # Try to terminate gracefully
+        print(f"[INFO] Stopping job {job_id} (PID: {process.pid})...")
+        job.process_tree.send_signal(signal.SIGTERM)  # Try to terminate gracefully
         try:
             process.wait(timeout=2)  # Wait up to 2 seconds
         except subprocess.TimeoutExpired:
-            process.kill()  # Force kill if termination fails
-        running_processes.pop(job_id, None)
+            job.process_tree.send_signal(signal.SIGKILL)  # Force kill if termination fails
         return jsonify({"status": "stopped", "message": "Process terminated successfully"})
+    if job and job.stop_requested and process is None:
+        print(f"[INFO] Stopping job {job_id} before its process starts")
+        return jsonify({"status": "stopped", "message": "Job stopped before its process started"})
 
     return jsonify({"status": "no_process", "message": "No process running"})
 
+def clean_report(is_clean_report):
+    """ Empty report.yaml and remove report.txt/json, or every other file of the report folder if is_clean_report """
+    if report_store.read().fields:
+        # an update instead of removing the file, so the version keeps counting and report watchers see it
+        def reset(model):
+            model.load_dict({})
+            return True
+        report_store.update(reset, {"op": "clean", "key": "."})
+        report_store.export()
+        print(f"Cleaned {REPORT_YAML_FILE}")
+    if not os.path.isdir(REPORT_FOLDER):
+        return
+
+    report_yaml_file = os.path.basename(REPORT_YAML_FILE)
+    for entry in os.scandir(REPORT_FOLDER):
+        if entry.name == report_yaml_file or is_sidecar(entry.name, report_yaml_file):
+            continue
+        if not is_clean_report and entry.name not in ("report.txt", "report.json"):
+            continue
+        if entry.is_dir():
+            shutil.rmtree(entry.path)
+        else:
+            os.remove(entry.path)
+        print(f"Removed {entry.path}")
+
+def create_gui_job(request_args):
+    """ Clean the report and queue a job for the requested case with its own report workspace """
+    auto_case = request_args.get('case')
+    clean_report(request_args.get('IS_CLEAN_REPORT') == "true")
+
+    # Set request parameters as environment variables
+    env_vars = set_env_vars_from_request(request_args)
+
+    params = redact_params({key: value for key, value in request_args.items() if key != "case"})
+    job = Job(auto_case, env_vars, max_log_lines=TP_AUTO_JOB_LOG_MAX_LINES, params=params)
+    env_vars["TP_AUTO_JOB_ID"] = job.id
+    # every job writes to its own report folder, it is published to the report folder when the job ends
+    workspace = JobWorkspace(job.id, REPORT_FOLDER, JOB_WORKSPACE_PATH)
+    env_vars["TP_AUTO_REPORT_PATH"] = workspace.create()
+
+    scheduler.submit(job)
+    job_history.record(job)
+    return job, workspace
+
+def start_gui_job(request_args):
+    job, workspace = create_gui_job(request_args)
+    threading.Thread(target=run_job, args=(job, workspace), name=f"job-{job.id}", daemon=True).start()
+    return job
+
+def log_queue_status(job):
+    job.log.append(f"[INFO] Job {job.id} is waiting in queue, position {scheduler.get_position(job)}, "
+                   f"data plane '{job.dp_name}', waited {job.wait_seconds:.0f} seconds")
+
+def log_job_start(job):
+    """ Return False if the job has been cancelled while waiting in queue """
+    if job.state == "cancelled":
+        job.log.append(f"[INFO] Job {job.id} is cancelled before start")
+        return False
+    if job.stop_requested:
+        job.log.append(f"[INFO] Job {job.id} is stopped before start")
+        return False
+    if job.wait_seconds >= 1:
+        job.log.append(f"[INFO] Job {job.id} started after waiting {job.wait_seconds:.0f} seconds in queue")
+    return True
+
+def start_process_tree(job, process):
+    job.process_tree = ProcessTree(process.pid, f"TP_AUTO_JOB_ID={job.id}")
+    job.process_tree.sample()
+
+def stop_if_requested(job):
+    """ Stop the process of a job which has been stopped while its process was starting, call it after job.process is set """
+    if job.stop_requested:
+        job.log.append(f"[INFO] Job {job.id} is stopped while starting")
+        job.process_tree.send_signal(signal.SIGTERM)
+
+def finish_job(job, workspace, is_started):
+    if job.process_tree is not None:
+        # processes left behind by the case, for example a browser which has not been closed
+        leftover = job.process_tree.send_signal(signal.SIGKILL)
+        if leftover:
+            job.log.append(f"[INFO] Killed {len(leftover)} leftover processes of job {job.id}")
+    if is_started:
+        job.steps["case"] = job.run_seconds
+        publish_start = time.time()
+        try:
+            workspace.publish()
+        except Exception as e:
+            job.log.append(f"[ERROR] Failed to publish report of job {job.id}: {e}")
+        job.steps["publish"] = time.time() - publish_start
+    if is_started:
+        state = "finished" if job.returncode == 0 else "failed"
+    else:
+        state = "cancelled" if job.stop_requested else "failed"
+    # the report change readers only open the workspace of a running job
+    scheduler.finish(job, state)
+    close_job_report_store(job)
+    workspace.remove()
+    job.log.close()
+    job_history.record(job)
+
+def run_job(job, workspace):
+    """ Wait for a free slot, run the case and write its output to the job log """
+    process = None
+    try:
+        # Wait for a free slot, jobs on the same data plane run one by one
+        while not scheduler.wait_for_slot(job, TP_AUTO_QUEUE_STATUS_INTERVAL):
+            log_queue_status(job)
+        if not log_job_start(job):
+            return
+
+        process = start_case_process(job.case, job.env_vars)
+        start_process_tree(job, process)
+        job.process = process
+        stop_if_requested(job)
+        job.process_tree.start_sampling(TP_AUTO_RESOURCE_SAMPLE_INTERVAL, lambda: job.returncode is None)
+
+        # Read output in large chunks, the job keeps running even if no client is connected
+        for lines in read_pipe_lines(process.stdout, lambda: process.poll() is None):
+            job.log.extend(lines)
+
+    except Exception as e:
+        print(f"[ERROR] Exception in run_job(): {e}")
+
+    finally:
+        if process:
+            process.stdout.close()
+            job.returncode = process.wait()
+        finish_job(job, workspace, process is not None)
+
+def get_last_event_id(headers, args):
+    last_event_id = headers.get("Last-Event-ID") or args.get("lastEventId") or "0"
+    return int(last_event_id) if last_event_id.isdigit() else 0
+
+def format_job_event(seq, line):
+    return f"id: {seq}\ndata: {line}\n\n"
+
+def format_job_end_event(job):
+    return f"event: end\ndata: {json.dumps(job.to_dict())}\n\n"
+
+def format_job_truncated_event(job, last_event_id):
+    """ Tell the client which lines are lost, when they have been dropped from the job log """
+    first_seq = job.log.first_seq
+    return f"event: truncated\ndata: {first_seq}\n\n" if last_event_id + 1 < first_seq else ""
+
+def read_job_log(job, seq):
+    """ Wait for the next batch of job output after seq, return (lines, closed) """
+    lines, closed = job.log.read(seq, TP_AUTO_SSE_KEEPALIVE_INTERVAL)
+    size = sum(len(line) for _, line in lines)
+    deadline = time.monotonic() + TP_AUTO_STREAM_FLUSH_INTERVAL
+    while lines and not closed and size < TP_AUTO_STREAM_FLUSH_SIZE and time.monotonic() < deadline:
+        more, closed = job.log.read(lines[-1][0], deadline - time.monotonic())
+        lines += more
+        size += sum(len(line) for _, line in more)
+    return lines, closed
+
+def encode_stream(chunks, headers, accept_encoding):
+    """ Gzip the stream if the client accepts it, headers are updated """
+    if not TP_AUTO_STREAM_GZIP or not accepts_gzip(accept_encoding):
+        return chunks
+    headers.update({"Content-Encoding": "gzip", "Vary": "Accept-Encoding"})
+    def compress():
+        gzip_stream = GzipStream()
+        for chunk in chunks:
+            yield gzip_stream.compress(chunk)
+        yield gzip_stream.close()
+    return compress()
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+def get_job_report_yaml_file(job):
+    return os.path.join(JOB_WORKSPACE_PATH, job.id, os.path.basename(REPORT_YAML_FILE))
+
+def get_watched_reports():
+    """ The canonical report and the workspace reports of the running jobs """
+    return [REPORT_YAML_FILE, *(get_job_report_yaml_file(job) for job in scheduler.get_running_jobs())]
+
+report_watcher = ReportWatcher(get_watched_reports)
+# report stores of the workspaces of running jobs, opened once per job by the report change readers
+job_report_stores = {}
+job_report_stores_lock = threading.Lock()
+
+def read_job_report_changes(job, after_version):
+    """ Changes written to the workspace report of a running job after the version, [] once the job has ended """
+    # the journal is read with the lock held, so the store is not closed during the read
+    with job_report_stores_lock:
+        if job.state != "running":
+            return []
+        store = job_report_stores.get(job.id)
+        if store is None:
+            store = job_report_stores[job.id] = open_report_store(get_job_report_yaml_file(job))
+        changes, _ = store.read_journal(after_version)
+    return changes
+
+def close_job_report_store(job):
+    with job_report_stores_lock:
+        store = job_report_stores.pop(job.id, None)
+        if store is not None:
+            store.close()
+
+def get_report_event_id(headers, args):
+    """ Report version the client has already seen, None for a new client """
+    last_event_id = headers.get("Last-Event-ID") or args.get("lastEventId") or args.get("after") or ""
+    return int(last_event_id) if last_event_id.isdigit() else None
+
+def read_report_changes(after_version, job_versions):
+    """
+    Changes of the canonical report after the version, the whole report if some of them are no longer in the journal.
+    jobChanges are the changes written to the workspaces of running jobs after the versions in job_versions
+    (job id: version), they are in the canonical report after the job has been published.
+    """
+    os.makedirs(REPORT_FOLDER, exist_ok=True)
+    changes, is_complete = report_store.read_journal(after_version) if after_version is not None else ([], False)
+    if is_complete:
+        result = {"version": changes[-1]["version"] if changes else after_version, "complete": True, "changes": changes}
+    else:
+        version, report = report_store.snapshot()
+        result = {"version": version, "complete": False, "changes": [], "report": report}
+
+    result["jobChanges"], result["jobs"] = [], {}
+    for job in scheduler.get_running_jobs():
+        job_changes = read_job_report_changes(job, job_versions.get(job.id, 0))
+        result["jobChanges"] += job_changes
+        result["jobs"][job.id] = job_changes[-1]["version"] if job_changes else job_versions.get(job.id, 0)
+    return result
+
+def has_report_changes(result):
+    return not result["complete"] or result["changes"] or result["jobChanges"]
+
+def format_report_events(result):
+    """ snapshot and change events carry the report version as id, job-change events are sent again on reconnect """
+    if result["complete"]:
+        events = [format_report_event("change", change, change["version"]) for change in result["changes"]]
+    else:
+        events = [format_report_event("snapshot", {"version": result["version"], "report": result["report"]}, result["version"])]
+    events += [format_report_event("job-change", change) for change in result["jobChanges"]]
+    return ''.join(events)
+
+def format_report_event(event, data, event_id=None):
+    event_id = "" if event_id is None else f"id: {event_id}\n"
+    return f"event: {event}\n{event_id}data: {json.dumps(data, default=str)}\n\n"
+
+def parse_job_versions(values):
+    """ job=<job id>:<version> query parameters of a report change client """
+    job_versions = {}
+    for value in values:
+        job_id, _, version = value.rpartition(":")
+        job_versions[job_id] = int(version)
+    return job_versions
+
 @app.route('/run-gui-script')
 def run_gui_script():
     """ Execute a Python script and stream real-time output """
     # case is from query parameter
-    auto_case = request.args.get('case')
-    is_clean_report = request.args.get('IS_CLEAN_REPORT')
-    if not auto_case:
+    if not request.args.get('case'):
         return "Error: Missing 'case' parameter", 400
 
-    report_folder = os.path.join(os.getcwd(), "report")
-    if is_clean_report == "true":
-        if os.path.exists(report_folder) and os.path.isdir(report_folder):
-            shutil.rmtree(report_folder)
-            print(f"Removed {report_folder}")
-    else:
-        report_yaml_file = os.path.join(report_folder, "report.yaml")
-        report_txt_file = os.path.join(report_folder, "report.txt")
-        if os.path.exists(report_yaml_file):
-            os.remove(report_yaml_file)
-            print(f"Removed {report_yaml_file}")
-        if os.path.exists(report_txt_file):
-            os.remove(report_txt_file)
-            print(f"Removed {report_txt_file}")
+    job = start_gui_job(request.args)
+    def generate():
+        # Stream the job log, the job is not stopped if the client disconnects
+        yield '<pre>\n'
+        seq, closed = 0, False
+        while not closed:
+            lines, closed = read_job_log(job, seq)
+            if lines:
+                seq = lines[-1][0]
+                yield ''.join(line + '\n' for _, line in lines)
+        yield '</pre>\n'
 
-    # Set request parameters as environment variables
-    env_vars = set_env_vars_from_request(request.args)
+    headers = {
+        HEADER_ONE_CLICK_JOB_ID: job.id
+    }
+    stream = encode_stream(generate(), headers, request.headers.get("Accept-Encoding"))
+    return Response(stream, headers=headers, content_type='text/html; charset=utf-8')
 
-    job_id = str(uuid.uuid4())
-    def generate():
-        # Start the script using unbuffered output
-        print(f'{sys.executable}, "-u", "-m", {auto_case}')
-        process = subprocess.Popen(
-            [sys.executable, "-u", "-m", auto_case],  # `-u` ensures unbuffered output
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            env=env_vars
-        )
-        running_processes[job_id] = process
-
-        # Stream output line by line
-        try:
-            yield '<pre>\n'
-            for line in iter(lambda: process.stdout.readline() if process and process.poll() is None else None, None):
-                if line and line.strip():
-                    yield Util.clean_ansi_escape(line) + '\n'
-            yield '</pre>\n'
+@app.route('/jobs', methods=['POST'])
+def submit_job():
+    """ Start a GUI case in the background, output can be read from /jobs/<job_id>/events """
+    if not request.args.get('case'):
+        return jsonify({"message": "Missing 'case' parameter"}), 400
 
-        except Exception as e:
-            print(f"[ERROR] Exception in generate(): {e}")
+    job = start_gui_job(request.args)
+    return jsonify({"jobId": job.id, "eventsUrl": f"/jobs/{job.id}/events"}), 202, {HEADER_ONE_CLICK_JOB_ID: job.id}
+
+@app.route('/jobs/<job_id>/events')
+def job_events(job_id):
+    """ Stream job output as Server-Sent Events, resume after the Last-Event-ID header """
+    job = scheduler.get_job(job_id)
+    if job is None:
+        return jsonify({"message": f"Job {job_id} not found"}), 404
 
-        finally:
-            if process:
-                process.stdout.close()
-                process.wait()
-            running_processes.pop(job_id, None)
+    last_event_id = get_last_event_id(request.headers, request.args)
+    def generate():
+        yield "retry: 3000\n\n" + format_job_truncated_event(job, last_event_id)
+        seq, closed = last_event_id, False
+        while not closed:
+            lines, closed = read_job_log(job, seq)
+            if lines:
+                seq = lines[-1][0]
+                yield ''.join(format_job_event(*line) for line in lines)
+            elif not closed:
+                yield ": keep-alive\n\n"
+        yield format_job_end_event(job)
 
     headers = {
-        HEADER_ONE_CLICK_JOB_ID: job_id
+        **SSE_HEADERS,
+        HEADER_ONE_CLICK_JOB_ID: job.id
     }
-    return Response(generate(), headers=headers, content_type='text/html; charset=utf-8')
+    stream = encode_stream(generate(), headers, request.headers.get("Accept-Encoding"))
+    return Response(stream, headers=headers, content_type='text/event-stream; charset=utf-8')
 
-@app.route('/run-cli-script')
-def run_cli_script():
-    auto_case = request.args.get('case')
-    dp_name = request.args.get('TIBCOP_CLI_DP_NAME')
-    other_args = request.args.get('TIBCOP_CLI_OTHER_ARGS')
-    if not auto_case:
-        return "Missing 'case' parameter", 400
+@app.route('/report/events')
+def report_events():
+    """ Stream report changes as Server-Sent Events, a snapshot first and changes after the Last-Event-ID (version) """
+    version = get_report_event_id(request.headers, request.args)
+    def generate():
+        yield "retry: 3000\n\n"
+        after_version, job_versions = version, {}
+        keepalive_count = 0
+        while True:
+            # the sequence is taken before reading, a change during the read wakes up the wait
+            sequence = report_watcher.sequence
+            result = read_report_changes(after_version, job_versions)
+            after_version, job_versions = result["version"], result["jobs"]
+            if has_report_changes(result):
+                yield format_report_events(result)
+            if report_watcher.wait(sequence, TP_AUTO_SSE_KEEPALIVE_INTERVAL) == sequence:
+                keepalive_count += 1
+                if keepalive_count >= TP_AUTO_REPORT_EVENTS_MAX_KEEPALIVES:
+                    # free the thread, EventSource reconnects after the retry time with the Last-Event-ID
+                    return
+                yield ": keep-alive\n\n"
+
+    headers = {**SSE_HEADERS}
+    stream = encode_stream(generate(), headers, request.headers.get("Accept-Encoding"))
+    return Response(stream, headers=headers, content_type='text/event-stream; charset=utf-8')
 
-    env_vars = set_env_vars_from_request(request.args, False)
+@app.route('/report/changes')
+def report_changes():
+    """ Long poll report changes: /report/changes?after=<version>&job=<job id>:<version>&timeout=<seconds> """
+    try:
+        version = get_report_event_id(request.headers, request.args)
+        job_versions = parse_job_versions(request.args.getlist("job"))
+        timeout = min(float(request.args.get("timeout") or 0), TP_AUTO_REPORT_POLL_MAX_TIMEOUT)
+    except ValueError as e:
+        return jsonify({"message": f"Invalid parameter: {e}"}), 400
+
+    deadline = time.monotonic() + timeout
+    sequence = report_watcher.sequence
+    result = read_report_changes(version, job_versions)
+    while not has_report_changes(result) and time.monotonic() < deadline:
+        sequence = report_watcher.wait(sequence, deadline - time.monotonic())
+        result = read_report_changes(version, job_versions)
+    return jsonify(result)
+
+@app.route('/jobs', methods=['GET'])
+def list_jobs():
+    """ Query the job history: /jobs?case=&dp=&state=&since=&until=&limit=, with p50/p95 of the finished jobs """
+    try:
+        since = parse_time(request.args.get("since"))
+        until = parse_time(request.args.get("until"))
+        limit = int(request.args.get("limit") or 100)
+    except ValueError as e:
+        return jsonify({"message": f"Invalid parameter: {e}"}), 400
+    return jsonify(job_history.query(
+        case=request.args.get("case"),
+        dp_name=request.args.get("dp"),
+        state=request.args.get("state"),
+        since=since,
+        until=until,
+        limit=limit
+    ))
+
+@app.route('/jobs/<job_id>')
+def get_job(job_id):
+    """ Show state, timing and resource usage (peak RSS, CPU seconds, process count) of a job """
+    job = scheduler.get_job(job_id)
+    if job is not None:
+        return jsonify(job.to_dict())
+    # jobs of earlier server runs
+    history = job_history.get(job_id)
+    if history is None:
+        return jsonify({"message": f"Job {job_id} not found"}), 404
+    return jsonify(history)
+
+@app.route('/jobs/queue')
+def get_job_queue():
+    """ Show running jobs, queue depth and wait time of the job scheduler """
+    return jsonify(scheduler.get_stats())
+
+def get_cli_case_function(request_args):
+    auto_case = request_args.get('case')
+    dp_name = request_args.get('TIBCOP_CLI_DP_NAME')
+    other_args = request_args.get('TIBCOP_CLI_OTHER_ARGS')
+
+    env_vars = set_env_vars_from_request(request_args, False)
     cli_handler = TibcopCliHandler(env_vars)
 
     case_function_map = {
@@ -143,7 +575,15 @@ def run_cli_script():
         "tplatform:register-k8s-dataplane": lambda: cli_handler.tplatform_register_k8s_dataplane(dp_name, other_args=other_args),
         "tplatform:unregister-dataplane": lambda: cli_handler.tplatform_unregister_dataplane(dp_name, other_args=other_args),
     }
-    case_func = case_function_map.get(auto_case)
+    return case_function_map.get(auto_case)
+
+@app.route('/run-cli-script')
+def run_cli_script():
+    auto_case = request.args.get('case')
+    if not auto_case:
+        return "Missing 'case' parameter", 400
+
+    case_func = get_cli_case_function(request.args)
 
     if case_func:
         runner = StreamingRunner()
@@ -158,18 +598,24 @@ def run_cli_script():
                     break
                 yield Util.clean_ansi_escape(line, False) + '\n'
 
-        return Response(generate(), content_type='text/html; charset=utf-8')
+        headers = {}
+        stream = encode_stream(generate(), headers, request.headers.get("Accept-Encoding"))
+        return Response(stream, headers=headers, content_type='text/html; charset=utf-8')
     else:
         return f"{auto_case} not found", 404
 
-@app.route('/get_env')
-def get_env():
-    from utils.env import ENV
+# import time of utils.env, changes on every refresh and is not used by the UI
+ENV_VOLATILE_KEYS = ("RETRY_TIME", "RETRY_TIME_FOLDER")
+
+def build_env():
+    """ Environment shown in the UI, the cluster values (helm, kubectl) are read again when the discovery cache has expired """
+    # a new instance evaluates its cached properties again, utils.env.ENV of the other modules is not touched
+    ENV = EnvConfig()
     env_vars = os.environ.copy()
     env_dict = {
         key: getattr(ENV, key)
         for key in dir(ENV)
-        if not key.startswith("_") and not callable(getattr(ENV, key))
+        if not key.startswith("_") and not callable(getattr(ENV, key)) and key not in ENV_VOLATILE_KEYS
     }
     # if version.txt exist, get content of version.txt
     version_file = os.path.join(os.getcwd(), "version.txt")
@@ -178,30 +624,67 @@ def get_env():
             version = f.read().strip()
         env_dict["TP_AUTOMATION_TASK_RELEASE_VERSION"] = version
 
-    merged = {**env_vars, **env_dict}
-    return jsonify(merged)
+    return {**env_vars, **env_dict}
+
+# seconds before the cached /get_env response is refreshed in the background
+TP_AUTO_ENV_CACHE_TTL = int(os.environ.get("TP_AUTO_ENV_CACHE_TTL", "300"))
+env_cache = SnapshotCache(build_env, TP_AUTO_ENV_CACHE_TTL, "environment")
+env_cache.refresh_async()
+
+@app.route('/get_env')
+def get_env():
+    """ Cached environment, returns 304 if it has not changed since the ETag sent in If-None-Match """
+    body, etag = env_cache.get()
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
 
 @app.route('/upload', methods=['POST'])
 def upload_file():
+    """ Store an app file by its sha256, the body is a multipart 'file' or the raw file with the X-Upload-Filename header """
     file = request.files.get('file')
-    UPLOAD_FOLDER = 'upload'
-    os.makedirs(UPLOAD_FOLDER, exist_ok=True)
     if file:
-        original_filename = os.path.splitext(file.filename)[0]
-        ext = os.path.splitext(file.filename)[1]
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        safe_name = f"{original_filename}_{timestamp}{ext}"
-        save_path = os.path.join(UPLOAD_FOLDER, safe_name)
-        file.save(save_path)
-
-        return jsonify({
-            'message': 'Upload successful',
-            'filename': safe_name,
-            'filetype': 'BWCE' if ext == '.ear' else 'FLOGO'
-        })
+        stream, filename = file.stream, file.filename
     else:
+        stream, filename = request.stream, unquote(request.headers.get('X-Upload-Filename') or request.args.get('filename') or '')
+    if not filename:
         return jsonify({'message': 'No file uploaded'})
 
+    metadata = upload_store.save(stream, filename)
+    return jsonify({
+        'message': 'Upload successful',
+        'filename': metadata['filename'],
+        'filetype': metadata['filetype'],
+        'sha256': metadata['sha256'],
+        'size': metadata['size']
+    })
+
+@app.route('/upload/<sha256>', methods=['HEAD', 'GET'])
+def get_upload(sha256):
+    """ Check if a file with this sha256 is already uploaded, so the client can skip sending it again """
+    metadata = upload_store.find(sha256.lower())
+    if metadata is None:
+        return jsonify({'message': f'{sha256} not found'}), 404
+    return jsonify(metadata)
+
+@app.route('/upload/<sha256>', methods=['POST'])
+def add_upload(sha256):
+    """ Upload a file whose content is already stored, without its body, the file name is in the 'filename' argument """
+    filename = request.args.get('filename')
+    if not filename:
+        return jsonify({'message': 'Missing filename'}), 400
+    metadata = upload_store.add(sha256.lower(), filename)
+    if metadata is None:
+        return jsonify({'message': f'{sha256} not found'}), 404
+    return jsonify({
+        'message': 'Upload successful',
+        'filename': metadata['filename'],
+        'filetype': metadata['filetype'],
+        'sha256': metadata['sha256'],
+        'size': metadata['size']
+    })
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=3120)
 
@@ -0,0 +1,289 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+"""
+ASGI entry point of the bootstrap server (`uvicorn server_asgi:app`), the streaming routes run on the event loop
+and all other routes are served by the Flask app of server.py.
+"""
+import asyncio
+import signal
+import subprocess
+import sys
+
+from a2wsgi import WSGIMiddleware
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Mount, Route
+
+import server
+from server import (HEADER_ONE_CLICK_JOB_ID, SSE_HEADERS, TP_AUTO_QUEUE_STATUS_INTERVAL, TP_AUTO_RESOURCE_SAMPLE_INTERVAL,
+                    TP_AUTO_SSE_KEEPALIVE_INTERVAL, TP_AUTO_STREAM_FLUSH_INTERVAL, TP_AUTO_STREAM_FLUSH_SIZE, TP_AUTO_STREAM_GZIP,
+                    report_watcher, scheduler)
+from utils.output_stream import PIPE_READ_SIZE, GzipStream, LineSplitter, accepts_gzip
+from utils.streaming_runner import StreamingRunner
+from utils.util import Util
+
+# keep a reference to running job tasks, the event loop only keeps weak references
+_job_tasks = set()
+
+async def start_case_process_async(auto_case, env_vars):
+    """ Return (process, stdout reader, pipe transport to close when the job ends, None for a subprocess) """
+    loop = asyncio.get_running_loop()
+    env_vars = await asyncio.to_thread(server.get_case_env_vars, env_vars)
+    if server.warm_pool is not None:
+        try:
+            print(f"[INFO] Fork {auto_case} from warm pool")
+            process = await asyncio.to_thread(server.warm_pool.spawn, auto_case, env_vars)
+            reader = asyncio.StreamReader()
+            transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), process.stdout)
+            return process, reader, transport
+        except Exception as e:
+            print(f"[WARNING] Warm pool is not available, start a new interpreter: {e}")
+
+    # Start the script using unbuffered output
+    print(f'{sys.executable}, "-u", "-m", {auto_case}')
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-u", "-m", auto_case,  # `-u` ensures unbuffered output
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        env=env_vars,
+        start_new_session=True  # own process group, so the job can be stopped with all its processes
+    )
+    return process, process.stdout, None
+
+def is_case_process_running(process):
+    if isinstance(process, asyncio.subprocess.Process):
+        return process.returncode is None
+    return process.poll() is None
+
+async def wait_case_process(process):
+    if isinstance(process, asyncio.subprocess.Process):
+        return await process.wait()
+    return await asyncio.to_thread(process.wait)
+
+async def sample_process_tree(job):
+    while job.returncode is None:
+        await asyncio.to_thread(job.process_tree.sample)
+        await asyncio.sleep(TP_AUTO_RESOURCE_SAMPLE_INTERVAL)
+
+async def run_job_async(job, workspace):
+    """ Same as server.run_job, runs on the event loop """
+    process = sampler = transport = None
+    try:
+        while not await scheduler.wait_for_slot_async(job, TP_AUTO_QUEUE_STATUS_INTERVAL):
+            server.log_queue_status(job)
+        if not server.log_job_start(job):
+            return
+
+        process, stdout, transport = await start_case_process_async(job.case, job.env_vars)
+        server.start_process_tree(job, process)
+        job.process = process
+        await asyncio.to_thread(server.stop_if_requested, job)
+        sampler = asyncio.create_task(sample_process_tree(job))
+
+        # Read output in large chunks
+        splitter = LineSplitter()
+        while True:
+            try:
+                chunk = await asyncio.wait_for(stdout.read(PIPE_READ_SIZE), 1)
+            except asyncio.TimeoutError:
+                # processes left behind by the case can keep the pipe open after it exits
+                if is_case_process_running(process):
+                    continue
+                break
+            if not chunk:
+                break
+            lines = splitter.feed(chunk)
+            if lines:
+                job.log.extend(lines)
+        job.log.extend(splitter.close())
+
+    except Exception as e:
+        print(f"[ERROR] Exception in run_job_async(): {e}")
+
+    finally:
+        if process:
+            job.returncode = await wait_case_process(process)
+        if sampler:
+            sampler.cancel()
+        if transport:
+            # the pipe can still be open when the loop ended on the timeout
+            transport.close()
+        await asyncio.to_thread(server.finish_job, job, workspace, process is not None)
+
+async def read_job_log_async(job, seq):
+    """ Same as server.read_job_log, waits without blocking the event loop """
+    loop = asyncio.get_running_loop()
+    lines, closed = await job.log.read_async(seq, TP_AUTO_SSE_KEEPALIVE_INTERVAL)
+    size = sum(len(line) for _, line in lines)
+    deadline = loop.time() + TP_AUTO_STREAM_FLUSH_INTERVAL
+    while lines and not closed and size < TP_AUTO_STREAM_FLUSH_SIZE and loop.time() < deadline:
+        more, closed = await job.log.read_async(lines[-1][0], deadline - loop.time())
+        lines += more
+        size += sum(len(line) for _, line in more)
+    return lines, closed
+
+def encode_stream_async(chunks, headers, accept_encoding):
+    """ Same as server.encode_stream for async generators """
+    if not TP_AUTO_STREAM_GZIP or not accepts_gzip(accept_encoding):
+        return chunks
+    headers.update({"Content-Encoding": "gzip", "Vary": "Accept-Encoding"})
+    async def compress():
+        gzip_stream = GzipStream()
+        async for chunk in chunks:
+            yield gzip_stream.compress(chunk)
+        yield gzip_stream.close()
+    return compress()
+
+async def start_gui_job(request_args):
+    job, workspace = await asyncio.to_thread(server.create_gui_job, request_args)
+    task = asyncio.create_task(run_job_async(job, workspace), name=f"job-{job.id}")
+    _job_tasks.add(task)
+    task.add_done_callback(_job_tasks.discard)
+    return job
+
+async def run_gui_script(request):
+    """ Execute a Python script and stream real-time output """
+    if not request.query_params.get('case'):
+        return PlainTextResponse("Error: Missing 'case' parameter", 400)
+
+    job = await start_gui_job(request.query_params)
+    async def generate():
+        # Stream the job log, the job is not stopped if the client disconnects
+        yield '<pre>\n'
+        seq, closed = 0, False
+        while not closed:
+            lines, closed = await read_job_log_async(job, seq)
+            if lines:
+                seq = lines[-1][0]
+                yield ''.join(line + '\n' for _, line in lines)
+        yield '</pre>\n'
+
+    headers = {
+        HEADER_ONE_CLICK_JOB_ID: job.id
+    }
+    stream = encode_stream_async(generate(), headers, request.headers.get("Accept-Encoding"))
+    return StreamingResponse(stream, headers=headers, media_type='text/html; charset=utf-8')
+
+async def submit_job(request):
+    """ Start a GUI case in the background, output can be read from /jobs/<job_id>/events """
+    if not request.query_params.get('case'):
+        return JSONResponse({"message": "Missing 'case' parameter"}, 400)
+
+    job = await start_gui_job(request.query_params)
+    return JSONResponse({"jobId": job.id, "eventsUrl": f"/jobs/{job.id}/events"}, 202,
+                        {HEADER_ONE_CLICK_JOB_ID: job.id})
+
+async def job_events(request):
+    """ Stream job output as Server-Sent Events, resume after the Last-Event-ID header """
+    job_id = request.path_params["job_id"]
+    job = scheduler.get_job(job_id)
+    if job is None:
+        return JSONResponse({"message": f"Job {job_id} not found"}, 404)
+
+    last_event_id = server.get_last_event_id(request.headers, request.query_params)
+    async def generate():
+        yield "retry: 3000\n\n" + server.format_job_truncated_event(job, last_event_id)
+        seq, closed = last_event_id, False
+        while not closed:
+            lines, closed = await read_job_log_async(job, seq)
+            if lines:
+                seq = lines[-1][0]
+                yield ''.join(server.format_job_event(*line) for line in lines)
+            elif not closed:
+                yield ": keep-alive\n\n"
+        yield server.format_job_end_event(job)
+
+    headers = {
+        **SSE_HEADERS,
+        HEADER_ONE_CLICK_JOB_ID: job.id
+    }
+    stream = encode_stream_async(generate(), headers, request.headers.get("Accept-Encoding"))
+    return StreamingResponse(stream, headers=headers, media_type='text/event-stream; charset=utf-8')
+
+async def report_events(request):
+    """ Stream report changes as Server-Sent Events, a snapshot first and changes after the Last-Event-ID (version) """
+    version = server.get_report_event_id(request.headers, request.query_params)
+    async def generate():
+        yield "retry: 3000\n\n"
+        after_version, job_versions = version, {}
+        while True:
+            sequence = report_watcher.sequence
+            result = await asyncio.to_thread(server.read_report_changes, after_version, job_versions)
+            after_version, job_versions = result["version"], result["jobs"]
+            if server.has_report_changes(result):
+                yield server.format_report_events(result)
+            if await report_watcher.wait_async(sequence, TP_AUTO_SSE_KEEPALIVE_INTERVAL) == sequence:
+                yield ": keep-alive\n\n"
+
+    headers = {**SSE_HEADERS}
+    stream = encode_stream_async(generate(), headers, request.headers.get("Accept-Encoding"))
+    return StreamingResponse(stream, headers=headers, media_type='text/event-stream; charset=utf-8')
+
+async def stop_script(request):
+    """ Stop the currently running script """
+    job_id = request.query_params.get("jobId")
+    job = scheduler.get_job(job_id)
+    if job and scheduler.cancel(job):
+        print(f"[INFO] Removed job {job_id} from queue")
+        return JSONResponse({"status": "stopped", "message": "Queued job cancelled successfully"})
+    if job and job.state == "running":
+        # run_job_async checks it before and after the process starts
+        job.stop_requested = True
+
+    process = job.process if job else None
+    if process and job.returncode is None:
+        print(f"[INFO] Stopping job {job_id} (PID: {process.pid})...")
+        await asyncio.to_thread(job.process_tree.send_signal, signal.SIGTERM)  # Try to terminate gracefully
+        # Wait up to 2 seconds
+        for _ in range(20):
+            await asyncio.sleep(0.1)
+            if job.returncode is not None:
+                break
+        else:
+            await asyncio.to_thread(job.process_tree.send_signal, signal.SIGKILL)  # Force kill if termination fails
+        return JSONResponse({"status": "stopped", "message": "Process terminated successfully"})
+    if job and job.stop_requested and process is None:
+        print(f"[INFO] Stopping job {job_id} before its process starts")
+        return JSONResponse({"status": "stopped", "message": "Job stopped before its process started"})
+
+    return JSONResponse({"status": "no_process", "message": "No process running"})
+
+async def run_cli_script(request):
+    auto_case = request.query_params.get('case')
+    if not auto_case:
+        return PlainTextResponse("Missing 'case' parameter", 400)
+
+    case_func = server.get_cli_case_function(request.query_params)
+    if not case_func:
+        return PlainTextResponse(f"{auto_case} not found", 404)
+
+    runner = StreamingRunner(asyncio.get_running_loop())
+    runner.start_thread(case_func)
+
+    async def generate():
+        while True:
+            line = await runner.q.get()
+            if line is None:
+                break
+            yield Util.clean_ansi_escape(line, False) + '\n'
+
+    headers = {}
+    stream = encode_stream_async(generate(), headers, request.headers.get("Accept-Encoding"))
+    return StreamingResponse(stream, headers=headers, media_type='text/html; charset=utf-8')
+
+app = Starlette(
+    routes=[
+        Route('/run-gui-script', run_gui_script),
+        Route('/run-cli-script', run_cli_script),
+        Route('/stop-script', stop_script),
+        Route('/jobs', submit_job, methods=['POST']),
+        Route('/jobs/{job_id}/events', job_events),
+        Route('/report/events', report_events),
+        Mount('/', app=WSGIMiddleware(server.app)),
+    ],
+    middleware=[
+        Middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"],
+                   expose_headers=[HEADER_ONE_CLICK_JOB_ID]),
+    ]
+)
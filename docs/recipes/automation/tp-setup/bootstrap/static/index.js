@@ -27,29 +27,44 @@ async function loadData() {
   }
 }
 
+async function getFileSha256(file) {
+  // crypto.subtle is only available in secure contexts (https or localhost)
+  if (!window.crypto || !window.crypto.subtle) return null;
+  const digest = await window.crypto.subtle.digest('SHA-256', await file.arrayBuffer());
+  return Array.from(new Uint8Array(digest)).map(b => b.toString(16).padStart(2, '0')).join('');
+}
+
 async function handleFileUpload() {
   const fileInput = document.getElementById("app_file");
   if (!fileInput.value) return;
 
-  const formData = new FormData();
   const file = fileInput.files[0];
-  formData.append('file', file);
-
-  return new Promise((resolve, reject) => {
-    $.ajax({
-      url: '/upload',
-      type: 'POST',
-      data: formData,
-      contentType: false,
-      processData: false,
-      success: function (response) {
-        resolve(response);
-      },
-      error: function (err) {
-        reject(err);
+  // skip the upload if the server already has a file with the same content
+  const sha256 = await getFileSha256(file);
+  if (sha256) {
+    const headResponse = await fetch(`/upload/${sha256}`, { method: 'HEAD' });
+    if (headResponse.ok) {
+      // the upload still gets its own file name, only the body is not sent
+      const addResponse = await fetch(`/upload/${sha256}?filename=${encodeURIComponent(file.name)}`, { method: 'POST' });
+      if (addResponse.ok) {
+        return addResponse.json();
       }
-    });
+    }
+  }
+
+  // send the raw file, the server hashes it while writing it to disk
+  const response = await fetch('/upload', {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/octet-stream',
+      'X-Upload-Filename': encodeURIComponent(file.name)
+    },
+    body: file
   });
+  if (!response.ok) {
+    throw new Error(`Upload failed: ${response.status}`);
+  }
+  return response.json();
 }
 
 async function runGuiScript(currentElement) {
@@ -0,0 +1,69 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+
+import json
+import time
+
+from utils.browser_server import BrowserServer, BrowserServerPool
+from utils.env import ENV
+from utils.util import Util
+
+def wait_for_job_env(pool, launch_options):
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        env = pool.get_job_env(launch_options)
+        if env:
+            return env
+        time.sleep(0.01)
+    raise TimeoutError("browser server not ready")
+
+class FakeChromium:
+    def __init__(self):
+        self.endpoints = []
+
+    def connect(self, ws_endpoint, timeout):
+        self.endpoints.append(ws_endpoint)
+        return "browser"
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+
+def start_fake_server(server):
+    # no browser, the endpoint tells the servers apart
+    server.ws_endpoint = f"ws://127.0.0.1:9000/{server.launch_options['args']}"
+
+def test_job_with_host_resolver_rules_gets_a_shared_browser(monkeypatch):
+    monkeypatch.setattr(BrowserServer, "_start", start_fake_server)
+    pool = BrowserServerPool(health_interval=3600)
+    launch_options = BrowserServer.get_launch_options(True, "my.example.com", "10.0.0.1")
+    assert launch_options["args"] == ["--host-resolver-rules=MAP *.my.example.com 10.0.0.1"]
+
+    # the first job starts the server in the background
+    env = wait_for_job_env(pool, launch_options)
+    # the job connects when the options of the server are the ones it would launch its browser with
+    assert json.loads(env["TP_AUTO_BROWSER_LAUNCH_OPTIONS"]) == launch_options
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setattr(Util, "get_dns_ip", staticmethod(lambda: "10.0.0.1"))
+    monkeypatch.setattr(Util, "_is_shared_browser", False)
+    monkeypatch.setitem(ENV.__dict__, "TP_AUTO_CP_DNS_DOMAIN", "my.example.com")
+    playwright = FakePlaywright()
+    assert Util.connect_shared_browser(playwright, Util.get_browser_launch_options(True)) == "browser"
+    assert playwright.chromium.endpoints == [env["TP_AUTO_BROWSER_WS_ENDPOINT"]]
+
+    other_env = wait_for_job_env(pool, BrowserServer.get_launch_options(True, "my.example.com", ""))
+    assert json.loads(other_env["TP_AUTO_BROWSER_LAUNCH_OPTIONS"]) == {"headless": True, "args": []}
+    assert other_env["TP_AUTO_BROWSER_WS_ENDPOINT"] != env["TP_AUTO_BROWSER_WS_ENDPOINT"]
+    pool.stop()
+
+def test_max_servers(monkeypatch):
+    monkeypatch.setattr(BrowserServer, "_start", start_fake_server)
+    pool = BrowserServerPool(health_interval=3600, max_servers=1)
+    wait_for_job_env(pool, BrowserServer.get_launch_options(True, "my.example.com", "10.0.0.1"))
+
+    # the jobs of other options launch their own browser
+    launch_options = BrowserServer.get_launch_options(True, "my.example.com", "10.0.0.2")
+    assert pool.get_job_env(launch_options) == {}
+    time.sleep(0.05)
+    assert pool.get_job_env(launch_options) == {}
+    pool.stop()
@@ -0,0 +1,87 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+
+import base64
+import json
+
+from utils.cluster_discovery import ClusterDiscovery
+from utils.discovery_cache import DiscoveryCache
+
+OUTPUTS = {
+    "releases": json.dumps([
+        {"name": "platform-bootstrap", "chart": "platform-bootstrap-1.4.2"},
+        {"name": "platform-base", "chart": "platform-base-1.4.10"},
+        {"name": "platform-base-extra", "chart": "platform-base-extra-0.1.0"},
+    ]),
+    "ingresses": json.dumps({"items": [{"spec": {"rules": [{"host": "*.cp1-my.my.example.com"}]}}]}),
+    "storageClasses": json.dumps({"items": [
+        {"metadata": {"name": "standard", "annotations": {}}},
+        {"metadata": {"name": "hostpath", "annotations": {"storageclass.beta.kubernetes.io/is-default-class": "true"}}},
+    ]}),
+    "elasticSecret": json.dumps({"data": {"elastic": base64.b64encode(b"secret").decode()}}),
+}
+
+class CountingDiscovery(ClusterDiscovery):
+    def __init__(self, cache):
+        super().__init__(cache)
+        self.passes = 0
+
+    def run_queries(self):
+        self.passes += 1
+        return OUTPUTS
+
+def make_cache(tmp_path, ttl):
+    cache = DiscoveryCache(str(tmp_path / "discovery.json"), ttl)
+    cache._cluster_key = "kubeconfig#context"
+    return cache
+
+def test_parse():
+    assert ClusterDiscovery.parse(OUTPUTS) == {
+        "cpVersion": "1.4",
+        "cpPlatformBootstrapVersion": "1.4.2",
+        "cpPlatformBaseVersion": "1.4.10",
+        "cpDnsDomain": "my.example.com",
+        "storageClass": "hostpath",
+        "elasticPassword": "secret",
+    }
+
+def test_parse_failed_queries():
+    facts = ClusterDiscovery.parse({"releases": None, "ingresses": "not json", "storageClasses": "", "elasticSecret": None})
+    assert set(facts.values()) == {""}
+
+def test_facts_are_cached(tmp_path):
+    discovery = CountingDiscovery(make_cache(tmp_path, 300))
+
+    assert discovery.get("cpDnsDomain") == "my.example.com"
+    assert discovery.get("storageClass") == "hostpath"
+    assert discovery.passes == 1
+    # another process reads the facts from the disk cache
+    other = CountingDiscovery(make_cache(tmp_path, 300))
+    assert other.get("cpVersion") == "1.4"
+    assert other.passes == 0
+
+def test_discovery_runs_again_after_ttl(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("time.time", lambda: now[0])
+    discovery = CountingDiscovery(make_cache(tmp_path, 300))
+
+    discovery.get("cpVersion")
+    now[0] += 299
+    discovery.get("cpVersion")
+    assert discovery.passes == 1
+
+    now[0] += 1
+    discovery.get("cpVersion")
+    assert discovery.passes == 2
+
+def test_discovery_without_cache(tmp_path):
+    discovery = CountingDiscovery(make_cache(tmp_path, 0))
+
+    # every value of a process comes from one pass
+    assert discovery.get("cpVersion") == "1.4"
+    assert discovery.get("storageClass") == "hostpath"
+    discovery.get("cpVersion")
+    assert discovery.passes == 1
+    # nothing is shared through the disk
+    other = CountingDiscovery(make_cache(tmp_path, 0))
+    other.get("cpVersion")
+    assert other.passes == 1
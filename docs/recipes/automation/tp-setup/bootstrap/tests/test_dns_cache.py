@@ -0,0 +1,50 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+
+from utils.dns_cache import DnsCache
+
+class FakeDnsCache(DnsCache):
+    def __init__(self, path, ttl, address):
+        super().__init__(path, ttl)
+        self.address = address
+        self.lookups = 0
+
+    def lookup(self, domain):
+        self.lookups += 1
+        return self.address
+
+def test_resolve_is_cached(tmp_path):
+    cache = FakeDnsCache(str(tmp_path / "dns.json"), 300, "10.0.0.1")
+
+    assert cache.resolve("example.com") == "10.0.0.1"
+    assert cache.resolve("example.com") == "10.0.0.1"
+    assert cache.lookups == 1
+    # another process reads the address from the disk cache
+    other = FakeDnsCache(str(tmp_path / "dns.json"), 300, "10.0.0.2")
+    assert other.resolve("example.com") == "10.0.0.1"
+    assert other.lookups == 0
+
+def test_expired_memory_entry_uses_disk_entry(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("time.time", lambda: now[0])
+    cache = FakeDnsCache(str(tmp_path / "dns.json"), 300, "10.0.0.1")
+    other = FakeDnsCache(str(tmp_path / "dns.json"), 300, "10.0.0.2")
+    cache.resolve("example.com")
+
+    # the memory entry expires after another process resolved the domain again
+    now[0] += 200
+    other._write("example.com", "10.0.0.2")
+    now[0] += 200
+    assert cache.resolve("example.com") == "10.0.0.2"
+    assert cache.lookups == 1
+
+    now[0] += 300
+    cache.address = "10.0.0.3"
+    assert cache.resolve("example.com") == "10.0.0.3"
+    assert cache.lookups == 2
+
+def test_failed_lookup_is_not_cached(tmp_path):
+    cache = FakeDnsCache(str(tmp_path / "dns.json"), 300, "")
+
+    assert cache.resolve("example.com") == ""
+    assert cache.resolve("example.com") == ""
+    assert cache.lookups == 2
@@ -0,0 +1,99 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+
+import asyncio
+
+from utils.job_log import JobLog
+from utils.job_scheduler import Job, JobScheduler
+
+def make_job(dp_name="dp1", case="case.k8s_create_dp"):
+    return Job(case, {"TP_AUTO_K8S_DP_NAME": dp_name})
+
+def test_global_limit():
+    scheduler = JobScheduler(max_concurrent_jobs=2)
+    jobs = [scheduler.submit(make_job(f"dp{i}")) for i in range(3)]
+
+    assert [job.state for job in jobs] == ["running", "running", "queued"]
+    assert scheduler.get_position(jobs[2]) == 1
+
+    scheduler.finish(jobs[0])
+    assert jobs[0].state == "finished"
+    assert jobs[2].state == "running"
+
+def test_same_data_plane_is_serialized():
+    scheduler = JobScheduler(max_concurrent_jobs=3)
+    first, second, other = scheduler.submit(make_job("dp1")), scheduler.submit(make_job("dp1")), scheduler.submit(make_job("dp2"))
+
+    assert first.state == "running"
+    assert second.state == "queued"
+    # a job on another data plane is not blocked by the queued one
+    assert other.state == "running"
+
+    scheduler.finish(first, "failed")
+    assert first.state == "failed"
+    assert second.state == "running"
+
+def test_fifo_order():
+    scheduler = JobScheduler(max_concurrent_jobs=1)
+    running = scheduler.submit(make_job("dp0"))
+    queued = [scheduler.submit(make_job(f"dp{i}")) for i in range(1, 4)]
+    assert [scheduler.get_position(job) for job in queued] == [1, 2, 3]
+
+    started = []
+    current = running
+    for _ in queued:
+        scheduler.finish(current)
+        current = next(job for job in queued if job.state == "running")
+        started.append(current)
+    assert started == queued
+
+def test_cancel_queued_job():
+    scheduler = JobScheduler(max_concurrent_jobs=1)
+    running = scheduler.submit(make_job("dp1"))
+    queued = scheduler.submit(make_job("dp2"))
+
+    assert scheduler.cancel(queued)
+    assert queued.state == "cancelled"
+    assert scheduler.wait_for_slot(queued, 0)
+    assert scheduler.get_job(queued.id) is queued
+    # a running job can not be cancelled, it has to be stopped
+    assert not scheduler.cancel(running)
+    assert running.state == "running"
+
+def test_wait_for_slot_async():
+    scheduler = JobScheduler(max_concurrent_jobs=1)
+    running = scheduler.submit(make_job("dp1"))
+    queued = scheduler.submit(make_job("dp2"))
+
+    async def wait():
+        assert not await scheduler.wait_for_slot_async(queued, 0.05)
+        asyncio.get_running_loop().call_later(0.05, scheduler.finish, running)
+        return await scheduler.wait_for_slot_async(queued, 5)
+
+    assert asyncio.run(wait())
+    assert queued.state == "running"
+
+def test_job_log_replay():
+    log = JobLog(max_lines=3)
+    log.extend(["a", "b"])
+    assert log.append("c") == 3
+
+    assert log.read(0, 0) == ([(1, "a"), (2, "b"), (3, "c")], False)
+    # replay after the last event id seen by a client
+    assert log.read(2, 0) == ([(3, "c")], False)
+    assert log.read(3, 0) == ([], False)
+
+def test_job_log_drops_oldest_lines():
+    log = JobLog(max_lines=2)
+    log.extend(["a", "b", "c"])
+
+    assert log.first_seq == 2
+    assert log.read(0, 0) == ([(2, "b"), (3, "c")], False)
+
+def test_job_log_close_wakes_readers():
+    log = JobLog()
+
+    async def read():
+        asyncio.get_running_loop().call_later(0.05, log.close)
+        return await log.read_async(0, 5)
+
+    assert asyncio.run(read()) == ([], True)
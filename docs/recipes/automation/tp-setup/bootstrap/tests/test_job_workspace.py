@@ -0,0 +1,61 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+
+import os
+
+import yaml
+
+from utils.job_workspace import JobWorkspace, merge_report
+
+def test_merge_mappings():
+    base = {"ENV": {"CP_URL": "https://a", "CP_ADMIN_USER": "admin"}, "version": 1}
+    update = {"ENV": {"CP_URL": "https://b"}, "status": "ok"}
+
+    assert merge_report(base, update) == {
+        "ENV": {"CP_URL": "https://b", "CP_ADMIN_USER": "admin"},
+        "version": 1,
+        "status": "ok",
+    }
+    # the inputs are not modified
+    assert base["ENV"]["CP_URL"] == "https://a"
+
+def test_merge_named_lists_by_name():
+    base = {"dataPlane": [
+        {"name": "dp1", "storage": True, "capability": [{"name": "flogo", "status": "provisioned"}]},
+        {"name": "dp2"},
+    ]}
+    update = {"dataPlane": [
+        {"name": "dp1", "capability": [{"name": "flogo", "app": [{"name": "app1"}]}, {"name": "bwce"}]},
+        {"name": "dp3"},
+    ]}
+
+    assert merge_report(base, update) == {"dataPlane": [
+        {"name": "dp1", "storage": True, "capability": [
+            {"name": "flogo", "status": "provisioned", "app": [{"name": "app1"}]},
+            {"name": "bwce"},
+        ]},
+        {"name": "dp2"},
+        {"name": "dp3"},
+    ]}
+
+def test_merge_other_values_are_replaced():
+    assert merge_report({"tags": ["a", "b"]}, {"tags": ["c"]}) == {"tags": ["c"]}
+    assert merge_report({"ENV": {"CP_URL": "x"}}, {"ENV": None}) == {"ENV": None}
+
+def test_publish_workspace(tmp_path):
+    report_path, workspace_root = tmp_path / "report", tmp_path / "workspace"
+    report_path.mkdir()
+    (report_path / "report.yaml").write_text(yaml.safe_dump({"dataPlane": [{"name": "dp1", "storage": True}]}))
+
+    workspace = JobWorkspace("job1", str(report_path), str(workspace_root))
+    job_report_path = workspace.create()
+    with open(os.path.join(job_report_path, "report.yaml"), "w") as f:
+        yaml.safe_dump({"dataPlane": [{"name": "dp1", "ingress": True}]}, f)
+    with open(os.path.join(job_report_path, "report.txt"), "w") as f:
+        f.write("job report")
+    workspace.publish()
+    workspace.remove()
+
+    with open(report_path / "report.yaml") as f:
+        assert yaml.safe_load(f) == {"dataPlane": [{"name": "dp1", "storage": True, "ingress": True}]}
+    assert (report_path / "report.txt").read_text() == "job report"
+    assert not os.path.exists(job_report_path)
@@ -0,0 +1,44 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+from utils.process_tree import ProcessTree
+
+pytestmark = pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="the environment marker is read from /proc")
+
+# the case starts a process with the marker and exits before it has been sampled
+CASE = """
+import os, subprocess, sys
+process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"], env={**os.environ, "TP_AUTO_JOB_ID": "job1"})
+print(process.pid, flush=True)
+"""
+
+def test_re_parented_process_is_found_by_marker():
+    case = subprocess.Popen([sys.executable, "-c", CASE], stdout=subprocess.PIPE, text=True, start_new_session=True)
+    grandchild = int(case.stdout.readline())
+    case.wait(timeout=10)
+    # a process with the marker in another session is not part of the tree
+    other = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"],
+                             env={**os.environ, "TP_AUTO_JOB_ID": "job1"}, start_new_session=True)
+    try:
+        tree = ProcessTree(case.pid, "TP_AUTO_JOB_ID=job1")
+        assert list(tree.sample()) == [grandchild]
+
+        assert grandchild in tree.send_signal(signal.SIGKILL)
+        deadline = time.monotonic() + 10
+        while grandchild in tree.sample() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert grandchild not in tree.sample()
+    finally:
+        other.kill()
+        other.wait()
+        try:
+            os.kill(grandchild, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
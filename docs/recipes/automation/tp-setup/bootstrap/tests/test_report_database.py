@@ -0,0 +1,55 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+
+import contextlib
+
+import yaml
+
+from utils.report_database import ReportDatabase, build_report, flatten_report
+from utils.report_model import ReportModel
+
+REPORT = {
+    "ENV": {"CP_URL": "https://cp", "PORTS": [80, 443]},
+    "dataPlane": [
+        {"name": "dp2", "storage": True, "capability": [
+            {"name": "flogo", "status": "ok", "app": [{"name": "app1", "status": "Running"}, {"name": "app0"}]},
+            {"name": "bwce"},
+        ]},
+        {"name": "dp1", "ingress": None},
+    ],
+    "version": 1,
+}
+
+def test_flatten_and_build_keep_the_layout():
+    rows = flatten_report(ReportModel.from_dict(REPORT))
+
+    assert set(rows["dataplane"]) == {("dp2",), ("dp1",)}
+    assert rows["app"][("dp2", "flogo", "app0")] == (1,)
+    assert build_report(rows).to_dict() == REPORT
+
+def test_database_write_and_export(tmp_path):
+    yaml_path = str(tmp_path / "report.yaml")
+    with contextlib.closing(ReportDatabase(yaml_path + ".db", yaml_path)) as database:
+        def load(model):
+            model.load_dict(REPORT)
+            return True
+        database.update(load, {"op": "set", "key": "."})
+        def set_status(model):
+            model.app("dp2", "flogo", "app0").set("status", "Running")
+            return True
+        database.update(set_status, {"op": "set", "key": "status"})
+        database.export()
+
+    with contextlib.closing(ReportDatabase(yaml_path + ".db", yaml_path)) as database:
+        assert database.version == 2
+        assert database.read().app("dp2", "flogo", "app0").get("status") == "Running"
+        assert [change["key"] for change in database.read_journal(1)[0]] == ["status"]
+    with open(yaml_path) as f:
+        assert yaml.safe_load(f)["dataPlane"][0]["capability"][0]["app"][1] == {"name": "app0", "status": "Running"}
+
+def test_database_imports_existing_yaml(tmp_path):
+    yaml_path = tmp_path / "report.yaml"
+    yaml_path.write_text(yaml.safe_dump(REPORT, sort_keys=False))
+
+    with contextlib.closing(ReportDatabase(str(yaml_path) + ".db", str(yaml_path))) as database:
+        assert database.read().to_dict() == REPORT
+        assert database.version == 1
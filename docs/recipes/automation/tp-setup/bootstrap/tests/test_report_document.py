@@ -0,0 +1,110 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+
+import yaml
+
+import utils.report_document
+from utils.report_document import ReportDocument, parse_path, to_yq_text
+
+REPORT = {
+    "ENV": {"CP_URL": "https://cp"},
+    "dataPlane": [{"name": "dp1", "storage": True, "capability": [{"name": "flogo", "app": [{"name": "app1"}]}]}],
+}
+
+def set_field(key, value):
+    def mutate(model):
+        model.set(key, value)
+        return True
+    return mutate
+
+def test_write_and_read_back(tmp_path):
+    path = str(tmp_path / "report.yaml")
+    document = ReportDocument(path)
+
+    def load(model):
+        model.load_dict(REPORT)
+        return True
+    document.update(load, {"op": "set", "key": "."})
+
+    with open(path) as f:
+        assert yaml.safe_load(f) == REPORT
+    # another instance, like another process, reads the same report
+    other = ReportDocument(path)
+    assert other.read().to_dict() == REPORT
+    assert other.read().app("dp1", "flogo", "app1") is not None
+    assert other.version == 1
+
+def test_version_counts_every_write(tmp_path):
+    path = str(tmp_path / "report.yaml")
+    first, second = ReportDocument(path), ReportDocument(path)
+
+    first.update(set_field("a", 1))
+    second.update(set_field("b", 2))
+    first.update(set_field("c", 3))
+
+    assert first.version == second.version == 3
+    # the write of the other instance is not lost
+    assert first.read().to_dict() == {"a": 1, "b": 2, "c": 3}
+
+def test_transaction_is_written_once(tmp_path):
+    document = ReportDocument(str(tmp_path / "report.yaml"))
+    with document.transaction():
+        document.update(set_field("a", 1), {"op": "set", "key": ".a", "value": 1})
+        document.update(set_field("b", 2), {"op": "set", "key": ".b", "value": 2})
+        # not written before the transaction ends
+        assert ReportDocument(document.path).read().to_dict() == {}
+
+    assert document.version == 1
+    assert document.read().to_dict() == {"a": 1, "b": 2}
+
+def test_transaction_is_applied_again_after_another_write(tmp_path):
+    path = str(tmp_path / "report.yaml")
+    document, other = ReportDocument(path), ReportDocument(path)
+    with document.transaction():
+        document.update(set_field("a", 1))
+        other.update(set_field("b", 2))
+
+    assert ReportDocument(path).read().to_dict() == {"b": 2, "a": 1}
+    assert document.version == 2
+
+def test_failed_transaction_writes_nothing(tmp_path):
+    document = ReportDocument(str(tmp_path / "report.yaml"))
+    try:
+        with document.transaction():
+            document.update(set_field("a", 1))
+            raise RuntimeError("failed")
+    except RuntimeError:
+        pass
+
+    assert document.version == 0
+    assert document.read().to_dict() == {}
+
+def test_journal(tmp_path, monkeypatch):
+    monkeypatch.setenv("TP_AUTO_JOB_ID", "job1")
+    document = ReportDocument(str(tmp_path / "report.yaml"))
+    document.update(set_field("a", 1), {"op": "set", "key": ".a", "value": 1})
+    document.update(set_field("b", 2), [{"op": "set", "key": ".b", "value": 2}, {"op": "set", "key": ".c", "value": 3}])
+
+    changes, is_complete = document.read_journal(1)
+    assert is_complete
+    assert [(change["version"], change["key"], change["jobId"]) for change in changes] == [(2, ".b", "job1"), (2, ".c", "job1")]
+    assert document.read_journal(2) == ([], True)
+
+def test_journal_compaction(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils.report_document, "TP_AUTO_REPORT_JOURNAL_MAX_BYTES", 1000)
+    document = ReportDocument(str(tmp_path / "report.yaml"))
+    for index in range(30):
+        document.update(set_field("a", index), {"op": "set", "key": ".a", "value": index})
+
+    changes, _ = document.read_journal(0)
+    assert 0 < len(changes) < 30
+    assert changes[-1]["version"] == 30
+    # the compacted changes are only in the document
+    assert document.read_journal(0)[1] is False
+    assert document.read_journal(changes[0]["version"] - 1) == (changes, True)
+
+def test_parse_path_and_yq_text():
+    assert parse_path(".ENV.CP_URL") == ["ENV", "CP_URL"]
+    assert parse_path("(.dataPlane[] | select(.name == \"dp1\"))") is None
+    assert to_yq_text(None) is None
+    assert to_yq_text(True) == "true"
+    assert to_yq_text({"a": [1]}) == "a:\n  - 1"
@@ -0,0 +1,52 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+
+import hashlib
+import io
+import json
+import os
+
+from utils.upload_store import UploadStore
+
+FLOGO_APP = json.dumps({"name": "flogo-app"}).encode()
+
+def test_save_stores_content_once(tmp_path):
+    store = UploadStore(str(tmp_path))
+    first = store.save(io.BytesIO(b"ear content"), "myapp.ear")
+    second = store.save(io.BytesIO(b"ear content"), "other.ear")
+
+    sha256 = hashlib.sha256(b"ear content").hexdigest()
+    assert first["sha256"] == second["sha256"] == sha256
+    assert store.find(sha256)["size"] == len(b"ear content")
+    # every upload has its own name and records its own original file name
+    assert first["filename"].startswith("myapp_") and first["filename"].endswith(".ear")
+    assert second["filename"].startswith("other_")
+    assert second["originalFilename"] == "other.ear"
+    assert second["filetype"] == "BWCE"
+    assert os.path.samefile(tmp_path / first["filename"], tmp_path / sha256)
+    assert sorted(name for name in os.listdir(tmp_path) if not name.endswith(".meta.json")) == \
+        sorted([sha256, first["filename"], second["filename"]])
+
+def test_same_file_name_gets_a_new_name(tmp_path):
+    store = UploadStore(str(tmp_path))
+    first = store.save(io.BytesIO(b"v1"), "myapp.ear")
+    second = store.save(io.BytesIO(b"v2"), "myapp.ear")
+
+    assert first["filename"] != second["filename"]
+    assert (tmp_path / second["filename"]).read_bytes() == b"v2"
+
+def test_flogo_app_name(tmp_path):
+    store = UploadStore(str(tmp_path))
+    metadata = store.save(io.BytesIO(FLOGO_APP), "flogo.json")
+
+    assert metadata["filetype"] == "FLOGO"
+    assert metadata["appName"] == "flogo-app"
+    assert UploadStore.read_metadata(str(tmp_path / metadata["filename"]))["appName"] == "flogo-app"
+
+def test_add_and_find(tmp_path):
+    store = UploadStore(str(tmp_path))
+    sha256 = store.save(io.BytesIO(FLOGO_APP), "flogo.json")["sha256"]
+
+    assert store.add(sha256, "renamed.json")["originalFilename"] == "renamed.json"
+    assert store.find("0" * 64) is None
+    assert store.add("0" * 64, "missing.json") is None
+    assert store.find("not-a-sha256") is None
@@ -0,0 +1,93 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+
+import pytest
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+import utils.util
+from utils.util import Util
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+class FakeLocator:
+    """Locator which becomes visible when the page is reloaded visible_after_reloads times, waiting advances the clock."""
+    def __init__(self, clock, visible_after_reloads=None, errors=0):
+        self.clock = clock
+        self.visible_after_reloads = visible_after_reloads
+        self.errors = errors
+        self.reloads = 0
+        self.waits = []
+
+    @property
+    def first(self):
+        return self
+
+    def filter(self, visible):
+        return self
+
+    def or_(self, locator):
+        return self
+
+    def count(self):
+        if self.errors:
+            self.errors -= 1
+            raise PlaywrightError("Execution context was destroyed")
+        return 1 if self.visible_after_reloads is not None and self.reloads >= self.visible_after_reloads else 0
+
+    def wait_for(self, state, timeout):
+        self.waits.append(timeout / 1000)
+        self.clock.sleep(timeout / 1000)
+        raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded.")
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(utils.util, "time", clock)
+    return clock
+
+@pytest.fixture
+def locator(clock, monkeypatch):
+    locator = FakeLocator(clock)
+    def refresh_page(page):
+        locator.reloads += 1
+    monkeypatch.setattr(Util, "refresh_page", staticmethod(refresh_page))
+    return locator
+
+def test_wait_without_refresh(clock, locator):
+    # the first check after 5 seconds, then one every 10 seconds for 180 seconds
+    assert Util.check_dom_visibility(None, locator, interval=10, max_wait=180) is False
+    assert locator.waits == [175]
+    assert locator.reloads == 0
+
+def test_short_interval(clock, locator):
+    assert Util.check_dom_visibility(None, locator, interval=3, max_wait=10) is False
+    assert locator.waits == [3 + 2 * 3]
+
+def test_wait_doubles_between_reloads(clock, locator):
+    assert Util.check_dom_visibility(None, locator, interval=20, max_wait=100, is_refresh=True) is False
+    assert locator.waits == [5, 10, 20, 20, 20, 10]
+    assert sum(locator.waits) == 5 + 4 * 20
+    assert locator.reloads == 5
+
+def test_visible_after_reload(clock, locator):
+    locator.visible_after_reloads = 2
+    assert Util.check_dom_visibility(None, locator, interval=20, max_wait=100, is_refresh=True) is True
+    assert locator.waits == [5, 10]
+    assert clock.now == 1015
+
+def test_wait_for_any_retries_after_errors(clock):
+    locator = FakeLocator(clock, visible_after_reloads=0, errors=2)
+    assert Util.wait_for_any([locator], timeout=3000) == 0
+    assert clock.now == 1001
+
+def test_wait_for_any_times_out_on_errors(clock):
+    locator = FakeLocator(clock, errors=100)
+    assert Util.wait_for_any([locator], timeout=3000) == -1
+    assert clock.now == 1003
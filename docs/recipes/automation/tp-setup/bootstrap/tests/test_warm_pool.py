@@ -0,0 +1,61 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+
+import os
+import signal
+import subprocess
+import textwrap
+
+import pytest
+
+from utils.warm_pool import WarmPool
+
+pytestmark = pytest.mark.skipif(not WarmPool.is_supported(), reason="the warm pool needs fork and send_fds")
+
+@pytest.fixture
+def warm_pool(tmp_path, monkeypatch):
+    (tmp_path / "warm_case_exit.py").write_text(textwrap.dedent("""
+        import os, sys
+        print(f"case {os.environ['CASE_VALUE']} session {os.getsid(0) == os.getpid()}")
+        sys.exit(3)
+    """))
+    (tmp_path / "warm_case_sleep.py").write_text("import time\nprint('started', flush=True)\ntime.sleep(60)\n")
+    # the zygote imports the cases from PYTHONPATH
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+    pool = WarmPool(preload_modules=["json"])
+    pool.start()
+    yield pool
+    # EOF on stdin stops the zygote
+    pool._zygote.stdin.close()
+    pool._zygote.wait(timeout=10)
+
+def test_output_and_returncode(warm_pool, tmp_path):
+    process = warm_pool.spawn("warm_case_exit", {"CASE_VALUE": "value1"}, str(tmp_path))
+
+    assert process.pid > 0
+    assert process.stdout.read().decode().strip() == "case value1 session True"
+    assert process.wait(timeout=10) == 3
+    assert process.poll() == 3
+
+def test_poll_wait_and_kill(warm_pool, tmp_path):
+    process = warm_pool.spawn("warm_case_sleep", {}, str(tmp_path))
+    assert process.stdout.readline() == b"started\n"
+
+    assert process.poll() is None
+    with pytest.raises(subprocess.TimeoutExpired):
+        process.wait(timeout=0.1)
+    process.kill()
+    assert process.wait(timeout=10) == -signal.SIGKILL
+    # a finished process is not signalled again
+    process.terminate()
+
+def test_zygote_exit(warm_pool, tmp_path):
+    process = warm_pool.spawn("warm_case_sleep", {}, str(tmp_path))
+    assert process.stdout.readline() == b"started\n"
+
+    warm_pool._zygote.kill()
+    warm_pool._zygote.wait(timeout=10)
+    try:
+        # the exit code of the case is unknown without the zygote
+        assert process.wait(timeout=10) == -1
+    finally:
+        os.kill(process.pid, signal.SIGKILL)
@@ -0,0 +1,59 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+"""
+Saved storage state of Control Plane logins, see TP_AUTO_AUTH_STATE_TTL.
+"""
+import hashlib
+import json
+import os
+import time
+
+from utils.atomic_file import atomic_write
+from utils.discovery_cache import TP_AUTO_CACHE_PATH
+
+TP_AUTO_AUTH_STATE_TTL = int(os.environ.get("TP_AUTO_AUTH_STATE_TTL") or 0)
+
+class AuthStateCache:
+    def __init__(self, folder, ttl):
+        self.folder = folder
+        self.ttl = ttl
+
+    @property
+    def is_enabled(self):
+        return self.ttl > 0
+
+    def get(self, login_url, user):
+        """Return the storage state of the user, None if it is not saved or expired."""
+        if not self.is_enabled:
+            return None
+        try:
+            with open(self._get_path(login_url, user), "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("time", 0) >= self.ttl:
+            return None
+        return entry.get("state")
+
+    def save(self, login_url, user, state):
+        if not self.is_enabled:
+            return
+        path = self._get_path(login_url, user)
+        entry = {"loginUrl": login_url, "user": user, "time": time.time(), "state": state}
+        try:
+            os.makedirs(self.folder, mode=0o700, exist_ok=True)
+            # the state has the session cookies, only readable by the owner
+            atomic_write(path, lambda f: json.dump(entry, f), mode=0o600)
+        except OSError as e:
+            print(f"[WARNING] Failed to save the login state of {user}: {e}")
+
+    def remove(self, login_url, user):
+        try:
+            os.remove(self._get_path(login_url, user))
+        except FileNotFoundError:
+            pass
+
+    def _get_path(self, login_url, user):
+        key = hashlib.sha256(f"{login_url}\n{user}".encode()).hexdigest()
+        return os.path.join(self.folder, f"{key}.json")
+
+auth_state_cache = AuthStateCache(os.path.join(TP_AUTO_CACHE_PATH, "auth"), TP_AUTO_AUTH_STATE_TTL)
@@ -0,0 +1,167 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+"""
+Playwright browser server shared by the automation cases, see TP_AUTO_BROWSER_SERVER.
+"""
+import json
+import os
+import queue
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import urllib.request
+import uuid
+
+from utils.process_tree import ProcessTree
+
+TP_AUTO_BROWSER_SERVER = os.environ.get("TP_AUTO_BROWSER_SERVER", "true").lower() == "true"
+TP_AUTO_BROWSER_HEALTH_INTERVAL = int(os.environ.get("TP_AUTO_BROWSER_HEALTH_INTERVAL") or 30)
+
+class BrowserServer:
+    def __init__(self, launch_options, health_interval=30, start_timeout=60):
+        # launch_options is {"headless": bool, "args": [...]}, see get_launch_options
+        self.launch_options = launch_options
+        self.health_interval = health_interval
+        self.start_timeout = start_timeout
+        self.ws_endpoint = None
+        self._process = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def get_launch_options(headless, dns_domain, dns_ip):
+        """Launch options of the browser of a job, the browser resolves *.<dns_domain> to dns_ip when it is set."""
+        args = []
+        if dns_ip:
+            args.append(f"--host-resolver-rules=MAP *.{dns_domain} {dns_ip}")
+        return {"headless": headless, "args": args}
+
+    def start_async(self):
+        """Start the browser server and its health check in a background thread, the server startup does not wait for it."""
+        self._thread = threading.Thread(target=self._run, name="browser-server", daemon=True)
+        self._thread.start()
+
+    def get_job_env(self):
+        """Environment variables which let a job connect to the shared browser, empty if it is not ready."""
+        with self._lock:
+            if self.ws_endpoint is None:
+                return {}
+            return {
+                "TP_AUTO_BROWSER_WS_ENDPOINT": self.ws_endpoint,
+                "TP_AUTO_BROWSER_LAUNCH_OPTIONS": json.dumps(self.launch_options),
+            }
+
+    def is_healthy(self):
+        with self._lock:
+            process, ws_endpoint = self._process, self.ws_endpoint
+        if process is None or process.poll() is not None or ws_endpoint is None:
+            return False
+        # the browser server answers GET /json on the port of its web socket
+        url = ws_endpoint.replace("ws://", "http://", 1).rsplit("/", 1)[0] + "/json"
+        try:
+            with urllib.request.urlopen(url, timeout=5) as response:
+                return response.status == 200
+        except OSError:
+            return False
+
+    def stop(self):
+        self._stopped.set()
+        with self._lock:
+            process, self._process, self.ws_endpoint = self._process, None, None
+        self._kill(process)
+
+    def _run(self):
+        self._start()
+        while not self._stopped.wait(self.health_interval):
+            if self.is_healthy():
+                continue
+            print("[WARNING] Shared browser server is not responding, restarting it")
+            with self._lock:
+                process, self._process, self.ws_endpoint = self._process, None, None
+            self._kill(process)
+            self._start()
+
+    def _start(self):
+        # jobs launch their own browser until the endpoint is set
+        config = {**self.launch_options, "host": "127.0.0.1", "port": 0, "wsPath": f"/{uuid.uuid4().hex}"}
+        fd, config_path = tempfile.mkstemp(prefix="tp-auto-browser-", suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            json.dump(config, f)
+        print(f"[INFO] Starting shared browser server, headless: {self.launch_options['headless']}")
+        process = None
+        try:
+            process = subprocess.Popen(
+                [sys.executable, "-m", "playwright", "launch-server", "--browser", "chromium", "--config", config_path],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                text=True,
+                start_new_session=True  # not stopped together with the jobs
+            )
+            ws_endpoint = self._read_ws_endpoint(process)
+        except Exception as e:
+            print(f"[WARNING] Failed to start the shared browser server, jobs launch their own browser: {e}")
+            self._kill(process)
+            return
+        finally:
+            os.remove(config_path)
+        with self._lock:
+            if not self._stopped.is_set():
+                self._process, self.ws_endpoint = process, ws_endpoint
+                print(f"[INFO] Shared browser server is listening on {ws_endpoint}")
+                return
+        self._kill(process)
+
+    def _read_ws_endpoint(self, process):
+        # the browser server prints its endpoint when the browser is ready, the rest of the output is drained
+        lines = queue.Queue()
+        def read(stdout):
+            for line in stdout:
+                lines.put(line.strip())
+            lines.put(None)
+        threading.Thread(target=read, args=(process.stdout,), name="browser-server-output", daemon=True).start()
+        try:
+            line = lines.get(timeout=self.start_timeout)
+        except queue.Empty:
+            raise TimeoutError(f"no endpoint after {self.start_timeout} seconds")
+        if line is None:
+            raise RuntimeError(f"browser server exited with code {process.wait(timeout=10)}")
+        if not line.startswith("ws://"):
+            raise RuntimeError(f"unexpected output '{line}'")
+        return line
+
+    @staticmethod
+    def _kill(process):
+        # the browser is a grandchild of the process
+        if process is not None:
+            ProcessTree(process.pid).send_signal(signal.SIGKILL)
+            # the output reader ends at the end of the pipe
+            process.wait()
+
+class BrowserServerPool:
+    """One browser server for each set of launch options, started in the background by the first job which needs it."""
+    def __init__(self, health_interval=30, max_servers=4):
+        self.health_interval = health_interval
+        # a new DNS address gives new options, the servers of the old ones keep running for the jobs connected to them
+        self.max_servers = max_servers
+        self._servers = {}
+        self._lock = threading.Lock()
+
+    def get_job_env(self, launch_options):
+        """Environment variables which let a job connect to the browser of its options, empty if it is not ready."""
+        key = json.dumps(launch_options, sort_keys=True)
+        with self._lock:
+            server = self._servers.get(key)
+            if server is None:
+                if len(self._servers) >= self.max_servers:
+                    return {}
+                server = self._servers[key] = BrowserServer(launch_options, self.health_interval)
+                server.start_async()
+        return server.get_job_env()
+
+    def stop(self):
+        with self._lock:
+            servers = list(self._servers.values())
+        for server in servers:
+            server.stop()
@@ -0,0 +1,114 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+"""
+Control plane facts (chart versions, DNS domain, storage class, elastic password) read from the cluster in one pass.
+"""
+import base64
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.discovery_cache import discovery_cache
+from utils.helper import Helper
+
+# do not import env.py or util.py in this file
+QUERIES = {
+    "releases": "helm list -A -o json",
+    "ingresses": "kubectl get ingress -A --field-selector metadata.name=router -o json",
+    "storageClasses": "kubectl get storageclass -o json",
+    "elasticSecret": "kubectl get secret -n elastic-system dp-config-es-es-elastic-user --ignore-not-found -o json",
+}
+DEFAULT_STORAGE_CLASS_ANNOTATIONS = (
+    "storageclass.kubernetes.io/is-default-class",
+    "storageclass.beta.kubernetes.io/is-default-class",
+)
+
+class ClusterDiscovery:
+    def __init__(self, cache):
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._facts = None
+        self._discovered_at = 0
+
+    def get(self, name):
+        """Return the fact from the cache, or from a discovery pass, "" if it is not found."""
+        value = self.cache.get(name)
+        if value is None:
+            value = self.discover().get(name)
+        return value or ""
+
+    def discover(self):
+        """Run the discovery pass and cache its facts, the facts of the last pass are used until the cache TTL has passed.
+        Without a TTL they are used for the life of the process, the TTL only disables the disk cache then."""
+        with self._lock:
+            expired = self.cache.ttl > 0 and time.time() - self._discovered_at >= self.cache.ttl
+            if self._facts is None or expired:
+                self._facts = self.parse(self.run_queries())
+                self._discovered_at = time.time()
+                self.cache.update(self._facts)
+            return self._facts
+
+    @staticmethod
+    def run_queries():
+        """Output of all QUERIES, None for a query which failed."""
+        with ThreadPoolExecutor(max_workers=len(QUERIES)) as executor:
+            futures = {key: executor.submit(Helper.get_command_output, command) for key, command in QUERIES.items()}
+            return {key: future.result() for key, future in futures.items()}
+
+    @classmethod
+    def parse(cls, outputs):
+        releases = cls._load(outputs.get("releases")) or []
+        base_version = cls._get_chart_version(releases, "platform-base")
+        return {
+            "cpVersion": ".".join(base_version.split(".")[:2]),
+            "cpPlatformBootstrapVersion": cls._get_chart_version(releases, "platform-bootstrap"),
+            "cpPlatformBaseVersion": base_version,
+            "cpDnsDomain": cls._get_dns_domain(cls._load(outputs.get("ingresses")) or {}),
+            "storageClass": cls._get_default_storage_class(cls._load(outputs.get("storageClasses")) or {}),
+            "elasticPassword": cls._get_elastic_password(cls._load(outputs.get("elasticSecret")) or {}),
+        }
+
+    @staticmethod
+    def _load(output):
+        if not output:
+            return None
+        try:
+            return json.loads(output)
+        except ValueError as e:
+            print(f"[WARNING] Failed to parse the cluster discovery output: {e}")
+            return None
+
+    @staticmethod
+    def _get_chart_version(releases, chart_name):
+        # the chart of a release is <chart name>-<chart version>
+        prefix = f"{chart_name}-"
+        for release in releases:
+            chart = release.get("chart") or ""
+            if chart.startswith(prefix) and chart[len(prefix):][:1].isdigit():
+                return chart[len(prefix):]
+        return ""
+
+    @staticmethod
+    def _get_dns_domain(ingresses):
+        # the host of the router is <prefix>.<domain> or *.<prefix>.<domain>
+        for ingress in ingresses.get("items", []):
+            for rule in ingress.get("spec", {}).get("rules") or []:
+                host = (rule.get("host") or "").lstrip("*").lstrip(".")
+                if host:
+                    return host.split(".", 1)[1] if "." in host else ""
+        return ""
+
+    @staticmethod
+    def _get_default_storage_class(storage_classes):
+        for storage_class in storage_classes.get("items", []):
+            annotations = storage_class.get("metadata", {}).get("annotations") or {}
+            if any(annotations.get(key) == "true" for key in DEFAULT_STORAGE_CLASS_ANNOTATIONS):
+                return storage_class["metadata"]["name"]
+        return ""
+
+    @staticmethod
+    def _get_elastic_password(secret):
+        password = (secret.get("data") or {}).get("elastic")
+        return base64.b64decode(password).decode() if password else ""
+
+cluster_discovery = ClusterDiscovery(discovery_cache)
@@ -0,0 +1,85 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+"""
+On disk cache of the values discovered from the cluster, see TP_AUTO_DISCOVERY_CACHE_TTL.
+"""
+import json
+import os
+import time
+
+from utils.atomic_file import atomic_write
+from utils.helper import Helper
+
+# do not import env.py or util.py in this file
+TP_AUTO_CACHE_PATH = os.environ.get("TP_AUTO_CACHE_PATH") or os.path.join(os.path.expanduser("~"), ".cache", "tp-auto")
+TP_AUTO_DISCOVERY_CACHE_TTL = int(os.environ.get("TP_AUTO_DISCOVERY_CACHE_TTL") or 300)
+
+class DiscoveryCache:
+    def __init__(self, path, ttl):
+        self.path = path
+        self.ttl = ttl
+        self._cluster_key = None
+
+    def get(self, name):
+        """Return the cached value of name for the current cluster, None if it is not cached or expired."""
+        if self.ttl <= 0:
+            return None
+        entry = self._read().get(self.get_cluster_key(), {}).get(name)
+        if entry and time.time() - entry["time"] < self.ttl:
+            return entry["value"]
+        return None
+
+    def update(self, values):
+        """Cache the non-empty values ({name: value}) for the current cluster."""
+        values = {name: value for name, value in values.items() if value}
+        if self.ttl <= 0 or not values:
+            return
+        self._write(self.get_cluster_key(), values)
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def get_cluster_key(self):
+        """<kubeconfig path>#<current context>, the kubeconfig is the same as the one used by helm and kubectl."""
+        if self._cluster_key is None:
+            kubeconfig = Helper.get_env_vars().get("KUBECONFIG") or os.path.join(os.path.expanduser("~"), ".kube", "config")
+            paths = [os.path.abspath(os.path.expanduser(path)) for path in kubeconfig.split(os.pathsep) if path]
+            self._cluster_key = f"{os.pathsep.join(paths)}#{self._get_current_context(paths)}"
+        return self._cluster_key
+
+    @staticmethod
+    def _get_current_context(paths):
+        # kubectl uses the first current-context set in the kubeconfig files
+        import yaml
+        for path in paths:
+            try:
+                with open(path, "r") as f:
+                    config = yaml.safe_load(f) or {}
+            except (OSError, yaml.YAMLError):
+                continue
+            if isinstance(config, dict) and config.get("current-context"):
+                return config["current-context"]
+        return ""
+
+    def _read(self):
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, cluster_key, values):
+        # read again right before writing, to keep the values written by other processes in the meantime
+        data = self._read()
+        now = time.time()
+        data.setdefault(cluster_key, {}).update({name: {"value": value, "time": now} for name, value in values.items()})
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # the elastic password is cached as well
+            atomic_write(self.path, lambda f: json.dump(data, f, indent=2), mode=0o600)
+        except OSError as e:
+            print(f"[WARNING] Failed to write the discovery cache {self.path}: {e}")
+
+discovery_cache = DiscoveryCache(os.path.join(TP_AUTO_CACHE_PATH, "discovery.json"), TP_AUTO_DISCOVERY_CACHE_TTL)
@@ -0,0 +1,81 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+"""
+Address of the wildcard DNS name of the Control Plane domain, see TP_AUTO_DNS_CACHE_TTL.
+"""
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+
+from utils.atomic_file import atomic_write
+from utils.discovery_cache import TP_AUTO_CACHE_PATH
+
+TP_AUTO_DNS_CACHE_TTL = int(os.environ.get("TP_AUTO_DNS_CACHE_TTL") or 300)
+
+class DnsCache:
+    def __init__(self, path, ttl):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # domain -> (address, resolved at)
+        self._addresses = {}
+
+    def resolve(self, domain):
+        """IPv4 address of *.<domain>, "" if it can not be resolved. Failed lookups are not cached."""
+        with self._lock:
+            # the disk entry may have been resolved by another process after the one in memory
+            for entry in (self._addresses.get(domain), self._read().get(domain)):
+                if entry and self._is_fresh(entry):
+                    self._addresses[domain] = entry
+                    return entry[0]
+            address = self.lookup(domain)
+            if address:
+                self._addresses[domain] = (address, time.time())
+                if self.ttl > 0:
+                    self._write(domain, address)
+            return address
+
+    def get(self, domain):
+        """Cached address of *.<domain>, "" if it has not been resolved or has expired, there is no lookup."""
+        with self._lock:
+            for entry in (self._addresses.get(domain), self._read().get(domain)):
+                if entry and self._is_fresh(entry):
+                    return entry[0]
+            return ""
+
+    @staticmethod
+    def lookup(domain):
+        # a wildcard record answers the literal "*" label, a random label is tried when the resolver rejects it
+        for name in (f"*.{domain}", f"{uuid.uuid4().hex[:12]}.{domain}"):
+            try:
+                addresses = socket.getaddrinfo(name, None, socket.AF_INET, socket.SOCK_STREAM)
+            except (socket.gaierror, UnicodeError):
+                continue
+            if addresses:
+                return addresses[0][4][0]
+        print(f"[WARNING] Unable to resolve *.{domain}")
+        return ""
+
+    def _is_fresh(self, entry):
+        address, resolved_at = entry
+        return bool(address) and time.time() - resolved_at < self.ttl
+
+    def _read(self):
+        try:
+            with open(self.path, "r") as f:
+                return {domain: tuple(entry) for domain, entry in json.load(f).items()}
+        except (OSError, ValueError, TypeError):
+            return {}
+
+    def _write(self, domain, address):
+        data = self._read()
+        data[domain] = (address, time.time())
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            atomic_write(self.path, lambda f: json.dump(data, f, indent=2))
+        except OSError as e:
+            print(f"[WARNING] Failed to write the DNS cache {self.path}: {e}")
+
+dns_cache = DnsCache(os.path.join(TP_AUTO_CACHE_PATH, "dns.json"), TP_AUTO_DNS_CACHE_TTL)
@@ -4,12 +4,19 @@ import socket
 import os
 import pytz
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
 from utils.color_logger import ColorLogger
+from utils.cluster_discovery import cluster_discovery
 from utils.helper import Helper
 
+# DNS domain of the Control Plane when it is neither set nor discovered
+DEFAULT_CP_DNS_DOMAIN = "localhost.dataplanes.pro"
+
 @dataclass(frozen=True)
 class EnvConfig:
+    # Values from the cluster (helm, kubectl) or from files are cached_property, they are evaluated on first use,
+    # so importing this module does not run any lookup. Cluster values come from one discovery pass, shared by processes.
     IS_HEADLESS = Helper.is_headless()
 
     GITHUB_TOKEN = os.getenv("GITHUB_TOKEN") or "" # GitHub token is not used for now
@@ -30,11 +37,15 @@ class EnvConfig:
     TP_CLUSTER_SERVICE_CIDR = os.environ.get("TP_CLUSTER_SERVICE_CIDR") or ""
 
     # automation setup
-    TP_AUTO_CP_VERSION = os.environ.get("TP_AUTO_CP_VERSION") or Helper.get_cp_version() or "1.4"
+    TP_AUTO_CP_VERSION = cached_property(lambda env: os.environ.get("TP_AUTO_CP_VERSION") or cluster_discovery.get("cpVersion") or "1.4")
     TP_AUTO_REPORT_PATH = os.environ.get("TP_AUTO_REPORT_PATH") or os.path.join(os.getcwd(), "report")
     TP_AUTO_REPORT_YAML_FILE = os.environ.get("TP_AUTO_REPORT_YAML_FILE") or "report.yaml"  # automation script will create this file
     TP_AUTO_REPORT_TXT_FILE = os.environ.get("TP_AUTO_REPORT_TXT_FILE") or "report.txt"    # this is the final report file for user to view
+    TP_AUTO_REPORT_JSON_FILE = os.environ.get("TP_AUTO_REPORT_JSON_FILE") or "report.json"  # the same report as JSON for tools
+    TP_AUTO_ENV_INFO_FORMAT = os.environ.get("TP_AUTO_ENV_INFO_FORMAT") or "text"  # page_env prints text or json
     TP_AUTO_REPORT_TRACE = os.environ.get("TP_AUTO_REPORT_TRACE", "true").lower() == "true"
+    TP_AUTO_REPORT_RECORD_ON_FAILURE = os.environ.get("TP_AUTO_REPORT_RECORD_ON_FAILURE", "false").lower() == "true"  # keep video and trace only when a case fails
+    TP_AUTO_DNS_PIN = os.environ.get("TP_AUTO_DNS_PIN", "false").lower() == "true"  # keep the resolved CP address in the report
     TP_AUTO_IS_CREATE_DP = os.environ.get("TP_AUTO_IS_CREATE_DP", "false").lower() == "true"
     TP_AUTO_IS_CREATE_BMDP = os.environ.get("TP_AUTO_IS_CREATE_BMDP", "true").lower() == "true"
     TP_AUTO_IS_ENABLE_RVDM = os.environ.get("TP_AUTO_IS_ENABLE_RVDM", "true").lower() == "true"
@@ -100,31 +111,31 @@ class EnvConfig:
 
     # CP_DNS_DOMAIN
     TP_AUTO_CP_INSTANCE_ID = os.environ.get("TP_AUTO_CP_INSTANCE_ID") or "cp1"
-    TP_AUTO_CP_DNS_DOMAIN = os.environ.get("TP_AUTO_CP_DNS_DOMAIN") or Helper.get_cp_dns_domain() or "localhost.dataplanes.pro"
-    TP_AUTO_CP_SERVICE_DNS_DOMAIN = os.environ.get("TP_AUTO_CP_SERVICE_DNS_DOMAIN") or f"{TP_AUTO_CP_INSTANCE_ID}-my.{TP_AUTO_CP_DNS_DOMAIN}"
+    TP_AUTO_CP_DNS_DOMAIN = cached_property(lambda env: os.environ.get("TP_AUTO_CP_DNS_DOMAIN") or cluster_discovery.get("cpDnsDomain") or DEFAULT_CP_DNS_DOMAIN)
+    TP_AUTO_CP_SERVICE_DNS_DOMAIN = cached_property(lambda env: os.environ.get("TP_AUTO_CP_SERVICE_DNS_DOMAIN") or f"{env.TP_AUTO_CP_INSTANCE_ID}-my.{env.TP_AUTO_CP_DNS_DOMAIN}")
     TP_AUTO_CP_DNS_DOMAIN_PREFIX_BWCE = os.environ.get("TP_AUTO_CP_DNS_DOMAIN_PREFIX_BWCE") or "bwce"
     TP_AUTO_CP_DNS_DOMAIN_PREFIX_BW5CE = os.environ.get("TP_AUTO_CP_DNS_DOMAIN_PREFIX_BW5CE") or "bw5ce"
     TP_AUTO_CP_DNS_DOMAIN_PREFIX_FLOGO = os.environ.get("TP_AUTO_CP_DNS_DOMAIN_PREFIX_FLOGO") or "flogo"
     TP_AUTO_CP_DNS_DOMAIN_PREFIX_TIBCOHUB = os.environ.get("TP_AUTO_CP_DNS_DOMAIN_PREFIX_TIBCOHUB") or "tibcohub"
 
-    TP_AUTO_LOGIN_URL = os.environ.get("TP_AUTO_LOGIN_URL") or f"https://{DP_HOST_PREFIX}.{TP_AUTO_CP_SERVICE_DNS_DOMAIN}/cp/login"
-    TP_AUTO_MAIL_URL = os.environ.get("TP_AUTO_MAIL_URL") or f"https://mail.{TP_AUTO_CP_DNS_DOMAIN}/#/"
-    TP_AUTO_ADMIN_URL = os.environ.get("TP_AUTO_ADMIN_URL") or f"https://admin.{TP_AUTO_CP_SERVICE_DNS_DOMAIN}/admin"
+    TP_AUTO_LOGIN_URL = cached_property(lambda env: os.environ.get("TP_AUTO_LOGIN_URL") or f"https://{env.DP_HOST_PREFIX}.{env.TP_AUTO_CP_SERVICE_DNS_DOMAIN}/cp/login")
+    TP_AUTO_MAIL_URL = cached_property(lambda env: os.environ.get("TP_AUTO_MAIL_URL") or f"https://mail.{env.TP_AUTO_CP_DNS_DOMAIN}/#/")
+    TP_AUTO_ADMIN_URL = cached_property(lambda env: os.environ.get("TP_AUTO_ADMIN_URL") or f"https://admin.{env.TP_AUTO_CP_SERVICE_DNS_DOMAIN}/admin")
 
     # elastic and prometheus
-    TP_AUTO_ELASTIC_URL = os.environ.get("TP_AUTO_ELASTIC_URL") or f"https://elastic.{TP_AUTO_CP_DNS_DOMAIN}/"
-    TP_AUTO_KIBANA_URL = f"https://kibana.{TP_AUTO_CP_DNS_DOMAIN}/"
+    TP_AUTO_ELASTIC_URL = cached_property(lambda env: os.environ.get("TP_AUTO_ELASTIC_URL") or f"https://elastic.{env.TP_AUTO_CP_DNS_DOMAIN}/")
+    TP_AUTO_KIBANA_URL = cached_property(lambda env: f"https://kibana.{env.TP_AUTO_CP_DNS_DOMAIN}/")
     TP_AUTO_ELASTIC_USER = os.environ.get("TP_AUTO_ELASTIC_USER") or "elastic"
-    TP_AUTO_ELASTIC_PASSWORD = os.environ.get("TP_AUTO_ELASTIC_PASSWORD") or Helper.get_elastic_password()
-    TP_AUTO_PROMETHEUS_URL = os.environ.get("TP_AUTO_PROMETHEUS_URL") or f"https://prometheus-internal.{TP_AUTO_CP_DNS_DOMAIN}/"
+    TP_AUTO_ELASTIC_PASSWORD = cached_property(lambda env: os.environ.get("TP_AUTO_ELASTIC_PASSWORD") or cluster_discovery.get("elasticPassword"))
+    TP_AUTO_PROMETHEUS_URL = cached_property(lambda env: os.environ.get("TP_AUTO_PROMETHEUS_URL") or f"https://prometheus-internal.{env.TP_AUTO_CP_DNS_DOMAIN}/")
     TP_AUTO_PROMETHEUS_USER = os.environ.get("TP_AUTO_PROMETHEUS_USER") or ""
     TP_AUTO_PROMETHEUS_PASSWORD = os.environ.get("TP_AUTO_PROMETHEUS_PASSWORD") or ""
 
     # fqdn
-    TP_AUTO_FQDN_BWCE = os.environ.get("TP_AUTO_FQDN_BWCE") or f"{TP_AUTO_CP_DNS_DOMAIN_PREFIX_BWCE}.{TP_AUTO_CP_DNS_DOMAIN}"
-    TP_AUTO_FQDN_BW5CE = os.environ.get("TP_AUTO_FQDN_BW5CE") or f"{TP_AUTO_CP_DNS_DOMAIN_PREFIX_BW5CE}.{TP_AUTO_CP_DNS_DOMAIN}"
-    TP_AUTO_FQDN_FLOGO = os.environ.get("TP_AUTO_FQDN_FLOGO") or f"{TP_AUTO_CP_DNS_DOMAIN_PREFIX_FLOGO}.{TP_AUTO_CP_DNS_DOMAIN}"
-    TP_AUTO_FQDN_TIBCOHUB = os.environ.get("TP_AUTO_FQDN_TIBCOHUB") or f"{TP_AUTO_CP_DNS_DOMAIN_PREFIX_TIBCOHUB}.{TP_AUTO_CP_DNS_DOMAIN}"
+    TP_AUTO_FQDN_BWCE = cached_property(lambda env: os.environ.get("TP_AUTO_FQDN_BWCE") or f"{env.TP_AUTO_CP_DNS_DOMAIN_PREFIX_BWCE}.{env.TP_AUTO_CP_DNS_DOMAIN}")
+    TP_AUTO_FQDN_BW5CE = cached_property(lambda env: os.environ.get("TP_AUTO_FQDN_BW5CE") or f"{env.TP_AUTO_CP_DNS_DOMAIN_PREFIX_BW5CE}.{env.TP_AUTO_CP_DNS_DOMAIN}")
+    TP_AUTO_FQDN_FLOGO = cached_property(lambda env: os.environ.get("TP_AUTO_FQDN_FLOGO") or f"{env.TP_AUTO_CP_DNS_DOMAIN_PREFIX_FLOGO}.{env.TP_AUTO_CP_DNS_DOMAIN}")
+    TP_AUTO_FQDN_TIBCOHUB = cached_property(lambda env: os.environ.get("TP_AUTO_FQDN_TIBCOHUB") or f"{env.TP_AUTO_CP_DNS_DOMAIN_PREFIX_TIBCOHUB}.{env.TP_AUTO_CP_DNS_DOMAIN}")
 
     # capabilities url
     TP_AUTO_EMS_CAPABILITY_SERVER_NAME = os.environ.get("TP_AUTO_EMS_CAPABILITY_SERVER_NAME") or "ems-sn"
@@ -141,7 +152,7 @@ class EnvConfig:
     TP_AUTO_INGRESS_CONTROLLER_TIBCOHUB = os.environ.get("TP_AUTO_INGRESS_CONTROLLER_TIBCOHUB") or f"{TP_AUTO_INGRESS_CONTROLLER}-{TP_AUTO_CP_DNS_DOMAIN_PREFIX_TIBCOHUB}"
     # TP_AUTO_INGRESS_CONTROLLER_KEYS = os.environ.get("TP_AUTO_INGRESS_CONTROLLER_KEYS") or ""
     # TP_AUTO_INGRESS_CONTROLLER_VALUES = os.environ.get("TP_AUTO_INGRESS_CONTROLLER_VALUES") or ""
-    TP_AUTO_STORAGE_CLASS = os.environ.get("TP_AUTO_STORAGE_CLASS") or Helper.get_storage_class()
+    TP_AUTO_STORAGE_CLASS = cached_property(lambda env: os.environ.get("TP_AUTO_STORAGE_CLASS") or cluster_discovery.get("storageClass"))
     # Due to the fuzzy matching of the dp name by Playwright
     # At most 0-9 dp are supported, if more dp is needed, the matching rule of dp selector is required
     TP_AUTO_MAX_DATA_PLANE = 9
@@ -153,7 +164,7 @@ class EnvConfig:
     BW5CE_APP_NAME = os.environ.get("BW5CE_APP_NAME") or BW5CE_APP_FILE_NAME.removesuffix(".ear")
     FLOGO_APP_FILE_NAME = os.environ.get("TP_AUTO_FLOGO_APP_FILE_NAME") or "flogo.json"
     # need to make sure the flogo app name is unique and lower case in the above JSON file
-    FLOGO_APP_NAME = os.environ.get("FLOGO_APP_NAME") or Helper.get_app_name(FLOGO_APP_FILE_NAME)
+    FLOGO_APP_NAME = cached_property(lambda env: os.environ.get("FLOGO_APP_NAME") or Helper.get_app_name(env.FLOGO_APP_FILE_NAME))
 
     def pre_check(self):
         current_time = self.RETRY_TIME.strftime("%Y-%m-%d %H:%M:%S")
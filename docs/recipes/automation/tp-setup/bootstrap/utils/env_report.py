@@ -0,0 +1,213 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+import json
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import URLError, HTTPError
+
+from utils.env import ENV
+from utils.cluster_discovery import cluster_discovery
+from utils.report import ReportYaml
+from utils.report_document import to_yq_text
+
+STR_NUM = 90
+COL_SPACE = 30
+
+def is_url_accessible(url, timeout=5):
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.status < 400
+    except (HTTPError, URLError):
+        return False
+
+class EnvReport:
+    """
+    Environment shown to the user: control plane versions, login credentials and the data planes of report.yaml.
+    report.yaml is read once and the slow lookups (cluster discovery, URL checks) run in parallel.
+    to_text() renders the console layout, to_dict() the same data for JSON clients.
+    """
+    CAPABILITY_FIELDS = [
+        ("provisionConnector", "Provision connector"),
+        ("appBuild", "Create App Build"),
+    ]
+    APP_FIELDS = [
+        ("status", "Status"),
+        ("endpointPublic", "Set endpoint to Public"),
+        ("enableTrace", "Enabled trace"),
+        ("testedEndpoint", "Tested Endpoint"),
+    ]
+
+    def __init__(self, is_print_cp=False, is_print_auth=True, is_print_dp=True):
+        self.is_print_cp = is_print_cp
+        self.is_print_auth = is_print_auth
+        self.is_print_dp = is_print_dp
+        self.data = self._build()
+
+    @staticmethod
+    def get_dataplane_fields():
+        """(report key, label, value shown when the key is true)"""
+        return [
+            ("o11yConfig", "DataPlane O11y Configured", "true"),
+            ("o11yWidget", "Observability Widget", "true"),
+            ("storage", "DataPlane storage", ENV.TP_AUTO_STORAGE_CLASS),
+            (ENV.TP_AUTO_INGRESS_CONTROLLER_BWCE, "DataPlane ingress", ENV.TP_AUTO_INGRESS_CONTROLLER_BWCE),
+            (ENV.TP_AUTO_INGRESS_CONTROLLER_FLOGO, "DataPlane ingress", ENV.TP_AUTO_INGRESS_CONTROLLER_FLOGO),
+            (ENV.TP_AUTO_INGRESS_CONTROLLER_TIBCOHUB, "DataPlane ingress", ENV.TP_AUTO_INGRESS_CONTROLLER_TIBCOHUB),
+        ]
+
+    def to_dict(self):
+        return self.data
+
+    def to_json(self, indent=None):
+        return json.dumps(self.data, indent=indent, default=str)
+
+    def to_text(self):
+        lines = []
+        if self.is_print_cp:
+            cp = self.data["controlPlane"]
+            lines += ["=" * STR_NUM, f"{'Control Plane information': ^{STR_NUM}}",
+                      f"platform-bootstrap:  {cp['platformBootstrapVersion']}",
+                      f"platform-base:  {cp['platformBaseVersion']}"]
+            if cp["kubeconfig"]:
+                lines.append(f"KUBECONFIG:  {cp['kubeconfig']}")
+        if not self.is_print_auth and not self.is_print_dp:
+            return "\n".join(lines)
+
+        lines.append("=" * STR_NUM)
+        if self.is_print_auth:
+            lines += self._login_lines(self.data["login"])
+        if self.is_print_dp:
+            lines += self._observability_lines(self.data["observability"])
+            lines += self._dataplane_lines(self.data["dataPlanes"])
+        lines.append("=" * STR_NUM)
+        return "\n".join(lines)
+
+    def _build(self):
+        checks = {}
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            if self.is_print_cp:
+                checks["platformBootstrapVersion"] = executor.submit(cluster_discovery.get, "cpPlatformBootstrapVersion")
+                checks["platformBaseVersion"] = executor.submit(cluster_discovery.get, "cpPlatformBaseVersion")
+            if self.is_print_auth:
+                for url in (ENV.TP_AUTO_MAIL_URL, ENV.TP_AUTO_ADMIN_URL, ENV.TP_AUTO_LOGIN_URL):
+                    checks.setdefault(url, executor.submit(is_url_accessible, url))
+            # report.yaml is read while the lookups are running
+            data = {"dataPlanes": self._get_dataplanes()} if self.is_print_dp else {}
+            results = {key: future.result() for key, future in checks.items()}
+
+        if self.is_print_cp:
+            data["controlPlane"] = {
+                "platformBootstrapVersion": results["platformBootstrapVersion"],
+                "platformBaseVersion": results["platformBaseVersion"],
+                "kubeconfig": ENV.TP_AUTO_KUBECONFIG,
+            }
+        if self.is_print_auth:
+            data["login"] = {
+                "mail": {"url": ENV.TP_AUTO_MAIL_URL, "accessible": results[ENV.TP_AUTO_MAIL_URL]},
+                "admin": {"url": ENV.TP_AUTO_ADMIN_URL, "accessible": results[ENV.TP_AUTO_ADMIN_URL],
+                          "email": ENV.CP_ADMIN_EMAIL, "password": ENV.CP_ADMIN_PASSWORD},
+                "user": {"url": ENV.TP_AUTO_LOGIN_URL, "accessible": results[ENV.TP_AUTO_LOGIN_URL],
+                         "email": ENV.DP_USER_EMAIL, "password": ENV.DP_USER_PASSWORD},
+            }
+        if self.is_print_dp:
+            data["observability"] = {
+                "elastic": {"url": ENV.TP_AUTO_ELASTIC_URL, "kibanaUrl": ENV.TP_AUTO_KIBANA_URL,
+                            "user": ENV.TP_AUTO_ELASTIC_USER, "password": ENV.TP_AUTO_ELASTIC_PASSWORD},
+                "prometheus": {"url": ENV.TP_AUTO_PROMETHEUS_URL,
+                               "user": ENV.TP_AUTO_PROMETHEUS_USER, "password": ENV.TP_AUTO_PROMETHEUS_PASSWORD},
+            }
+        return data
+
+    def _get_dataplanes(self):
+        """Data planes, capabilities and apps with the fields shown to the user, from one snapshot of report.yaml."""
+        model = ReportYaml.document.read()
+        dataplane_keys = {key for key, _, _ in self.get_dataplane_fields()}
+        dataplanes = []
+        for dp_name, dp in model.children().items():
+            capabilities = []
+            for capability_name, capability in dp.children().items():
+                apps = [{"name": app_name, **self._get_fields(app, [key for key, _ in self.APP_FIELDS])}
+                        for app_name, app in capability.children().items()]
+                capabilities.append({"name": capability_name,
+                                     **self._get_fields(capability, [key for key, _ in self.CAPABILITY_FIELDS]),
+                                     "apps": apps})
+            dataplanes.append({"name": dp_name, **self._get_fields(dp, dataplane_keys), "capabilities": capabilities})
+        return dataplanes
+
+    @staticmethod
+    def _get_fields(node, keys):
+        return {key: node.fields[key] for key in keys if node.fields.get(key) is not None}
+
+    @staticmethod
+    def _url_line(label, item):
+        return f"{label:<{COL_SPACE}}{item['url']} {'√' if item['accessible'] else 'X'}"
+
+    def _login_lines(self, login):
+        return [
+            "-" * STR_NUM,
+            f"{'Login Credentials': ^{STR_NUM}}",
+            "-" * STR_NUM,
+            self._url_line("Mail URL:", login["mail"]),
+            "-" * STR_NUM,
+            self._url_line("CP Admin URL:", login["admin"]),
+            f"{'Admin Email:':<{COL_SPACE}}{login['admin']['email']}",
+            f"{'Admin Password:':<{COL_SPACE}}{login['admin']['password']}",
+            "-" * STR_NUM,
+            self._url_line("CP Login URL:", login["user"]),
+            f"{'User Email:':<{COL_SPACE}}{login['user']['email']}",
+            f"{'User Password:':<{COL_SPACE}}{login['user']['password']}",
+        ]
+
+    @staticmethod
+    def _observability_lines(observability):
+        elastic, prometheus = observability["elastic"], observability["prometheus"]
+        lines = [
+            "-" * STR_NUM,
+            f"{'Elastic/Kibana/Prometheus Credentials': ^{STR_NUM}}",
+            "-" * STR_NUM,
+            f"{'Elastic URL:':<{COL_SPACE}}{elastic['url']}",
+            f"{'Kibana URL:':<{COL_SPACE}}{elastic['kibanaUrl']}",
+            f"{'User Name:':<{COL_SPACE}}{elastic['user']}",
+            f"{'User Password:':<{COL_SPACE}}{elastic['password']}",
+            "-" * STR_NUM,
+            f"{'Prometheus URL:':<{COL_SPACE}}{prometheus['url']}",
+        ]
+        if prometheus["user"] != "":
+            lines.append(f"{'User Name:':<{COL_SPACE}}{prometheus['user']}")
+        if prometheus["password"] != "":
+            lines.append(f"{'User Password:':<{COL_SPACE}}{prometheus['password']}")
+        lines.append("-" * STR_NUM)
+        return lines
+
+    def _dataplane_lines(self, dataplanes):
+        if len(dataplanes) == 0:
+            return []
+        lines = [f"{'Data Plane, Capability, App': ^{STR_NUM}}", "-" * STR_NUM]
+        for dp in dataplanes:
+            lines.append(f"{'DataPlane Name':<{COL_SPACE}}{dp['name']}")
+            for field_key, field_label, field_value in self.get_dataplane_fields():
+                if to_yq_text(dp.get(field_key)) == "true":
+                    lines.append(f"{field_label:<{COL_SPACE}}{field_value}")
+
+            capabilities = dp["capabilities"]
+            if len(capabilities) > 0:
+                lines.append(f"{'Provisioned capabilities':<{COL_SPACE}}{[cap['name'].upper() for cap in capabilities]}")
+
+            for capability in capabilities:
+                if len(capability["apps"]) > 0 or to_yq_text(capability.get("provisionConnector")) or to_yq_text(capability.get("appBuild")):
+                    lines.append(f"{capability['name'].capitalize()}")
+                lines += self._field_lines(capability, self.CAPABILITY_FIELDS)
+
+                for app in capability["apps"]:
+                    lines.append(f"{'  App Name':<{COL_SPACE}}{app['name']}")
+                    lines += self._field_lines(app, self.APP_FIELDS)
+        return lines
+
+    @staticmethod
+    def _field_lines(item, fields):
+        lines = []
+        for field_key, field_label in fields:
+            # the same text as yq prints for the value
+            field_value = to_yq_text(item.get(field_key))
+            if field_value:
+                lines.append(f"    {field_label:<{COL_SPACE}}{field_value}")
+        return lines
@@ -8,15 +8,16 @@ import platform
 from pathlib import Path
 
 from utils.color_logger import ColorLogger
+from utils.upload_store import UploadStore
 
 # do not import env.py or util.py in this file
 class Helper:
     @staticmethod
-    def is_headless():
+    def is_headless(env_vars=None):
         # headless mode is enabled in docker
         if os.path.exists("/.dockerenv"):
             return True
-        return os.environ.get("HEADLESS", "true").lower() == "true"
+        return (os.environ if env_vars is None else env_vars).get("HEADLESS", "true").lower() == "true"
 
     @staticmethod
     def get_windows_bash():
@@ -106,30 +107,6 @@ class Helper:
             env_vars["KUBECONFIG"] = tp_auto_kubeconfig
         return env_vars
 
-    @staticmethod
-    def get_cp_dns_domain():
-        return Helper.get_command_output("kubectl get ingress -A | awk '$2 == \"router\" {print $4; exit}' | sed -E 's/^\\*?\\.//' | cut -d. -f2-")
-
-    @staticmethod
-    def get_elastic_password():
-        return Helper.get_command_output("kubectl get secret -n elastic-system dp-config-es-es-elastic-user -o=jsonpath='{.data.elastic}' | base64 --decode; echo")
-
-    @staticmethod
-    def get_cp_version():
-        return Helper.get_command_output("helm ls -A | grep platform-base | awk '{print $9}' | awk -F 'platform-base-' '{print $2}' | cut -d'.' -f1,2")
-
-    @staticmethod
-    def get_cp_platform_bootstrap_version():
-        return Helper.get_command_output(r"helm list --all-namespaces | grep platform-bootstrap | sed -n 's/.*platform-bootstrap-\(.*\)[[:space:]].*/\1/p' | sed 's/[[:space:]].*//'")
-
-    @staticmethod
-    def get_cp_platform_base_version():
-        return Helper.get_command_output(r"helm list --all-namespaces | grep platform-base | sed -n 's/.*platform-base-\(.*\)[[:space:]].*/\1/p' | sed 's/[[:space:]].*//'")
-
-    @staticmethod
-    def get_storage_class():
-        return Helper.get_command_output("kubectl get sc | awk '/\\(default\\)/ {print $1}'")
-
     @staticmethod
     def get_app_file_fullpath(app_file_name):
         file_path = os.path.join(os.path.dirname(__file__), "..", "upload", app_file_name)
@@ -142,9 +119,13 @@ class Helper:
     @staticmethod
     def get_app_name(app_file_name):
         file_path = Helper.get_app_file_fullpath(app_file_name)
-        with open(file_path, "r") as f:
-            flogo_json = json.load(f)
-            app_name = flogo_json["name"]
+        # the app name of an uploaded file is parsed once at upload time
+        metadata = UploadStore.read_metadata(file_path) or {}
+        app_name = metadata.get("appName")
+        if app_name is None:
+            with open(file_path, "r") as f:
+                flogo_json = json.load(f)
+                app_name = flogo_json["name"]
 
         if app_name == "":
             ColorLogger.error(f"The app name is empty in file {file_path}.")
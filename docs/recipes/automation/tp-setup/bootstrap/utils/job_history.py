@@ -0,0 +1,151 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+
+# request parameters with these words in the name are not stored
+SECRET_PARAM_PATTERN = re.compile(r"PASSWORD|PASSWD|TOKEN|SECRET|CREDENTIAL|PRIVATE_KEY|API_KEY|AUTH", re.IGNORECASE)
+REDACTED = "******"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job (
+    id TEXT PRIMARY KEY,
+    case_name TEXT NOT NULL,
+    dp_name TEXT,
+    state TEXT NOT NULL,
+    params TEXT,
+    queued_at REAL NOT NULL,
+    started_at REAL,
+    ended_at REAL,
+    wait_seconds REAL,
+    run_seconds REAL,
+    returncode INTEGER,
+    first_log_seq INTEGER,
+    last_log_seq INTEGER,
+    steps TEXT,
+    resources TEXT
+);
+CREATE INDEX IF NOT EXISTS job_case_queued ON job (case_name, queued_at);
+CREATE INDEX IF NOT EXISTS job_dp_queued ON job (dp_name, queued_at);
+CREATE INDEX IF NOT EXISTS job_queued ON job (queued_at);
+"""
+
+def redact_params(params):
+    return {key: REDACTED if SECRET_PARAM_PATTERN.search(key) else value for key, value in params.items()}
+
+def parse_time(value):
+    """Epoch seconds or ISO 8601 date/time (local time if no timezone is given)."""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+def percentile(sorted_values, percent):
+    """Nearest-rank percentile of sorted values."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+class JobHistory:
+    """
+    Persistent history of jobs in SQLite: case, data plane, redacted parameters, timing, exit code,
+    log offsets, step durations and resource usage.
+    """
+    def __init__(self, db_file):
+        self.db_file = db_file
+        os.makedirs(os.path.dirname(os.path.abspath(db_file)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_file, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            # jobs which were queued or running when the server stopped
+            self._conn.execute("UPDATE job SET state = 'interrupted' WHERE state IN ('queued', 'running')")
+
+    def record(self, job):
+        """Insert or update the job, history errors never fail the job."""
+        job_dict = job.to_dict()
+        row = (
+            job.id, job.case, job.dp_name, job.state, json.dumps(job.params),
+            job.queued_at, job.started_at, job.ended_at, job_dict["waitSeconds"], job_dict["runSeconds"],
+            job.returncode, job.log.first_seq, job.log.last_seq,
+            json.dumps(job_dict["steps"]), json.dumps(job_dict["resources"]),
+        )
+        try:
+            with self._lock:
+                self._conn.execute("INSERT OR REPLACE INTO job VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+        except sqlite3.Error as e:
+            print(f"[WARNING] Failed to record job {job.id} in history: {e}")
+
+    def get(self, job_id):
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM job WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def query(self, case=None, dp_name=None, state=None, since=None, until=None, limit=100):
+        """Return the latest jobs matching the filters and run/wait time statistics of the finished ones."""
+        conditions, args = [], []
+        for column, value in (("case_name", case), ("dp_name", dp_name), ("state", state)):
+            if value:
+                conditions.append(f"{column} = ?")
+                args.append(value)
+        if since is not None:
+            conditions.append("queued_at >= ?")
+            args.append(since)
+        if until is not None:
+            conditions.append("queued_at < ?")
+            args.append(until)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM job {where} ORDER BY queued_at DESC LIMIT ?", (*args, limit)).fetchall()
+            finished = self._conn.execute(
+                f"SELECT run_seconds, wait_seconds FROM job {where} {'AND' if where else 'WHERE'} state = 'finished'",
+                args).fetchall()
+
+        return {
+            "jobs": [self._to_dict(row) for row in rows],
+            "stats": {
+                "finishedCount": len(finished),
+                "runSeconds": self._stats([row["run_seconds"] for row in finished]),
+                "waitSeconds": self._stats([row["wait_seconds"] for row in finished]),
+            },
+        }
+
+    @staticmethod
+    def _stats(values):
+        values = sorted(value for value in values if value is not None)
+        return {
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "avg": round(sum(values) / len(values), 3) if values else None,
+            "max": values[-1] if values else None,
+        }
+
+    @staticmethod
+    def _to_dict(row):
+        return {
+            "id": row["id"],
+            "case": row["case_name"],
+            "dpName": row["dp_name"],
+            "state": row["state"],
+            "params": json.loads(row["params"] or "{}"),
+            "queuedAt": row["queued_at"],
+            "startedAt": row["started_at"],
+            "endedAt": row["ended_at"],
+            "waitSeconds": row["wait_seconds"],
+            "runSeconds": row["run_seconds"],
+            "returncode": row["returncode"],
+            "firstLogSeq": row["first_log_seq"],
+            "lastLogSeq": row["last_log_seq"],
+            "steps": json.loads(row["steps"] or "{}"),
+            "resources": json.loads(row["resources"] or "null"),
+        }
@@ -0,0 +1,100 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+import asyncio
+import threading
+from collections import deque
+from itertools import islice
+
+def wake_async_waiter(waiter):
+    """Resolve an asyncio future, must run in the event loop of the future."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+class JobLog:
+    """
+    Bounded ring buffer with the output lines of one job.
+    Every line gets a monotonically increasing sequence number (starting from 1), which is used as SSE event id,
+    so a client can reconnect with Last-Event-ID and replay the lines it has missed.
+    """
+    def __init__(self, max_lines=20000):
+        self._lines = deque(maxlen=max_lines)
+        self._last_seq = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        # (loop, future) pairs of asyncio readers, resolved on the next append or close
+        self._async_waiters = []
+
+    @property
+    def last_seq(self):
+        return self._last_seq
+
+    @property
+    def first_seq(self):
+        """Sequence number of the oldest line still in the buffer."""
+        with self._cond:
+            return self._lines[0][0] if self._lines else self._last_seq + 1
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def append(self, line):
+        with self._cond:
+            self._last_seq += 1
+            self._lines.append((self._last_seq, line))
+            self._cond.notify_all()
+            self._wake_async_waiters()
+            return self._last_seq
+
+    def extend(self, lines):
+        """Append a batch of lines with one wake-up of the readers."""
+        with self._cond:
+            for line in lines:
+                self._last_seq += 1
+                self._lines.append((self._last_seq, line))
+            self._cond.notify_all()
+            self._wake_async_waiters()
+            return self._last_seq
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            self._wake_async_waiters()
+
+    def read(self, after_seq=0, timeout=None):
+        """
+        Return (lines, closed) with all (seq, line) pairs after after_seq.
+        Blocks until a new line is appended, the log is closed or timeout is reached.
+        Lines which have already been dropped from the ring buffer are skipped.
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._last_seq > after_seq or self._closed, timeout)
+            if self._last_seq <= after_seq:
+                return [], self._closed
+            skip = max(0, len(self._lines) - (self._last_seq - after_seq))
+            return list(islice(self._lines, skip, None)), self._closed
+
+    async def read_async(self, after_seq=0, timeout=None):
+        """Same as read(), waits without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            with self._cond:
+                if self._last_seq > after_seq or self._closed:
+                    break
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await asyncio.wait_for(waiter, None if deadline is None else max(0.0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                with self._cond:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+                break
+        return self.read(after_seq, 0)
+
+    def _wake_async_waiters(self):
+        # must be called with self._cond held
+        for loop, waiter in self._async_waiters:
+            loop.call_soon_threadsafe(wake_async_waiter, waiter)
+        self._async_waiters.clear()
@@ -0,0 +1,190 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+import asyncio
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from utils.job_log import JobLog, wake_async_waiter
+
+# default data plane name, keep it the same as utils/env.py TP_AUTO_K8S_DP_NAME
+DEFAULT_DP_NAME = "k8s-auto-dp1"
+
+class Job:
+    def __init__(self, case, env_vars, job_id=None, max_log_lines=20000, params=None):
+        self.id = job_id or str(uuid.uuid4())
+        self.case = case
+        self.env_vars = env_vars
+        # request parameters of the job, without secrets
+        self.params = params or {}
+        # jobs targeting the same data plane are serialized by the scheduler
+        self.dp_name = env_vars.get("TP_AUTO_K8S_DP_NAME") or DEFAULT_DP_NAME
+        self.state = "queued"
+        self.queued_at = time.time()
+        self.started_at = None
+        self.ended_at = None
+        self.process = None
+        # utils.process_tree.ProcessTree of the case process, it tracks the resource usage
+        self.process_tree = None
+        self.returncode = None
+        # set by /stop-script, also when the job has left the queue but its process has not been started yet
+        self.stop_requested = False
+        # step name -> duration in seconds, besides the time waiting in queue
+        self.steps = {}
+        self.log = JobLog(max_log_lines)
+        self._dispatched = threading.Event()
+        self._async_waiters = []
+
+    @property
+    def wait_seconds(self):
+        end = self.started_at or self.ended_at or time.time()
+        return end - self.queued_at
+
+    @property
+    def run_seconds(self):
+        if self.started_at is None:
+            return 0
+        return (self.ended_at or time.time()) - self.started_at
+
+    def _set_dispatched(self):
+        # must be called with the scheduler lock held
+        self._dispatched.set()
+        for loop, waiter in self._async_waiters:
+            loop.call_soon_threadsafe(wake_async_waiter, waiter)
+        self._async_waiters.clear()
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "case": self.case,
+            "dpName": self.dp_name,
+            "state": self.state,
+            "queuedAt": self.queued_at,
+            "startedAt": self.started_at,
+            "endedAt": self.ended_at,
+            "waitSeconds": round(self.wait_seconds, 3),
+            "runSeconds": round(self.run_seconds, 3),
+            "returncode": self.returncode,
+            "lastEventId": self.log.last_seq,
+            "steps": {"queue": round(self.wait_seconds, 3), **{name: round(seconds, 3) for name, seconds in self.steps.items()}},
+            "resources": self.process_tree.to_dict() if self.process_tree else None,
+        }
+
+class JobScheduler:
+    """
+    FIFO job queue with a global concurrency limit.
+    Jobs on the same data plane run one at a time, jobs on different data planes run in parallel.
+    """
+    def __init__(self, max_concurrent_jobs=2, wait_history_size=100, finished_history_size=50):
+        self.max_concurrent_jobs = max(1, int(max_concurrent_jobs))
+        self._lock = threading.Lock()
+        self._queue: Deque[Job] = deque()
+        self._running: Dict[str, Job] = {}
+        # finished jobs are kept for a while, so clients can still replay their output
+        self._finished: Deque[Job] = deque(maxlen=finished_history_size)
+        self._busy_dp_names = set()
+        self._recent_wait_seconds: Deque[float] = deque(maxlen=wait_history_size)
+
+    def submit(self, job: Job):
+        with self._lock:
+            self._queue.append(job)
+            self._dispatch()
+        return job
+
+    def wait_for_slot(self, job: Job, timeout=None):
+        """Block until the job is started or cancelled, return False if timeout is reached first."""
+        return job._dispatched.wait(timeout)
+
+    async def wait_for_slot_async(self, job: Job, timeout=None):
+        """Same as wait_for_slot, waits without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if job._dispatched.is_set():
+                return True
+            waiter = loop.create_future()
+            job._async_waiters.append((loop, waiter))
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            with self._lock:
+                if (loop, waiter) in job._async_waiters:
+                    job._async_waiters.remove((loop, waiter))
+            return job._dispatched.is_set()
+
+    def cancel(self, job: Job):
+        """Remove a queued job, return False if the job is not waiting in the queue."""
+        with self._lock:
+            if job not in self._queue:
+                return False
+            self._queue.remove(job)
+            job.state = "cancelled"
+            job.ended_at = time.time()
+            self._finished.append(job)
+            job._set_dispatched()
+            return True
+
+    def finish(self, job: Job, state="finished"):
+        with self._lock:
+            if self._running.pop(job.id, None) is not None:
+                self._busy_dp_names.discard(job.dp_name)
+                job.state = state
+                job.ended_at = time.time()
+                self._finished.append(job)
+            elif job in self._queue:
+                self._queue.remove(job)
+                job.state = "cancelled"
+                job.ended_at = time.time()
+                self._finished.append(job)
+                job._set_dispatched()
+            self._dispatch()
+
+    def get_job(self, job_id) -> Optional[Job]:
+        with self._lock:
+            job = self._running.get(job_id)
+            if job is not None:
+                return job
+            return next((job for job in (*self._queue, *self._finished) if job.id == job_id), None)
+
+    def get_running_jobs(self):
+        with self._lock:
+            return list(self._running.values())
+
+    def get_position(self, job: Job):
+        """1-based position of the job in the queue, 0 if the job is not queued."""
+        with self._lock:
+            for index, queued in enumerate(self._queue):
+                if queued is job:
+                    return index + 1
+        return 0
+
+    def get_stats(self):
+        with self._lock:
+            queued = list(self._queue)
+            running = list(self._running.values())
+            recent = list(self._recent_wait_seconds)
+        return {
+            "maxConcurrentJobs": self.max_concurrent_jobs,
+            "runningCount": len(running),
+            "queueDepth": len(queued),
+            "running": [job.to_dict() for job in running],
+            "queued": [job.to_dict() for job in queued],
+            "recentWaitSecondsAvg": round(sum(recent) / len(recent), 3) if recent else 0,
+            "recentWaitSecondsMax": round(max(recent), 3) if recent else 0,
+        }
+
+    def _dispatch(self):
+        # must be called with self._lock held
+        for job in list(self._queue):
+            if len(self._running) >= self.max_concurrent_jobs:
+                break
+            if job.dp_name in self._busy_dp_names:
+                continue
+            self._queue.remove(job)
+            self._running[job.id] = job
+            self._busy_dp_names.add(job.dp_name)
+            job.state = "running"
+            job.started_at = time.time()
+            self._recent_wait_seconds.append(job.wait_seconds)
+            job._set_dispatched()
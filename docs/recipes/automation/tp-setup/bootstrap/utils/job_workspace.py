@@ -0,0 +1,96 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+import contextlib
+import os
+import shutil
+import threading
+
+from utils.atomic_file import atomic_write
+from utils.report_database import open_report_store
+from utils.report_document import is_sidecar
+
+def merge_report(base, update):
+    """
+    Merge report data of a job into the canonical report data.
+    Mappings are merged recursively, lists of named items (dataPlane, capability, app) are merged by name,
+    any other value of the job replaces the canonical value.
+    """
+    if isinstance(base, dict) and isinstance(update, dict):
+        merged = dict(base)
+        for key, value in update.items():
+            merged[key] = merge_report(base[key], value) if key in base else value
+        return merged
+
+    if _is_named_list(base) and _is_named_list(update):
+        merged = list(base)
+        index_by_name = {item["name"]: index for index, item in enumerate(merged)}
+        for item in update:
+            if item["name"] in index_by_name:
+                index = index_by_name[item["name"]]
+                merged[index] = merge_report(merged[index], item)
+            else:
+                index_by_name[item["name"]] = len(merged)
+                merged.append(item)
+        return merged
+
+    return update
+
+def _is_named_list(value):
+    return isinstance(value, list) and all(isinstance(item, dict) and "name" in item for item in value)
+
+class JobWorkspace:
+    """
+    Private report folder of one job, the job gets it as TP_AUTO_REPORT_PATH.
+    When the job ends, the workspace is published into the canonical report folder:
+    report.yaml is merged, other files (report.txt, videos, traces, dp_commands) are copied over.
+    """
+    # jobs can end at the same time, publish one by one
+    _publish_lock = threading.Lock()
+
+    def __init__(self, job_id, report_path, workspace_root, report_yaml_file="report.yaml"):
+        self.job_id = job_id
+        self.report_path = report_path
+        self.report_yaml_file = report_yaml_file
+        self.path = os.path.join(workspace_root, job_id)
+
+    def create(self):
+        os.makedirs(self.path, exist_ok=True)
+        return self.path
+
+    def publish(self):
+        if not os.path.isdir(self.path):
+            return
+        with JobWorkspace._publish_lock:
+            os.makedirs(self.report_path, exist_ok=True)
+            self._merge_report(os.path.join(self.path, self.report_yaml_file),
+                               os.path.join(self.report_path, self.report_yaml_file))
+            for entry in os.scandir(self.path):
+                target = os.path.join(self.report_path, entry.name)
+                if entry.name == self.report_yaml_file or is_sidecar(entry.name, self.report_yaml_file):
+                    continue
+                elif entry.is_dir():
+                    shutil.copytree(entry.path, target, dirs_exist_ok=True)
+                else:
+                    # readers never see a partial file
+                    with open(entry.path, "rb") as source:
+                        atomic_write(target, lambda f: shutil.copyfileobj(source, f), binary=True)
+        print(f"[INFO] Published workspace of job {self.job_id} to {self.report_path}")
+
+    def remove(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _merge_report(self, source, target):
+        """Merge the report of the job (report.yaml or its database) into the canonical report."""
+        with contextlib.closing(open_report_store(source)) as source_store:
+            job_report = source_store.read().to_dict()
+            # the changes of the job go to the journal of the canonical report
+            changes, _ = source_store.read_journal()
+        if not job_report:
+            return
+
+        # same lock and version as the cases which write report/report.yaml directly
+        def mutate(model):
+            model.load_dict(merge_report(model.to_dict(), job_report))
+            return True
+        with contextlib.closing(open_report_store(target)) as target_store:
+            target_store.update(mutate, changes or {"op": "merge", "key": ".", "jobId": self.job_id})
+            target_store.export()
@@ -0,0 +1,74 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+import os
+import re
+import selectors
+import zlib
+
+ANSI_ESCAPE_PATTERN = re.compile(r'\x1B[@-_][0-?]*[ -/]*[@-~]')
+# bytes read from a case pipe at once
+PIPE_READ_SIZE = 64 * 1024
+
+class LineSplitter:
+    """
+    Split raw process output into clean text lines.
+    Complete lines of a chunk are decoded and stripped of ANSI escapes in one pass,
+    a trailing partial line is kept until the rest of it arrives.
+    """
+    def __init__(self):
+        self._pending = b""
+
+    def feed(self, data: bytes):
+        data = self._pending + data
+        end = data.rfind(b"\n")
+        if end < 0:
+            self._pending = data
+            return []
+        self._pending = data[end + 1:]
+        return self._split(data[:end])
+
+    def close(self):
+        data, self._pending = self._pending, b""
+        return self._split(data)
+
+    @staticmethod
+    def _split(data: bytes):
+        text = ANSI_ESCAPE_PATTERN.sub('', data.decode("utf-8", errors="replace"))
+        return [line.strip() for line in text.split("\n") if line.strip()]
+
+def read_pipe_lines(pipe, is_running=None, poll_interval=1.0, read_size=PIPE_READ_SIZE):
+    """
+    Read a pipe in large chunks, yield a list of clean lines for every chunk.
+    Stops at EOF, or when is_running() returns False and the pipe is drained:
+    processes left behind by the case inherit the pipe and can keep it open.
+    """
+    fd = pipe.fileno()
+    splitter = LineSplitter()
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        while True:
+            if selector.select(poll_interval):
+                chunk = os.read(fd, read_size)
+                if not chunk:
+                    break
+                lines = splitter.feed(chunk)
+                if lines:
+                    yield lines
+            elif is_running is not None and not is_running():
+                break
+    lines = splitter.close()
+    if lines:
+        yield lines
+
+def accepts_gzip(accept_encoding):
+    return any(encoding.split(";")[0].strip() == "gzip" for encoding in (accept_encoding or "").split(","))
+
+class GzipStream:
+    """Gzip a streamed response, every chunk is sync flushed so the client can render it right away."""
+    def __init__(self, level=6):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk: str):
+        return self._compressor.compress(chunk.encode("utf-8")) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def close(self):
+        return self._compressor.flush()
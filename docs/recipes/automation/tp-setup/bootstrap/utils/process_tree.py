@@ -0,0 +1,178 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+"""
+Process tree of a job: signal the whole tree and account its resources.
+"""
+import os
+import subprocess
+import threading
+import time
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+class ProcessInfo:
+    __slots__ = ("pid", "ppid", "session", "start_time", "rss_bytes", "cpu_seconds")
+
+    def __init__(self, pid, ppid, session, start_time, rss_bytes, cpu_seconds):
+        self.pid = pid
+        self.ppid = ppid
+        self.session = session
+        self.start_time = start_time
+        self.rss_bytes = rss_bytes
+        self.cpu_seconds = cpu_seconds
+
+def list_processes():
+    """Return {pid: ProcessInfo} of all processes, from /proc on Linux and from ps on other systems."""
+    if os.path.isdir("/proc/self"):
+        return _list_proc_processes()
+    return _list_ps_processes()
+
+def _list_proc_processes():
+    processes = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", "rb") as f:
+                stat = f.read().decode(errors="replace")
+        except OSError:
+            continue
+        # the command name can contain spaces and parentheses, the fields start after the last ")"
+        fields = stat[stat.rfind(")") + 2:].split()
+        if fields[0] == "Z":
+            continue
+        processes[int(name)] = ProcessInfo(
+            pid=int(name),
+            ppid=int(fields[1]),
+            session=int(fields[3]),
+            start_time=int(fields[19]),
+            rss_bytes=int(fields[21]) * _PAGE_SIZE,
+            cpu_seconds=(int(fields[11]) + int(fields[12])) / _CLOCK_TICKS,
+        )
+    return processes
+
+def _list_ps_processes():
+    try:
+        output = subprocess.run(["ps", "-A", "-o", "pid=,ppid=,rss=,time=,stat="],
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+    processes = {}
+    for line in output.splitlines():
+        fields = line.split()
+        if len(fields) < 5 or fields[4].startswith("Z"):
+            continue
+        pid = int(fields[0])
+        processes[pid] = ProcessInfo(pid, int(fields[1]), None, None, int(fields[2]) * 1024, _parse_cpu_time(fields[3]))
+    return processes
+
+def _parse_cpu_time(value):
+    # [[dd-]hh:]mm:ss[.ss]
+    days, _, value = value.rpartition("-")
+    seconds = 0.0
+    for part in value.split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds + int(days or 0) * 86400
+
+class ProcessTree:
+    def __init__(self, pid, env_marker=None):
+        self.pid = pid
+        self.env_marker = env_marker.encode() if env_marker else None
+        self._lock = threading.Lock()
+        self._seen = {}  # pid -> start time
+        self._cpu_seconds = {}  # pid -> last sampled cpu seconds
+        self.peak_rss_bytes = 0
+        self.peak_process_count = 0
+        self.sample_count = 0
+
+    @property
+    def cpu_seconds(self):
+        return sum(self._cpu_seconds.values())
+
+    @property
+    def total_process_count(self):
+        return len(self._seen)
+
+    def sample(self):
+        """Find the live processes of the tree and update the resource usage, return the live processes."""
+        processes = list_processes()
+        children = {}
+        for info in processes.values():
+            children.setdefault(info.ppid, []).append(info.pid)
+
+        with self._lock:
+            tree = {}
+            pending = [] if self.pid in self._seen else [self.pid]
+            # processes seen before are still part of the tree after they have been re-parented
+            pending += [pid for pid, start_time in self._seen.items() if self._is_same(processes.get(pid), start_time)]
+            self._walk(tree, pending, processes, children)
+            if self.env_marker:
+                # only the sessions of the tree are scanned: the case is the leader of its own session and a
+                # re-parented process stays in the session it was started in (Chromium starts a session of its own)
+                sessions = {self.pid, *self._seen, *tree}
+                candidates = [info.pid for info in processes.values()
+                              if info.session in sessions and info.pid not in tree]
+                self._walk(tree, [pid for pid in candidates if self._has_env_marker(pid)], processes, children)
+
+            for info in tree.values():
+                self._seen[info.pid] = info.start_time
+                self._cpu_seconds[info.pid] = info.cpu_seconds
+            self.peak_rss_bytes = max(self.peak_rss_bytes, sum(info.rss_bytes for info in tree.values()))
+            self.peak_process_count = max(self.peak_process_count, len(tree))
+            self.sample_count += 1
+        return tree
+
+    def send_signal(self, sig):
+        """Signal the process group of the case and every live process of the tree, return the signalled pids."""
+        tree = self.sample()
+        try:
+            os.killpg(self.pid, sig)
+        except (ProcessLookupError, PermissionError, AttributeError):
+            pass
+        for pid in tree:
+            try:
+                os.kill(pid, sig)
+            except (ProcessLookupError, PermissionError):
+                pass
+        return list(tree)
+
+    def start_sampling(self, interval, is_running):
+        """Sample in a background thread while is_running() returns True."""
+        def loop():
+            while is_running():
+                self.sample()
+                time.sleep(interval)
+        thread = threading.Thread(target=loop, name=f"process-tree-{self.pid}", daemon=True)
+        thread.start()
+        return thread
+
+    def to_dict(self):
+        return {
+            "peakRssBytes": self.peak_rss_bytes,
+            "cpuSeconds": round(self.cpu_seconds, 3),
+            "peakProcessCount": self.peak_process_count,
+            "totalProcessCount": self.total_process_count,
+        }
+
+    @staticmethod
+    def _walk(tree, pending, processes, children):
+        while pending:
+            pid = pending.pop()
+            if pid in tree or pid not in processes:
+                continue
+            tree[pid] = processes[pid]
+            pending += children.get(pid, [])
+
+    def _has_env_marker(self, pid):
+        # environ is the environment of the last exec: a warm pool child still shows the one of the zygote, it is
+        # the root of the tree, the processes it starts carry the marker
+        try:
+            with open(f"/proc/{pid}/environ", "rb") as f:
+                return self.env_marker in f.read().split(b"\0")
+        except OSError:
+            return False
+
+    @staticmethod
+    def _is_same(info, start_time):
+        # the pid can be reused by another process after the tracked one exits
+        return info is not None and (start_time is None or info.start_time == start_time)
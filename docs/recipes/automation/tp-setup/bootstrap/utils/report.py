@@ -1,7 +1,11 @@
 import os
 import subprocess
 import json
+import yaml
 from utils.env import ENV
+from utils.report_database import TP_AUTO_REPORT_BACKEND, open_report_store
+from utils.report_document import dump_yaml, parse_path, to_yq_text
+from utils.report_model import ReportModel
 
 class ReportYamlHandler:
     def __init__(self, env):
@@ -9,160 +13,165 @@ class ReportYamlHandler:
         self.yaml_file_path = os.path.join(self.yaml_folder, env.TP_AUTO_REPORT_YAML_FILE)
         os.makedirs(self.yaml_folder, exist_ok=True)
 
-        if not os.path.exists(self.yaml_file_path):
+        if TP_AUTO_REPORT_BACKEND == "yaml" and not os.path.exists(self.yaml_file_path):
             with open(self.yaml_file_path, "w") as f:
                 f.write("\n")
+        self.document = open_report_store(self.yaml_file_path)
 
     def set(self, key, value=None):
-        command = key if value is None else f'{key}={self.format_value(value)}'
-        print(f"Setting YAML key-value pair: {command}")
-        self._run_yq_command(["-i", command])
+        """Set a simple path (.ENV.KEY) in process, any other yq expression is run by yq on the document."""
+        path = parse_path(key) if value is not None else None
+        if path is None or (path[0] == ReportModel.CHILD_KEY and len(path) > 1):
+            command = key if value is None else f'{key}={self.format_value(value)}'
+            def mutate_yq(model):
+                output = self._run_yq_command([command], model.to_dict())
+                if output is None:
+                    return False
+                result = yaml.safe_load(output)
+                model.load_dict(result if isinstance(result, dict) else {})
+                return True
+            self._update(mutate_yq, "yq", command)
+            return
+
+        def mutate(model):
+            if len(path) == 1:
+                model.set(path[0], value)
+                return True
+            node = model.fields.get(path[0])
+            if not isinstance(node, dict):
+                node = model.fields[path[0]] = {}
+            for name in path[1:-1]:
+                if not isinstance(node.get(name), dict):
+                    node[name] = {}
+                node = node[name]
+            node[path[-1]] = value
+            return True
+        self._update(mutate, "set", key, value)
 
     def get(self, key):
         """Retrieve the value of a given key from the YAML file."""
-        output = self._run_yq_command([key])
-        if not output or output.strip() == "null":
-            return None
-        return output.strip()
+        path = parse_path(key)
+        if path is None:
+            output = self._run_yq_command([key], self.document.read().to_dict())
+            if not output or output.strip() == "null":
+                return None
+            return output.strip()
+
+        node = self.document.read().get(path[0])
+        for name in path[1:]:
+            if not isinstance(node, dict):
+                return None
+            node = node.get(name)
+        return to_yq_text(node)
+
+    def transaction(self):
+        """
+        All updates in the block are written to report.yaml at once when the block ends, or not at all if it raises:
+            with ReportYaml.transaction():
+                ReportYaml.set_capability(dp_name, capability)
+                ReportYaml.set_capability_info(dp_name, capability, "appBuild", True)
+        """
+        return self.document.transaction()
 
     def set_dataplane(self, dp_name):
-        if dp_name in self.get_dataplanes():
+        if self.is_dataplane_created(dp_name):
             return
-        self.set(f"""
-            .dataPlane |= (
-                map(select(.name != "{dp_name}")) + [{{"name": "{dp_name}"}} | select(map(.name))]
-            )
-        """)
+        def mutate(model):
+            if model.dataplane(dp_name):
+                return False
+            model.add_child(dp_name)
+            return True
+        self._update(mutate, "add", ".dataPlane", dp_name)
 
     def remove_dataplane(self, dp_name):
-        if dp_name not in self.get_dataplanes():
+        if not self.is_dataplane_created(dp_name):
             return
-        self.set(f"""
-            .dataPlane |= map(select(.name != "{dp_name}"))
-        """)
+        self._update(lambda model: model.remove_child(dp_name), "remove", ".dataPlane", dp_name)
 
     def get_dataplanes(self):
-        dps = self.get("(.dataPlane[].name)")
-        return dps.split("\n") if dps else []
+        return list(self.document.read().children())
 
     def set_dataplane_info(self, dp_name, dp_key, dp_value):
-        dp_value = self.format_value(dp_value)
-        self.set(f"""
-            (.dataPlane[]
-                | select(.name == "{dp_name}")
-            ) += {{"{dp_key}": {dp_value}}}
-        """)
+        def mutate(model):
+            dp = model.dataplane(dp_name)
+            if dp:
+                dp.set(dp_key, dp_value)
+            return dp is not None
+        self._update(mutate, "set", f".dataPlane[{dp_name}].{dp_key}", dp_value)
 
     # check if the dataplane exists
     def is_dataplane_created(self, dp_name):
-        return dp_name in self.get_dataplanes()
+        return self.document.read().dataplane(dp_name) is not None
 
     def get_dataplane_info(self, dp_name, dp_key):
-        return self.get(f"""
-            (.dataPlane[]
-               | select(.name == "{dp_name}").{dp_key}
-            )
-        """)
+        return self._get_info(self.document.read().dataplane(dp_name), dp_key)
 
     def set_capability(self, dp_name, capability):
-        if capability in self.get_capabilities(dp_name):
+        if self.is_capability_for_dataplane_created(dp_name, capability):
             return
-        self.set(f"""
-            (.dataPlane[]
-                | select(.name == "{dp_name}")
-                | .capability
-            ) |= (map(select(.name != "{capability}")) + [{{"name": "{capability}"}}])
-        """)
+        def mutate(model):
+            dp = model.dataplane(dp_name)
+            if dp is None or dp.child(capability):
+                return False
+            dp.add_child(capability)
+            return True
+        self._update(mutate, "add", f".dataPlane[{dp_name}].capability", capability)
 
     def get_capabilities(self, dp_name):
-        capabilities = self.get(f"""
-            (.dataPlane[]
-                | select(.name == "{dp_name}")
-                | .capability[].name
-            )
-        """)
-        return capabilities.split("\n") if capabilities else []
+        dp = self.document.read().dataplane(dp_name)
+        return list(dp.children()) if dp else []
 
     # check if the capability of dataplane exists
     def is_capability_for_dataplane_created(self, dp_name, capability):
-        return capability in self.get_capabilities(dp_name)
+        return self.document.read().capability(dp_name, capability) is not None
 
     def set_capability_info(self, dp_name, capability, capability_key, capability_value):
-        capability_value = self.format_value(capability_value)
-        self.set(f"""
-            (.dataPlane[]
-                | select(.name == "{dp_name}")
-                | .capability[]
-                | select(.name == "{capability}")
-            ) += {{"{capability_key}": {capability_value}}}
-        """)
+        def mutate(model):
+            item = model.capability(dp_name, capability)
+            if item:
+                item.set(capability_key, capability_value)
+            return item is not None
+        self._update(mutate, "set", f".dataPlane[{dp_name}].capability[{capability}].{capability_key}", capability_value)
 
     def get_capability_info(self, dp_name, capability, capability_key):
-        return self.get(f"""
-            (.dataPlane[]
-                | select(.name == "{dp_name}")
-                | .capability[]
-                | select(.name == "{capability}").{capability_key}
-            )
-        """)
+        return self._get_info(self.document.read().capability(dp_name, capability), capability_key)
 
     def set_capability_app(self, dp_name, capability, app_name):
-        if app_name in self.get_capability_apps(dp_name, capability):
+        if self.is_app_created(dp_name, capability, app_name):
             return
-        self.set(f"""
-           (.dataPlane[]
-               | select(.name == "{dp_name}")
-               | .capability[]
-               | select(.name == "{capability}").app
-           ) |= (map(select(.name != "{app_name}")) + [{{"name": "{app_name}"}}])
-        """)
+        def mutate(model):
+            item = model.capability(dp_name, capability)
+            if item is None or item.child(app_name):
+                return False
+            item.add_child(app_name)
+            return True
+        self._update(mutate, "add", f".dataPlane[{dp_name}].capability[{capability}].app", app_name)
 
     def get_capability_apps(self, dp_name, capability):
-        apps = self.get(f"""
-           (.dataPlane[]
-               | select(.name == "{dp_name}")
-               | .capability[]
-               | select(.name == "{capability}").app[].name
-           )
-        """)
-        return apps.split("\n") if apps else []
+        item = self.document.read().capability(dp_name, capability)
+        return list(item.children()) if item else []
 
     def remove_capability_app(self, dp_name, capability, app_name):
-        if app_name not in self.get_capability_apps(dp_name, capability):
+        if not self.is_app_created(dp_name, capability, app_name):
             return
-        self.set(f"""
-            .dataPlane[] |= (
-                select(.name == "{dp_name}").capability[] |= (
-                    select(.name == "{capability}").app |= map(select(.name != "{app_name}"))
-                )
-            )
-        """)
+        def mutate(model):
+            item = model.capability(dp_name, capability)
+            return item is not None and item.remove_child(app_name)
+        self._update(mutate, "remove", f".dataPlane[{dp_name}].capability[{capability}].app", app_name)
 
     def is_app_created(self, dp_name, capability, app_name):
-        return app_name in self.get_capability_apps(dp_name, capability)
+        return self.document.read().app(dp_name, capability, app_name) is not None
 
     def set_capability_app_info(self, dp_name, capability, app_name, app_key, app_value):
-        app_value = self.format_value(app_value)
-        self.set(f"""
-            (.dataPlane[]
-                | select(.name == "{dp_name}")
-                | .capability[]
-                | select(.name == "{capability}")
-                | .app[]
-                | select(.name == "{app_name}")
-            ) |= . + {{"{app_key}": {app_value}}}
-        """)
+        def mutate(model):
+            app = model.app(dp_name, capability, app_name)
+            if app:
+                app.set(app_key, app_value)
+            return app is not None
+        self._update(mutate, "set", f".dataPlane[{dp_name}].capability[{capability}].app[{app_name}].{app_key}", app_value)
 
     def get_capability_app_info(self, dp_name, capability, app_name, app_key):
-        return self.get(f"""
-            (.dataPlane[]
-                | select(.name == "{dp_name}")
-                | .capability[]
-                | select(.name == "{capability}")
-                | .app[]
-                | select(.name == "{app_name}").{app_key}
-            )
-        """)
+        return self._get_info(self.document.read().app(dp_name, capability, app_name), app_key)
 
     @staticmethod
     def format_value(value):
@@ -182,23 +191,46 @@ class ReportYamlHandler:
         return value
 
     def sort_yaml_order(self):
-        self.set(f"""
-            {{"ENV": .ENV, "dataPlane": .dataPlane}}
-        """)
-        self.set(f"""
-            .dataPlane[] |= ({{
-                "name": .name, "storage": .storage, "o11yConfig": .o11yConfig,
-                "{ENV.TP_AUTO_INGRESS_CONTROLLER_FLOGO}": .{ENV.TP_AUTO_INGRESS_CONTROLLER_FLOGO},
-                "{ENV.TP_AUTO_INGRESS_CONTROLLER_BWCE}": .{ENV.TP_AUTO_INGRESS_CONTROLLER_BWCE},
-                "capability": .capability
-            }})
-        """)
-
-    def _run_yq_command(self, args):
-        """Run a yq command with the given arguments."""
+        dp_keys = ["name", "storage", "o11yConfig",
+                   ENV.TP_AUTO_INGRESS_CONTROLLER_FLOGO, ENV.TP_AUTO_INGRESS_CONTROLLER_BWCE, "capability"]
+        def mutate(model):
+            data = {"ENV": model.get("ENV"), "dataPlane": model.get("dataPlane")}
+            # null stays null, the same as `.dataPlane[] |= ...` of yq
+            if data["dataPlane"] is not None:
+                data["dataPlane"] = [{key: dp.get(key) for key in dp_keys} for dp in data["dataPlane"]]
+            model.load_dict(data)
+            return True
+        self._update(mutate, "sort", ".")
+
+    def _update(self, mutate, op, key, value=None):
+        """Apply mutate to the document, the change (op, key, value) is recorded in the journal."""
+        if op == "set":
+            description = f"{key}={self.format_value(value)}"
+        elif op in ("add", "remove"):
+            description = f"{key} {'+=' if op == 'add' else '-='} {{name: {value}}}"
+        else:
+            description = key
+        print(f"Setting YAML key-value pair: {description}")
+        self.document.update(mutate, {"op": op, "key": key, "value": value})
+
+    def export_yaml(self):
+        """Write report.yaml from the report store, the sqlite backend only writes it on demand."""
+        return self.document.export(self.yaml_file_path)
+
+    def get_changes(self, after_version=0):
+        """Changes after a version: (changes, is_complete), see ReportDocument.read_journal."""
+        return self.document.read_journal(after_version)
+
+    @staticmethod
+    def _get_info(node, key):
+        return to_yq_text(node.get(key)) if node else None
+
+    def _run_yq_command(self, args, data):
+        """Run a yq command with the given arguments on the document."""
         try:
             result = subprocess.run(
-                ["yq", *args, self.yaml_file_path],
+                ["yq", *args, "-"],
+                input=dump_yaml(data),
                 capture_output=True,
                 text=True,
                 check=True
@@ -0,0 +1,253 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+"""
+SQLite backend of the report store (TP_AUTO_REPORT_BACKEND=sqlite), same API as ReportDocument.
+"""
+import contextlib
+import json
+import os
+import sqlite3
+
+from utils.atomic_file import atomic_write
+from utils.report_document import (DATABASE_SUFFIX, TP_AUTO_REPORT_JOURNAL_MAX_BYTES, ReportDocument, ReportStore,
+                                   dump_yaml, get_journal_entries, is_journal_complete)
+from utils.report_model import ReportIndex, ReportModel
+
+# yaml (report.yaml, default) or sqlite (report.yaml.db)
+TP_AUTO_REPORT_BACKEND = os.environ.get("TP_AUTO_REPORT_BACKEND") or "yaml"
+# the journal size is checked every this many versions
+_JOURNAL_CHECK_INTERVAL = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dataplane (
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (name)
+);
+CREATE TABLE IF NOT EXISTS capability (
+    dp_name TEXT NOT NULL,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (dp_name, name)
+);
+CREATE TABLE IF NOT EXISTS app (
+    dp_name TEXT NOT NULL,
+    capability TEXT NOT NULL,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (dp_name, capability, name)
+);
+CREATE TABLE IF NOT EXISTS info (
+    dp_name TEXT NOT NULL,
+    capability TEXT NOT NULL,
+    app TEXT NOT NULL,
+    key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    value TEXT,
+    PRIMARY KEY (dp_name, capability, app, key)
+);
+CREATE TABLE IF NOT EXISTS journal (
+    version INTEGER NOT NULL,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS journal_version ON journal (version);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# primary key columns of the tables, the other columns follow them
+_PRIMARY_KEYS = {
+    "dataplane": ("name",),
+    "capability": ("dp_name", "name"),
+    "app": ("dp_name", "capability", "name"),
+    "info": ("dp_name", "capability", "app", "key"),
+}
+# info rows of the report itself, a data plane is ("<dp>", "", ""), a capability ("<dp>", "<capability>", "")
+_REPORT_SCOPE = ("", "", "")
+
+def open_report_store(yaml_path):
+    """The store of report.yaml for the configured backend."""
+    if TP_AUTO_REPORT_BACKEND == "sqlite":
+        return ReportDatabase(yaml_path + DATABASE_SUFFIX, yaml_path)
+    return ReportDocument(yaml_path)
+
+def flatten_report(model):
+    """Rows of the tables: {table: {primary key: other columns}}."""
+    rows = {table: {} for table in _PRIMARY_KEYS}
+    def add_fields(scope, node):
+        for position, (key, value) in enumerate(node.fields.items()):
+            # NULL for the named list of children, they are rows of the child table
+            rows["info"][(*scope, key)] = (
+                position, None if isinstance(value, ReportIndex) else json.dumps(value, default=str))
+
+    add_fields(_REPORT_SCOPE, model)
+    for dp_position, (dp_name, dp) in enumerate(model.children().items()):
+        rows["dataplane"][(dp_name,)] = (dp_position,)
+        add_fields((dp_name, "", ""), dp)
+        for capability_position, (capability, item) in enumerate(dp.children().items()):
+            rows["capability"][(dp_name, capability)] = (capability_position,)
+            add_fields((dp_name, capability, ""), item)
+            for app_position, (app_name, app) in enumerate(item.children().items()):
+                rows["app"][(dp_name, capability, app_name)] = (app_position,)
+                add_fields((dp_name, capability, app_name), app)
+    return rows
+
+def build_report(rows):
+    """ReportModel of the rows returned by flatten_report."""
+    fields, children = {}, {}
+    for (*scope, key), (position, value) in rows["info"].items():
+        fields.setdefault(tuple(scope), []).append((position, key, value))
+    for (dp_name,), (position,) in rows["dataplane"].items():
+        children.setdefault(_REPORT_SCOPE, []).append((position, dp_name, (dp_name, "", "")))
+    for (dp_name, capability), (position,) in rows["capability"].items():
+        children.setdefault((dp_name, "", ""), []).append((position, capability, (dp_name, capability, "")))
+    for (dp_name, capability, app_name), (position,) in rows["app"].items():
+        children.setdefault((dp_name, capability, ""), []).append((position, app_name, (dp_name, capability, app_name)))
+
+    def build(node, scope):
+        for _, key, value in sorted(fields.get(scope, []), key=lambda field: field[0]):
+            if value is None:
+                node.fields[key] = ReportIndex(
+                    (name, build(node.CHILD_TYPE(name), child_scope))
+                    for _, name, child_scope in sorted(children.get(scope, []), key=lambda child: child[0]))
+            else:
+                node.fields[key] = json.loads(value)
+        return node
+    return build(ReportModel(), _REPORT_SCOPE)
+
+class ReportDatabase(ReportStore):
+    def __init__(self, path, yaml_path=None):
+        super().__init__(path)
+        self.yaml_path = yaml_path
+        self._rows = None
+        self._data_version = None
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # writers of other processes are waited for up to the timeout
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=60)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        self._import_yaml()
+
+    def read_journal(self, after_version=0):
+        """
+        Return (changes after the version, is_complete).
+        is_complete is False if some of these changes have been compacted, read the whole report instead.
+        """
+        with self._lock, self._read_transaction():
+            entries = self._conn.execute(
+                "SELECT entry FROM journal WHERE version > ? ORDER BY rowid", (after_version,)).fetchall()
+            first_version = self._conn.execute("SELECT MIN(version) FROM journal").fetchone()[0]
+            version = self._read_version()
+        return [json.loads(entry) for entry, in entries], is_journal_complete(after_version, version, first_version)
+
+    def export(self, path=None):
+        """Write the report to report.yaml (or path) for tools which read the file."""
+        path = path or self.yaml_path
+        data = self.read()
+        atomic_write(path, lambda f: dump_yaml(data.to_dict(), f), fsync=True)
+        return path
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _import_yaml(self):
+        """Take over report.yaml of the yaml backend, when the database is new."""
+        if self.yaml_path is None or self.version != 0 or not os.path.exists(self.yaml_path):
+            return
+        report = ReportDocument(self.yaml_path).read().to_dict()
+        if not report:
+            return
+        def mutate(model):
+            if model.fields:
+                return False
+            model.load_dict(report)
+            return True
+        self.update(mutate, {"op": "import", "key": ".", "value": self.yaml_path})
+        print(f"[INFO] Imported {self.yaml_path} into {self.path}")
+
+    def _is_stale(self):
+        return self._data is None or self._get_state() != self._data_version
+
+    def _reload(self):
+        with self._read_transaction():
+            self._data_version = self._get_state()
+            self._rows = {}
+            for table, keys in _PRIMARY_KEYS.items():
+                self._rows[table] = {tuple(row[:len(keys)]): tuple(row[len(keys):])
+                                     for row in self._conn.execute(f"SELECT * FROM {table}")}
+            self._data = build_report(self._rows)
+
+    def _get_state(self, is_loaded=False):
+        # data_version changes when another connection has committed, not on the writes of this connection
+        if is_loaded:
+            return self._data_version
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    @contextlib.contextmanager
+    def _read_transaction(self):
+        # all reads of the block see the same commit
+        if self._conn.in_transaction:
+            yield
+            return
+        self._conn.execute("BEGIN")
+        try:
+            yield
+        finally:
+            self._conn.execute("COMMIT")
+
+    @contextlib.contextmanager
+    def _write_lock(self):
+        if self._conn.in_transaction:
+            yield
+            return
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _read_version(self):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return row[0] if row else 0
+
+    def _write(self, data, changes):
+        """Write the changed rows, bump the version and journal the changes, the write lock must be held."""
+        rows = flatten_report(data)
+        for table, keys in _PRIMARY_KEYS.items():
+            old_rows, new_rows = self._rows[table], rows[table]
+            deleted = [key for key in old_rows if key not in new_rows]
+            changed = [key + row for key, row in new_rows.items() if old_rows.get(key) != row]
+            if deleted:
+                self._conn.executemany(
+                    f"DELETE FROM {table} WHERE {' AND '.join(f'{key} = ?' for key in keys)}", deleted)
+            if changed:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {table} VALUES ({', '.join('?' * len(changed[0]))})", changed)
+        self._rows = rows
+
+        version = self._read_version() + 1
+        self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (version,))
+        self._conn.executemany("INSERT INTO journal VALUES (?, ?)",
+                               [(version, json.dumps(entry, default=str)) for entry in get_journal_entries(version, changes)])
+        if version % _JOURNAL_CHECK_INTERVAL == 0:
+            self._compact_journal()
+
+    def _compact_journal(self):
+        """Keep the newest half of the journal, the older changes are in the snapshot."""
+        size = self._conn.execute("SELECT COALESCE(SUM(LENGTH(entry)), 0) FROM journal").fetchone()[0]
+        if size <= TP_AUTO_REPORT_JOURNAL_MAX_BYTES:
+            return
+        kept = 0
+        lengths = self._conn.execute("SELECT version, LENGTH(entry) FROM journal ORDER BY version DESC").fetchall()
+        for version, length in lengths:
+            kept += length
+            if kept > TP_AUTO_REPORT_JOURNAL_MAX_BYTES // 2:
+                # do not split the changes of one version
+                self._conn.execute("DELETE FROM journal WHERE version <= ?", (version,))
+                print(f"[INFO] Compacted the journal of {self.path}, removed the changes up to version {version}")
+                return
@@ -0,0 +1,322 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+"""
+In-process engine for report.yaml with versioned, journaled writes, reads and writes it without starting a yq process.
+"""
+import contextlib
+import json
+import os
+import re
+import threading
+import time
+
+import yaml
+
+from utils.atomic_file import atomic_write
+from utils.report_model import ReportModel
+
+try:
+    import fcntl
+except ImportError:
+    # Windows, writers are only serialized within a process
+    fcntl = None
+
+LOCK_SUFFIX = ".lock"
+VERSION_SUFFIX = ".version"
+JOURNAL_SUFFIX = ".journal"
+# report.yaml.db of the sqlite backend, with its WAL and shared memory files
+DATABASE_SUFFIX = ".db"
+DATABASE_SUFFIXES = (DATABASE_SUFFIX, DATABASE_SUFFIX + "-wal", DATABASE_SUFFIX + "-shm")
+SIDECAR_SUFFIXES = (LOCK_SUFFIX, VERSION_SUFFIX, JOURNAL_SUFFIX, *DATABASE_SUFFIXES)
+# files which change on every write, of the yaml or the sqlite backend
+CHANGE_SUFFIXES = (VERSION_SUFFIX, DATABASE_SUFFIX + "-wal")
+TP_AUTO_REPORT_JOURNAL_MAX_BYTES = int(os.environ.get("TP_AUTO_REPORT_JOURNAL_MAX_BYTES", str(1024 * 1024)))
+
+# simple yq paths like .ENV.CP_URL, other expressions are run by yq
+_SIMPLE_PATH_PATTERN = re.compile(r"^\(?\s*((?:\.[A-Za-z_][\w-]*)+)\s*\)?$")
+
+class ReportDumper(yaml.SafeDumper):
+    """Indent list items under their parent key, the same layout as yq writes."""
+    def increase_indent(self, flow=False, indentless=False):
+        return super().increase_indent(flow, False)
+
+def dump_yaml(data, stream=None):
+    return yaml.dump(data, stream, Dumper=ReportDumper, sort_keys=False, allow_unicode=True)
+
+def parse_path(expression):
+    """Return the keys of a simple yq path (.a.b.c), None for any other expression."""
+    match = _SIMPLE_PATH_PATTERN.match(expression.strip())
+    return match.group(1)[1:].split(".") if match else None
+
+def to_yq_text(value):
+    """Format a value the way `yq <expression>` prints it, None for null."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return dump_yaml(value).strip()
+    return str(value)
+
+def is_sidecar(file_name, yaml_file_name):
+    """Lock, version, journal and database files of a report yaml file."""
+    return any(file_name == yaml_file_name + suffix for suffix in SIDECAR_SUFFIXES)
+
+def get_journal_entries(version, changes):
+    """Journal entries of the changes of one write: version, time and job id with the change (op, key, value)."""
+    job_id = os.environ.get("TP_AUTO_JOB_ID")
+    now = time.time()
+    entries = []
+    for change in changes:
+        # changes published from a job workspace keep their job id and time
+        entry = {"version": version, "time": now, "jobId": job_id}
+        entry.update((key, value) for key, value in change.items() if key != "version")
+        entries.append(entry)
+    return entries
+
+def is_journal_complete(after_version, version, first_version):
+    """True if the journal still has every change after after_version, first_version is its oldest version."""
+    # a version newer than the document is from before the report was removed
+    return after_version == version or (
+        after_version < version and first_version is not None and first_version <= after_version + 1)
+
+class ReportStore:
+    """
+    Cached ReportModel with updates and transactions, the storage is implemented by the subclasses:
+    _is_stale, _reload, _get_state, _write_lock, _read_version, _write, read_journal and export.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        self._data = None
+        self._transaction = None
+        self._mutations = []
+        self._changes = []
+        self._is_dirty = False
+
+    @property
+    def version(self):
+        """Number of writes to the document, also counts writes of other processes."""
+        return self._read_version()
+
+    def read(self):
+        """Return the current ReportModel, callers must not modify it."""
+        with self._lock:
+            if self._transaction is not None:
+                return self._transaction
+            if self._is_stale():
+                self._reload()
+            return self._data
+
+    def update(self, mutate, change=None):
+        """
+        Apply mutate(model) to the current ReportModel and write it if mutate returns True.
+        mutate can be called again on a newer document if another process wrote in the meantime.
+        change (op, key, value) or a list of changes is appended to the journal.
+        """
+        changes = change if isinstance(change, list) else [change] if change else []
+        with self._lock:
+            if self._transaction is not None:
+                self._mutations.append(mutate)
+                if mutate(self._transaction):
+                    self._changes += changes
+                    self._is_dirty = True
+                return
+            with self._write_lock():
+                # the latest document, nobody else can write while the lock is held
+                data = self.read()
+                try:
+                    if mutate(data):
+                        self._write(data, changes)
+                except Exception:
+                    # the cached document may be half modified, read it again on the next read
+                    self._data = None
+                    raise
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Apply the updates of the block to a copy of the document and write it once when the block ends,
+        nothing is written if the block raises. Other threads wait for the transaction to end, nested
+        transactions are part of the outer one.
+        """
+        with self._lock:
+            if self._transaction is not None:
+                yield
+                return
+            data = self.read()
+            state = self._get_state(is_loaded=True)
+            self._transaction = data.copy()
+            self._mutations, self._changes = [], []
+            self._is_dirty = False
+            try:
+                yield
+                data, mutations, changes, is_dirty = self._transaction, self._mutations, self._changes, self._is_dirty
+                self._transaction = None
+                if is_dirty:
+                    self._commit(data, mutations, changes, state)
+            finally:
+                self._transaction = None
+                self._mutations, self._changes = [], []
+                self._is_dirty = False
+
+    def export(self, path=None):
+        """Write the report to a yaml file in the report.yaml layout, return the path."""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def snapshot(self):
+        """Return (version, report dict) of the same write, consumers read the journal after this version."""
+        with self._lock, self._write_lock():
+            data = self.read()
+            return self._read_version(), data.to_dict()
+
+    def _commit(self, data, mutations, changes, state):
+        with self._write_lock():
+            if self._get_state() != state:
+                print(f"[INFO] {self.path} was changed by another process, apply the updates again")
+                self._data = None
+                data = self.read().copy()
+                if not any([mutate(data) for mutate in mutations]):
+                    return
+            self._write(data, changes)
+            self._data = data
+
+class ReportDocument(ReportStore):
+    def __init__(self, path):
+        super().__init__(path)
+        self.lock_path = path + LOCK_SUFFIX
+        self.version_path = path + VERSION_SUFFIX
+        self.journal_path = path + JOURNAL_SUFFIX
+        self._signature = None
+        self._version = 0
+
+    def export(self, path=None):
+        """Write the document to another yaml file, report.yaml itself is always up to date."""
+        if path is None or os.path.abspath(path) == os.path.abspath(self.path):
+            return self.path
+        data = self.read()
+        atomic_write(path, lambda f: dump_yaml(data.to_dict(), f), fsync=True)
+        return path
+
+    def read_journal(self, after_version=0):
+        """
+        Return (changes after the version, is_complete).
+        is_complete is False if some of these changes have been compacted, read the whole document instead.
+        """
+        changes, first_version = [], None
+        try:
+            with open(self.journal_path, "r") as f:
+                for line in f:
+                    try:
+                        change = json.loads(line)
+                    except ValueError:
+                        # a line which is being appended
+                        continue
+                    first_version = first_version or change["version"]
+                    if change["version"] > after_version:
+                        changes.append(change)
+        except FileNotFoundError:
+            pass
+        return changes, is_journal_complete(after_version, self.version, first_version)
+
+    def _reload(self):
+        # read the version first, a writer replaces the document before it bumps the version
+        self._version = self._read_version()
+        self._signature = self._stat()
+        self._data = self._load()
+
+    def _get_state(self, is_loaded=False):
+        return (self._version, self._signature) if is_loaded else (self._read_version(), self._stat())
+
+    @contextlib.contextmanager
+    def _write_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_path, "a") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _is_stale(self):
+        # every write replaces the file, a new inode/size/mtime is enough to see it without reading the version
+        return self._data is None or self._stat() != self._signature
+
+    def _read_version(self):
+        try:
+            with open(self.version_path, "r") as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def _load(self):
+        data = None
+        if os.path.exists(self.path):
+            with open(self.path, "r") as f:
+                data = yaml.safe_load(f)
+        return ReportModel.from_dict(data if isinstance(data, dict) else {})
+
+    def _write(self, data, changes):
+        """Write the document, bump the version and journal the changes, the file lock must be held."""
+        atomic_write(self.path, lambda f: dump_yaml(data.to_dict(), f), fsync=True)
+        version = self._read_version() + 1
+        atomic_write(self.version_path, lambda f: f.write(f"{version}\n"), fsync=True)
+        self._sync_folder()
+        self._signature = self._stat()
+        self._version = version
+        self._append_journal(version, changes)
+
+    def _append_journal(self, version, changes):
+        lines = [json.dumps(entry, default=str) + "\n" for entry in get_journal_entries(version, changes)]
+        if not lines:
+            return
+        with open(self.journal_path, "a") as f:
+            f.writelines(lines)
+            size = f.tell()
+        if size > TP_AUTO_REPORT_JOURNAL_MAX_BYTES:
+            self._compact_journal()
+
+    def _compact_journal(self):
+        """Keep the newest half of the journal, the older changes are in the snapshot."""
+        with open(self.journal_path, "r") as f:
+            lines = f.readlines()
+        start, size = len(lines), 0
+        while start > 0 and size + len(lines[start - 1]) <= TP_AUTO_REPORT_JOURNAL_MAX_BYTES // 2:
+            start -= 1
+            size += len(lines[start])
+        # do not split the changes of one version
+        while 0 < start < len(lines) and self._get_line_version(lines[start]) == self._get_line_version(lines[start - 1]):
+            start += 1
+        atomic_write(self.journal_path, lambda f: f.writelines(lines[start:]), fsync=True)
+        print(f"[INFO] Compacted {self.journal_path}, kept {len(lines) - start} of {len(lines)} changes")
+
+    @staticmethod
+    def _get_line_version(line):
+        try:
+            return json.loads(line)["version"]
+        except (ValueError, KeyError):
+            return None
+
+    def _sync_folder(self):
+        # make the rename durable, not supported on every platform
+        try:
+            fd = os.open(os.path.dirname(self.path) or ".", os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
@@ -0,0 +1,114 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+"""
+Indexed model of report.yaml, data planes, capabilities and apps are keyed by name.
+"""
+import copy
+
+class ReportIndex(dict):
+    """Children of a node by name, tells an indexed named list apart from a plain mapping value."""
+    __slots__ = ()
+
+class ReportNode:
+    """A named item with its fields, the named list of children (CHILD_KEY) is indexed by name."""
+    __slots__ = ("name", "fields")
+    CHILD_KEY = None
+    CHILD_TYPE = None
+
+    def __init__(self, name=None):
+        self.name = name
+        self.fields = {}
+
+    @classmethod
+    def from_dict(cls, data, name=None):
+        node = cls(name)
+        node.load_dict(data)
+        return node
+
+    def load_dict(self, data):
+        """Replace the fields with the items of a dict (without name)."""
+        self.fields = {}
+        for key, value in data.items():
+            self.set(key, value)
+
+    def set(self, key, value):
+        if key == self.CHILD_KEY and self._is_named_list(value):
+            value = ReportIndex(
+                (item["name"], self.CHILD_TYPE.from_dict({k: v for k, v in item.items() if k != "name"}, item["name"]))
+                for item in value)
+        self.fields[key] = value
+
+    def get(self, key):
+        """Return a field, the children as a list of dicts."""
+        value = self.fields.get(key)
+        if isinstance(value, ReportIndex):
+            return [child.to_dict() for child in value.values()]
+        return value
+
+    def children(self):
+        """Children by name, empty if the node has none."""
+        value = self.fields.get(self.CHILD_KEY)
+        return value if isinstance(value, ReportIndex) else ReportIndex()
+
+    def child(self, name):
+        return self.children().get(name)
+
+    def add_child(self, name):
+        """Append a child with this name if it does not exist yet, return the child."""
+        children = self.fields.get(self.CHILD_KEY)
+        if not isinstance(children, ReportIndex):
+            children = self.fields[self.CHILD_KEY] = ReportIndex()
+        if name not in children:
+            children[name] = self.CHILD_TYPE(name)
+        return children[name]
+
+    def remove_child(self, name):
+        return self.children().pop(name, None) is not None
+
+    def to_dict(self):
+        data = {} if self.name is None else {"name": self.name}
+        for key in self.fields:
+            data[key] = self.get(key)
+        return data
+
+    def copy(self):
+        node = self.__class__(self.name)
+        for key, value in self.fields.items():
+            if isinstance(value, ReportIndex):
+                node.fields[key] = ReportIndex((name, child.copy()) for name, child in value.items())
+            else:
+                node.fields[key] = copy.deepcopy(value)
+        return node
+
+    @staticmethod
+    def _is_named_list(value):
+        return isinstance(value, list) and all(isinstance(item, dict) and "name" in item for item in value)
+
+class ReportApp(ReportNode):
+    __slots__ = ()
+
+class ReportCapability(ReportNode):
+    __slots__ = ()
+    CHILD_KEY = "app"
+    CHILD_TYPE = ReportApp
+
+class ReportDataPlane(ReportNode):
+    __slots__ = ()
+    CHILD_KEY = "capability"
+    CHILD_TYPE = ReportCapability
+
+class ReportModel(ReportNode):
+    """The whole report, top level keys (ENV, dataPlane, ...) are its fields."""
+    __slots__ = ()
+    CHILD_KEY = "dataPlane"
+    CHILD_TYPE = ReportDataPlane
+
+    def dataplane(self, dp_name):
+        return self.child(dp_name)
+
+    def capability(self, dp_name, capability):
+        dp = self.child(dp_name)
+        return dp.child(capability) if dp else None
+
+    def app(self, dp_name, capability, app_name):
+        item = self.capability(dp_name, capability)
+        return item.child(app_name) if item else None
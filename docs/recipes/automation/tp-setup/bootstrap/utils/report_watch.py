@@ -0,0 +1,98 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+import asyncio
+import os
+import threading
+import time
+
+from utils.job_log import wake_async_waiter
+from utils.report_document import CHANGE_SUFFIXES
+
+class ReportWatcher:
+    """
+    Wake up the clients waiting for report changes.
+    The reports are written by the case processes, one thread polls the version (or database WAL) files of all
+    watched reports (get_paths() returns them) and bumps the sequence when any of them changed, so clients only read
+    the journals after a change instead of polling them.
+    """
+    def __init__(self, get_paths, interval=0.5):
+        self.get_paths = get_paths
+        self.interval = interval
+        self._cond = threading.Condition()
+        self._sequence = 0
+        self._signatures = {}
+        self._thread = None
+        # (loop, future) pairs of asyncio waiters, resolved on the next change
+        self._async_waiters = []
+
+    @property
+    def sequence(self):
+        """Number of changes seen so far, pass it to wait() before reading the journals."""
+        return self._sequence
+
+    def wait(self, sequence, timeout=None):
+        """Block until there is a change after sequence or timeout is reached, return the current sequence."""
+        self._start()
+        with self._cond:
+            self._cond.wait_for(lambda: self._sequence != sequence, timeout)
+            return self._sequence
+
+    async def wait_async(self, sequence, timeout=None):
+        """Same as wait(), waits without blocking the event loop."""
+        self._start()
+        loop = asyncio.get_running_loop()
+        with self._cond:
+            if self._sequence != sequence:
+                return self._sequence
+            waiter = loop.create_future()
+            self._async_waiters.append((loop, waiter))
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            with self._cond:
+                if (loop, waiter) in self._async_waiters:
+                    self._async_waiters.remove((loop, waiter))
+        return self._sequence
+
+    def poll(self):
+        """Check the watched reports once, wake up the waiters if any of them changed."""
+        signatures = {path: self._get_signature(path) for path in self.get_paths()}
+        # a report which is no longer watched is not a change
+        is_changed = any(self._signatures.get(path) != signature
+                         for path, signature in signatures.items() if path in self._signatures or signature)
+        self._signatures = signatures
+        if is_changed:
+            with self._cond:
+                self._sequence += 1
+                self._cond.notify_all()
+                for loop, waiter in self._async_waiters:
+                    loop.call_soon_threadsafe(wake_async_waiter, waiter)
+                self._async_waiters.clear()
+
+    def _start(self):
+        # the thread is only started when the first client waits
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._signatures = {path: self._get_signature(path) for path in self.get_paths()}
+            self._thread = threading.Thread(target=self._run, name="report-watcher", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"[WARNING] Failed to watch report changes: {e}")
+
+    def _get_signature(self, path):
+        signature = tuple(self._stat(path + suffix) for suffix in CHANGE_SUFFIXES)
+        return signature if any(signature) else None
+
+    @staticmethod
+    def _stat(path):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
@@ -0,0 +1,66 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+import hashlib
+import json
+import threading
+import time
+
+class SnapshotCache:
+    """
+    Cache the JSON snapshot returned by build() for ttl seconds.
+    A stale snapshot is still returned while a background thread builds the new one,
+    so only the very first request waits for build().
+    """
+    def __init__(self, build, ttl, name="snapshot"):
+        self.build = build
+        self.ttl = ttl
+        self.name = name
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._refreshing = False
+        self._etag = None
+        self._body = None
+        self._built_at = 0.0
+
+    def has_value(self):
+        return self._body is not None
+
+    def get(self):
+        """Return (json body, etag)."""
+        with self._lock:
+            body, etag = self._body, self._etag
+            is_stale = time.monotonic() - self._built_at >= self.ttl
+        if body is None:
+            # wait for the refresh started at server start instead of building twice
+            with self._build_lock:
+                if self._body is not None:
+                    return self._body, self._etag
+            return self.refresh()
+        if is_stale:
+            self.refresh_async()
+        return body, etag
+
+    def refresh(self):
+        with self._build_lock:
+            body = json.dumps(self.build(), sort_keys=True, default=str)
+            etag = hashlib.sha256(body.encode("utf-8")).hexdigest()[:32]
+            with self._lock:
+                self._body, self._etag = body, etag
+                self._built_at = time.monotonic()
+        return body, etag
+
+    def refresh_async(self):
+        """Refresh in a background thread, does nothing if a refresh is already running."""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"[WARNING] Failed to refresh {self.name}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing = False
+        threading.Thread(target=run, name=f"refresh-{self.name}", daemon=True).start()
@@ -1,4 +1,5 @@
 #  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+import asyncio
 import contextlib
 import io
 import queue
@@ -6,13 +7,21 @@ import threading
 from typing import cast, IO
 
 class StreamingRunner(io.TextIOBase):
-    def __init__(self):
-        self.q = queue.Queue()
+    def __init__(self, loop: asyncio.AbstractEventLoop = None):
+        """If loop is set, q is an asyncio.Queue which can be consumed in that event loop."""
+        self._loop = loop
+        self.q = asyncio.Queue() if loop else queue.Queue()
+
+    def put(self, item):
+        if self._loop:
+            self._loop.call_soon_threadsafe(self.q.put_nowait, item)
+        else:
+            self.q.put(item)
 
     def write(self, data: str) -> int:
         for line in data.splitlines():
             if line.strip():
-                self.q.put(line)
+                self.put(line)
         return len(data)
 
     def flush(self) -> None:
@@ -28,12 +37,12 @@ class StreamingRunner(io.TextIOBase):
             try:
                 result = func(*args, **kwargs)
                 if result:
-                    self.q.put(f"=== Return Value ===")
-                    self.q.put(str(result))
+                    self.put(f"=== Return Value ===")
+                    self.put(str(result))
             except Exception as e:
-                self.q.put(f"[ERROR]: {repr(e)}")
+                self.put(f"[ERROR]: {repr(e)}")
             finally:
-                self.q.put(None)
+                self.put(None)
 
     def start_thread(self, func, *args, **kwargs):
         """Start func(*args, **kwargs) in background thread."""
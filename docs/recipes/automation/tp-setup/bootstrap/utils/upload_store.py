@@ -0,0 +1,128 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+
+from utils.atomic_file import atomic_write
+
+# bytes read from the request body at once
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+METADATA_SUFFIX = ".meta.json"
+_SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+class UploadStore:
+    """
+    Content-addressed store of uploaded app files.
+    The content is stored once as <sha256>, with its size in <sha256>.meta.json. Every upload gets its own file
+    <original name>_<timestamp><ext>, a hard link to the content, and <upload file>.meta.json with the original
+    file name, file type and Flogo app name of that upload.
+    """
+    def __init__(self, folder):
+        self.folder = folder
+
+    @staticmethod
+    def is_sha256(value):
+        return bool(_SHA256_PATTERN.match(value or ""))
+
+    @staticmethod
+    def get_filetype(filename):
+        return 'BWCE' if os.path.splitext(filename)[1] == '.ear' else 'FLOGO'
+
+    @staticmethod
+    def read_metadata(file_path):
+        """Return the cached metadata of an uploaded file, None for files which are not from the store."""
+        try:
+            with open(file_path + METADATA_SUFFIX, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def find(self, sha256):
+        """Return the metadata of the stored content with this sha256, None if it is not stored."""
+        if not self.is_sha256(sha256):
+            return None
+        content_path = os.path.join(self.folder, sha256)
+        metadata = self.read_metadata(content_path)
+        if metadata and os.path.isfile(content_path):
+            return metadata
+        return None
+
+    def save(self, stream, original_filename):
+        """Read the stream in chunks, hash it while writing, return the metadata of the new upload."""
+        os.makedirs(self.folder, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.folder, prefix=".upload-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                while chunk := stream.read(UPLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+
+            sha256 = digest.hexdigest()
+            if self.find(sha256):
+                print(f"[INFO] Content of upload {original_filename} is already stored as {sha256}")
+            else:
+                content_path = os.path.join(self.folder, sha256)
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, content_path)
+                self._write_metadata(content_path, {"sha256": sha256, "size": size, "storedAt": time.time()})
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return self.add(sha256, original_filename)
+
+    def add(self, sha256, original_filename):
+        """Add an upload of stored content under a new file name, return its metadata, None if it is not stored."""
+        content = self.find(sha256)
+        if content is None:
+            return None
+        original_filename = os.path.basename(original_filename)
+        stem, ext = os.path.splitext(original_filename)
+        # a unique name per upload, the default BWCE app name is the file name without .ear
+        filename = f"{stem}_{time.strftime('%Y%m%d_%H%M%S')}{ext}"
+        file_path = os.path.join(self.folder, filename)
+        index = 1
+        while True:
+            try:
+                os.link(os.path.join(self.folder, sha256), file_path)
+                break
+            except FileExistsError:
+                index += 1
+                filename = f"{stem}_{time.strftime('%Y%m%d_%H%M%S')}_{index}{ext}"
+                file_path = os.path.join(self.folder, filename)
+            except OSError:
+                # no hard links on this file system
+                shutil.copyfile(os.path.join(self.folder, sha256), file_path)
+                break
+        metadata = {
+            "filename": filename,
+            "sha256": sha256,
+            "size": content["size"],
+            "originalFilename": original_filename,
+            "filetype": self.get_filetype(filename),
+            "appName": self._parse_app_name(file_path, ext.lower()),
+            "uploadedAt": time.time(),
+        }
+        self._write_metadata(file_path, metadata)
+        return metadata
+
+    @staticmethod
+    def _parse_app_name(file_path, ext):
+        # only Flogo app json has the app name in the file
+        if ext != ".json":
+            return None
+        try:
+            with open(file_path, "r") as f:
+                return json.load(f).get("name")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    @staticmethod
+    def _write_metadata(file_path, metadata):
+        atomic_write(file_path + METADATA_SUFFIX, lambda f: json.dump(metadata, f, indent=2))
@@ -1,20 +1,24 @@
 #  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
 
+import atexit
 import json
 import os
 import sys
-import re
 
 import pytz
 import html
+import shutil
+import tempfile
 import time
-import urllib.request
-from urllib.error import URLError, HTTPError
-from playwright.sync_api import sync_playwright
+import uuid
+from playwright.sync_api import sync_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 from datetime import datetime
+from utils.browser_server import BrowserServer
 from utils.color_logger import ColorLogger
+from utils.dns_cache import dns_cache
 from utils.env import ENV
-from utils.helper import Helper
+from utils.env_report import EnvReport, is_url_accessible
+from utils.output_stream import ANSI_ESCAPE_PATTERN
 from utils.report import ReportYaml
 from playwright.sync_api import ViewportSize
 
@@ -24,34 +28,78 @@ class Util:
     _context = None
     _run_start_time = None
     _is_trace = False
+    _is_shared_browser = False
+    _is_failed = False
+    # temp folder of the video and the trace chunks in TP_AUTO_REPORT_RECORD_ON_FAILURE mode
+    _record_dir = None
+    _trace_chunks = []
+    _trace_step = 0
+    TRACE_CHUNKS_KEPT = 3
 
     @staticmethod
     def get_dns_ip():
-        awk_script = '/^Name:/ {getline; if ($1=="Address:") print $2}'
-        return Helper.get_command_output(f"nslookup *.{ENV.TP_AUTO_CP_DNS_DOMAIN} | awk '{awk_script}'", True)
+        domain = ENV.TP_AUTO_CP_DNS_DOMAIN
+        if ENV.TP_AUTO_DNS_PIN and ReportYaml.get(".ENV.CP_DNS_PINNED_DOMAIN") == domain:
+            pinned_ip = ReportYaml.get(".ENV.CP_DNS_PINNED_IP")
+            if pinned_ip:
+                return pinned_ip
+        dns_ip = dns_cache.resolve(domain)
+        print(f"Resolved *.{domain} to '{dns_ip}'")
+        if ENV.TP_AUTO_DNS_PIN and dns_ip:
+            with ReportYaml.transaction():
+                ReportYaml.set(".ENV.CP_DNS_PINNED_DOMAIN", domain)
+                ReportYaml.set(".ENV.CP_DNS_PINNED_IP", dns_ip)
+        return dns_ip
+
+    @staticmethod
+    def get_browser_launch_options(is_headless=ENV.IS_HEADLESS):
+        """ Launch options of the browser, without the ones which only apply to a browser of this process """
+        return BrowserServer.get_launch_options(is_headless, ENV.TP_AUTO_CP_DNS_DOMAIN, Util.get_dns_ip())
+
+    @staticmethod
+    def connect_shared_browser(playwright, launch_options):
+        """ Connect to the browser shared by the jobs of the bootstrap server, None if there is none for the options """
+        ws_endpoint = os.environ.get("TP_AUTO_BROWSER_WS_ENDPOINT")
+        if not ws_endpoint:
+            return None
+        if json.loads(os.environ.get("TP_AUTO_BROWSER_LAUNCH_OPTIONS") or "{}") != launch_options:
+            ColorLogger.info("The shared browser is launched with other options, launch a new browser.")
+            return None
+        try:
+            browser = playwright.chromium.connect(ws_endpoint, timeout=10000)
+        except Exception as e:
+            ColorLogger.warning(f"Failed to connect to the shared browser, launch a new browser: {e}")
+            return None
+        Util._is_shared_browser = True
+        ColorLogger.success("Connected to Shared Browser Successfully.")
+        return browser
 
     @staticmethod
     def browser_launch(is_headless=ENV.IS_HEADLESS):
         if Util._browser is None:
-            dns_ip = Util.get_dns_ip()
-            args = [
-                '--single-process'
-            ]
-            if dns_ip:
-                args.append(f"--host-resolver-rules=MAP *.{ENV.TP_AUTO_CP_DNS_DOMAIN} {dns_ip}")
+            launch_options = Util.get_browser_launch_options(is_headless)
             Util._run_start_time = time.time()
             playwright = sync_playwright().start()
-            Util._browser = playwright.chromium.launch(
-                headless=is_headless,
-                args=args
+            Util._browser = Util.connect_shared_browser(playwright, launch_options)
+            if Util._browser is None:
+                Util._browser = playwright.chromium.launch(
+                    headless=launch_options["headless"],
+                    args=['--single-process', *launch_options["args"]]
+                )
+                ColorLogger.success("Browser Launched Successfully.")
+
+        if ENV.TP_AUTO_REPORT_RECORD_ON_FAILURE:
+            if Util._record_dir is None:
+                Util._record_dir = tempfile.mkdtemp(prefix="tp-auto-record-")
+                atexit.register(Util._close_at_exit)
+            videos_dir = os.path.join(Util._record_dir, "videos")
+            print(f"Record video to {videos_dir}, it is only saved to the report when the case fails")
+        else:
+            videos_dir = os.path.join(
+                ENV.TP_AUTO_REPORT_PATH,
+                str(ENV.RETRY_TIME_FOLDER)
             )
-            ColorLogger.success("Browser Launched Successfully.")
-
-        videos_dir = os.path.join(
-            ENV.TP_AUTO_REPORT_PATH,
-            str(ENV.RETRY_TIME_FOLDER)
-        )
-        print(f"Record video to {videos_dir}")
+            print(f"Record video to {videos_dir}")
         Util._context = Util._browser.new_context(
             viewport=ViewportSize(width=2000, height=1080),
             record_video_size=ViewportSize(width=2000, height=1080),
@@ -63,6 +111,8 @@ class Util:
             Util._is_trace = True
             ColorLogger.info("Start tracing with screenshots, snapshots, and sources.")
             Util._context.tracing.start(screenshots=True, snapshots=True, sources=True)
+            if Util._record_dir is not None:
+                Util._context.tracing.start_chunk(title="browser_launch")
         Util._page = Util._context.new_page()
         return Util._page
 
@@ -71,11 +121,16 @@ class Util:
         if Util._context is not None:
             Util.stop_tracing()
             Util._context.close()
+            Util._context = None
             if Util._page and Util._page.video:
-                video_path = Util._page.video.path()
-                ColorLogger.info(f"Video file saved to: {video_path}")
+                Util.save_video(Util._page.video)
+        if Util._record_dir is not None:
+            shutil.rmtree(Util._record_dir, ignore_errors=True)
+            Util._record_dir = None
+            Util._trace_chunks = []
 
         if Util._browser is not None:
+            # a shared browser is only disconnected, the browser server closes the contexts of this process
             Util._browser.close()
             Util._browser = None
             ColorLogger.success("Browser Closed Successfully.")
@@ -88,16 +143,79 @@ class Util:
             ColorLogger.info(f"Total running time: {minutes} minutes {seconds:.2f} seconds")
             ColorLogger.info(f"Current time: {chicago_time} at America/Chicago")
 
+    @staticmethod
+    def _close_at_exit():
+        # the case ends without reaching its browser_close(): Util.exit_error, sys.exit() or an unhandled exception,
+        # the recordings are saved as the ones of a failed case
+        if Util._context is None:
+            return
+        Util._is_failed = True
+        try:
+            Util.browser_close()
+        except Exception as e:
+            ColorLogger.warning(f"Failed to save the recordings: {e}")
+
+    @staticmethod
+    def save_video(video):
+        if Util._record_dir is not None and not Util._is_failed:
+            video.delete()
+            ColorLogger.info("Video is discarded, the case has not failed.")
+            return
+        if Util._record_dir is None and not Util._is_shared_browser:
+            ColorLogger.info(f"Video file saved to: {video.path()}")
+            return
+        # the video is recorded in a temp folder or by the browser server (shared browser), copy it to the report folder
+        video_path = os.path.join(ENV.TP_AUTO_REPORT_PATH, str(ENV.RETRY_TIME_FOLDER), f"{uuid.uuid4().hex}.webm")
+        video.save_as(video_path)
+        video.delete()
+        ColorLogger.info(f"Video file saved to: {video_path}")
+
+    @staticmethod
+    def trace_step(title):
+        """
+        Start a new trace chunk for the step in TP_AUTO_REPORT_RECORD_ON_FAILURE mode.
+        The chunks are written to the temp folder, only the last TRACE_CHUNKS_KEPT ones (the failed step and the
+        steps before it) are kept and saved to the report when the case fails.
+        """
+        if Util._context is None or not Util._is_trace or Util._record_dir is None:
+            return
+        Util._save_trace_chunk()
+        Util._context.tracing.start_chunk(title=title)
+
+    @staticmethod
+    def _save_trace_chunk():
+        Util._trace_step += 1
+        chunk_path = os.path.join(Util._record_dir, f"trace-{Util._trace_step:03d}.zip")
+        Util._context.tracing.stop_chunk(path=chunk_path)
+        Util._trace_chunks.append(chunk_path)
+        while len(Util._trace_chunks) > Util.TRACE_CHUNKS_KEPT:
+            os.remove(Util._trace_chunks.pop(0))
+
     @staticmethod
     def stop_tracing():
-        if Util._context is not None and Util._is_trace and ENV.TP_AUTO_REPORT_TRACE:
-            trace_path = os.path.join(
-                ENV.TP_AUTO_REPORT_PATH,
-                str(ENV.RETRY_TIME_FOLDER),
-                "trace.zip"
-            )
+        if Util._context is None or not Util._is_trace or not ENV.TP_AUTO_REPORT_TRACE:
+            return
+        Util._is_trace = False
+        report_dir = os.path.join(ENV.TP_AUTO_REPORT_PATH, str(ENV.RETRY_TIME_FOLDER))
+        if Util._record_dir is None:
+            trace_path = os.path.join(report_dir, "trace.zip")
             Util._context.tracing.stop(path=trace_path)
             ColorLogger.info(f"Save tracing to file: {trace_path}")
+            return
+        if not Util._is_failed:
+            # the current chunk is dropped without being written
+            Util._context.tracing.stop_chunk()
+            Util._context.tracing.stop()
+            ColorLogger.info("Tracing is discarded, the case has not failed.")
+            return
+        Util._save_trace_chunk()
+        Util._context.tracing.stop()
+        os.makedirs(report_dir, exist_ok=True)
+        for chunk_path in Util._trace_chunks:
+            trace_path = os.path.join(report_dir, os.path.basename(chunk_path))
+            shutil.move(chunk_path, trace_path)
+            ColorLogger.info(f"Save tracing to file: {trace_path}")
+        Util._trace_chunks = []
 
     @staticmethod
     def screenshot_page(page, filename):
@@ -118,24 +236,21 @@ class Util:
 
     @staticmethod
     def wait_for_success_message(page, timeout=30):
-        start_time = time.time()
-
-        while True:
-            elapsed_time = time.time() - start_time
-            if elapsed_time > timeout:
-                print("Timeout: Neither success nor error notification appeared.")
-                return None
-
-            try:
-                if page.locator(".notification-message").is_visible() or page.locator(".pl-notification--success").is_visible():
-                    return True
+        """
+        Wait for the success or the error notification, returns as soon as one of them is visible.
 
-                if page.locator(".pl-notification--error").is_visible():
-                    return False
-            except Exception as e:
-                print(f"An unexpected error occurred: {e}")
-                pass
-            time.sleep(0.5)
+        Returns:
+            bool: True for the success notification, False for the error notification, None if none of them
+            is visible within timeout seconds.
+        """
+        index = Util.wait_for_any([
+            page.locator(".notification-message").or_(page.locator(".pl-notification--success")),
+            page.locator(".pl-notification--error"),
+        ], timeout * 1000)
+        if index == -1:
+            print("Timeout: Neither success nor error notification appeared.")
+            return None
+        return index == 0
 
     @staticmethod
     def download_file(file_obj, filename):
@@ -186,10 +301,13 @@ class Util:
 
     @staticmethod
     def exit_error(message, page=None, filename=""):
+        Util._is_failed = True
         if page is not None:
             Util.screenshot_page(page, f"error-{filename}")
-        Util.stop_tracing()
+        if Util._record_dir is None:
+            Util.stop_tracing()
         ColorLogger.error(f"Exiting program: {message}")
+        # in TP_AUTO_REPORT_RECORD_ON_FAILURE mode the recordings are saved by the exit handler of browser_launch
         sys.exit(1)
 
     @staticmethod
@@ -206,129 +324,39 @@ class Util:
 
     @staticmethod
     def set_cp_env():
-        ReportYaml.set(".ENV.CP_MAIL_URL", ENV.TP_AUTO_MAIL_URL)
-        ReportYaml.set(".ENV.CP_ADMIN_URL", ENV.TP_AUTO_ADMIN_URL)
-        ReportYaml.set(".ENV.CP_ADMIN_USER", ENV.CP_ADMIN_EMAIL)
-        ReportYaml.set(".ENV.CP_ADMIN_PASSWORD", ENV.CP_ADMIN_PASSWORD)
-        ReportYaml.set(".ENV.CP_URL", ENV.TP_AUTO_LOGIN_URL)
-        ReportYaml.set(".ENV.CP_USER", ENV.DP_USER_EMAIL)
-        ReportYaml.set(".ENV.CP_PASSWORD", ENV.DP_USER_PASSWORD)
-        ReportYaml.set(".ENV.ELASTIC_URL", ENV.TP_AUTO_ELASTIC_URL)
-        ReportYaml.set(".ENV.KIBANA_URL", ENV.TP_AUTO_KIBANA_URL)
-        ReportYaml.set(".ENV.ELASTIC_USER", ENV.TP_AUTO_ELASTIC_USER)
-        ReportYaml.set(".ENV.ELASTIC_PASSWORD", ENV.TP_AUTO_ELASTIC_PASSWORD)
-        ReportYaml.set(".ENV.PROMETHEUS_URL", ENV.TP_AUTO_PROMETHEUS_URL)
-        ReportYaml.set(".ENV.PROMETHEUS_USER", ENV.TP_AUTO_PROMETHEUS_USER)
-        ReportYaml.set(".ENV.PROMETHEUS_PASSWORD", ENV.TP_AUTO_PROMETHEUS_PASSWORD)
+        with ReportYaml.transaction():
+            ReportYaml.set(".ENV.CP_MAIL_URL", ENV.TP_AUTO_MAIL_URL)
+            ReportYaml.set(".ENV.CP_ADMIN_URL", ENV.TP_AUTO_ADMIN_URL)
+            ReportYaml.set(".ENV.CP_ADMIN_USER", ENV.CP_ADMIN_EMAIL)
+            ReportYaml.set(".ENV.CP_ADMIN_PASSWORD", ENV.CP_ADMIN_PASSWORD)
+            ReportYaml.set(".ENV.CP_URL", ENV.TP_AUTO_LOGIN_URL)
+            ReportYaml.set(".ENV.CP_USER", ENV.DP_USER_EMAIL)
+            ReportYaml.set(".ENV.CP_PASSWORD", ENV.DP_USER_PASSWORD)
+            ReportYaml.set(".ENV.ELASTIC_URL", ENV.TP_AUTO_ELASTIC_URL)
+            ReportYaml.set(".ENV.KIBANA_URL", ENV.TP_AUTO_KIBANA_URL)
+            ReportYaml.set(".ENV.ELASTIC_USER", ENV.TP_AUTO_ELASTIC_USER)
+            ReportYaml.set(".ENV.ELASTIC_PASSWORD", ENV.TP_AUTO_ELASTIC_PASSWORD)
+            ReportYaml.set(".ENV.PROMETHEUS_URL", ENV.TP_AUTO_PROMETHEUS_URL)
+            ReportYaml.set(".ENV.PROMETHEUS_USER", ENV.TP_AUTO_PROMETHEUS_USER)
+            ReportYaml.set(".ENV.PROMETHEUS_PASSWORD", ENV.TP_AUTO_PROMETHEUS_PASSWORD)
         # ReportYaml.sort_yaml_order()
 
     @staticmethod
     def print_cp_info():
-        str_num = 90
-        print("=" * str_num)
-        print(f"{'Control Plane information': ^{str_num}}")
-        print("platform-bootstrap: ", Helper.get_cp_platform_bootstrap_version())
-        print("platform-base: ", Helper.get_cp_platform_base_version())
-
-        if ENV.TP_AUTO_KUBECONFIG:
-            print("KUBECONFIG: ", ENV.TP_AUTO_KUBECONFIG)
+        print(EnvReport(is_print_cp=True, is_print_auth=False, is_print_dp=False).to_text())
 
     @staticmethod
     def print_env_info(is_print_auth=True, is_print_dp=True):
-        str_num = 90
-        col_space = 30
-        print("=" * str_num)
-        if is_print_auth:
-            print("-" * str_num)
-            print(f"{'Login Credentials': ^{str_num}}")
-            print("-" * str_num)
-            print(f"{'Mail URL:':<{col_space}}{ENV.TP_AUTO_MAIL_URL} {'√' if Util.is_url_accessible(ENV.TP_AUTO_MAIL_URL) else 'X'}")
-            print("-" * str_num)
-            print(f"{'CP Admin URL:':<{col_space}}{ENV.TP_AUTO_ADMIN_URL} {'√' if Util.is_url_accessible(ENV.TP_AUTO_ADMIN_URL) else 'X'}")
-            print(f"{'Admin Email:':<{col_space}}{ENV.CP_ADMIN_EMAIL}")
-            print(f"{'Admin Password:':<{col_space}}{ENV.CP_ADMIN_PASSWORD}")
-            print("-" * str_num)
-            print(f"{'CP Login URL:':<{col_space}}{ENV.TP_AUTO_LOGIN_URL} {'√' if Util.is_url_accessible(ENV.TP_AUTO_LOGIN_URL) else 'X'}")
-            print(f"{'User Email:':<{col_space}}{ENV.DP_USER_EMAIL}")
-            print(f"{'User Password:':<{col_space}}{ENV.DP_USER_PASSWORD}")
-        if is_print_dp:
-            print("-" * str_num)
-            print(f"{'Elastic/Kibana/Prometheus Credentials': ^{str_num}}")
-            print("-" * str_num)
-            print(f"{'Elastic URL:':<{col_space}}{ENV.TP_AUTO_ELASTIC_URL}")
-            print(f"{'Kibana URL:':<{col_space}}{ENV.TP_AUTO_KIBANA_URL}")
-            print(f"{'User Name:':<{col_space}}{ENV.TP_AUTO_ELASTIC_USER}")
-            print(f"{'User Password:':<{col_space}}{ENV.TP_AUTO_ELASTIC_PASSWORD}")
-            print("-" * str_num)
-            print(f"{'Prometheus URL:':<{col_space}}{ENV.TP_AUTO_PROMETHEUS_URL}")
-            if ENV.TP_AUTO_PROMETHEUS_USER != "":
-                print(f"{'User Name:':<{col_space}}{ENV.TP_AUTO_PROMETHEUS_USER}")
-            if ENV.TP_AUTO_PROMETHEUS_PASSWORD != "":
-                print(f"{'User Password:':<{col_space}}{ENV.TP_AUTO_PROMETHEUS_PASSWORD}")
-            print("-" * str_num)
-
-            dataplane_fields = [
-                ("o11yConfig", "DataPlane O11y Configured", "true"),
-                ("o11yWidget", "Observability Widget", "true"),
-                ("storage", "DataPlane storage", ENV.TP_AUTO_STORAGE_CLASS),
-                (ENV.TP_AUTO_INGRESS_CONTROLLER_BWCE, "DataPlane ingress", ENV.TP_AUTO_INGRESS_CONTROLLER_BWCE),
-                (ENV.TP_AUTO_INGRESS_CONTROLLER_FLOGO, "DataPlane ingress", ENV.TP_AUTO_INGRESS_CONTROLLER_FLOGO),
-                (ENV.TP_AUTO_INGRESS_CONTROLLER_TIBCOHUB, "DataPlane ingress", ENV.TP_AUTO_INGRESS_CONTROLLER_TIBCOHUB),
-            ]
-            capability_fields = [
-                ("provisionConnector", "Provision connector"),
-                ("appBuild", "Create App Build"),
-            ]
-            app_fields = [
-                ("status", "Status"),
-                ("endpointPublic", "Set endpoint to Public"),
-                ("enableTrace", "Enabled trace"),
-                ("testedEndpoint", "Tested Endpoint"),
-            ]
-            dp_names = ReportYaml.get_dataplanes()
-            if len(dp_names) > 0:
-                print(f"{'Data Plane, Capability, App': ^{str_num}}")
-                print("-" * str_num)
-                for dp_name in dp_names:
-                    print(f"{'DataPlane Name':<{col_space}}{dp_name}")
-
-                    for field_key, field_label, field_value in dataplane_fields:
-                        if ReportYaml.get_dataplane_info(dp_name, field_key) == "true":
-                            print(f"{field_label:<{col_space}}{field_value}")
-
-                    dp_capabilities = ReportYaml.get_capabilities(dp_name)
-                    if len(dp_capabilities) > 0:
-                        print(f"{'Provisioned capabilities':<{col_space}}"
-                              f"{[cap.upper() for cap in dp_capabilities]}"
-                              )
-
-                    for dp_capability in dp_capabilities:
-                        app_names = ReportYaml.get_capability_apps(dp_name, dp_capability)
-                        provision_connector = ReportYaml.get_capability_info(dp_name, dp_capability, "provisionConnector")
-                        app_build = ReportYaml.get_capability_info(dp_name, dp_capability, "appBuild")
-                        if len(app_names) > 0 or provision_connector or app_build:
-                            print(f"{dp_capability.capitalize()}")
-
-                        for field_key, field_label in capability_fields:
-                            field_value = ReportYaml.get_capability_info(dp_name, dp_capability, field_key)
-                            if field_value:
-                                print(f"    {field_label:<{col_space}}{field_value}")
-
-                        for app_name in app_names:
-                            print(f"{'  App Name':<{col_space}}{app_name}")
-                            for field_key, field_label in app_fields:
-                                field_value = ReportYaml.get_capability_app_info(dp_name, dp_capability, app_name, field_key)
-                                if field_value:
-                                    print(f"    {field_label:<{col_space}}{field_value}")
-        print("=" * str_num)
+        print(EnvReport(is_print_auth=is_print_auth, is_print_dp=is_print_dp).to_text())
+
+    @staticmethod
+    def get_env_info(is_print_cp=True, is_print_auth=True, is_print_dp=True):
+        """ One snapshot of the environment, render it with to_text() or to_json() """
+        return EnvReport(is_print_cp, is_print_auth, is_print_dp)
 
     @staticmethod
     def is_url_accessible(url, timeout=5):
-        try:
-            with urllib.request.urlopen(url, timeout=timeout) as response:
-                return response.status < 400
-        except (HTTPError, URLError):
-            return False
+        return is_url_accessible(url, timeout)
 
     @staticmethod
     def check_page_url_accessible(page, url, env_key=None, screenshot_name=None):
@@ -348,26 +376,74 @@ class Util:
 
     @staticmethod
     def check_dom_visibility(page, dom_selector, interval=10, max_wait=180, is_refresh=False):
-        total_attempts = max_wait // interval
-        timeout = interval if interval < 5 else 5
-        print(f"Check dom visibility, wait {timeout} seconds first, then loop to check for {max_wait} seconds.")
-        page.wait_for_timeout(timeout * 1000)
-        for attempt in range(total_attempts):
-            if dom_selector.is_visible():
+        """
+        Wait until dom_selector is visible, returns as soon as it is.
+
+        The dom is checked for as long as before (the first check after min(interval, 5) seconds, then one check every
+        interval seconds for max_wait seconds). Without is_refresh, Playwright waits for the dom for the whole time.
+        With is_refresh, the page is reloaded when the dom is not visible after a wait, the wait starts at
+        min(interval, 5) seconds and doubles after every reload, up to interval seconds.
+        """
+        first_wait = interval if interval < 5 else 5
+        total_wait = first_wait + max(max_wait // interval - 1, 0) * interval
+        print(f"Check dom visibility, wait up to {total_wait} seconds{', reload the page in between' if is_refresh else ''}.")
+        deadline = time.monotonic() + total_wait
+        wait = first_wait if is_refresh else total_wait
+        attempt = 1
+        while True:
+            remaining = deadline - time.monotonic()
+            if Util.wait_for_visible(dom_selector, min(wait, remaining) * 1000):
                 print("Dom is now visible.")
                 return True
+            if not is_refresh or deadline - time.monotonic() <= 0:
+                break
+            print(f"--- Attempt {attempt}, Dom not visible after {wait} seconds. Page reload {attempt}")
+            Util.refresh_page(page)
+            wait = min(wait * 2, interval)
+            attempt += 1
 
-            print(f"--- Attempt {attempt + 1}/{total_attempts}, Loop to check: Checking if dom is visible...")
-            if attempt <= total_attempts - 1:
-                if is_refresh:
-                    print(f"Page reload {attempt + 1}")
-                    Util.refresh_page(page)
-                print(f"Dom not visible. Waiting for {interval} seconds before retrying...")
-                page.wait_for_timeout(interval * 1000)
-
-        ColorLogger.warning(f"Dom is still not visible after waiting for {max_wait} seconds.")
+        ColorLogger.warning(f"Dom is still not visible after waiting for {total_wait} seconds.")
         return False
 
+    @staticmethod
+    def wait_for_visible(locator, timeout=3000):
+        """
+        Returns True as soon as the locator is visible, False if it is not visible within timeout (ms).
+        """
+        return Util.wait_for_any([locator], timeout) == 0
+
+    @staticmethod
+    def wait_for_any(locators, timeout=30000):
+        """
+        Race the locators with the native waiting of Playwright, returns as soon as one of them is visible.
+
+        Returns:
+            int: index of the first visible locator in locators, -1 if none of them is visible within timeout (ms).
+        """
+        visible_locators = [locator.filter(visible=True) for locator in locators]
+        any_visible = visible_locators[0]
+        for locator in visible_locators[1:]:
+            any_visible = any_visible.or_(locator)
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            try:
+                for index, locator in enumerate(visible_locators):
+                    if locator.count() > 0:
+                        return index
+                remaining = deadline - time.monotonic()
+                # timeout=0 means no timeout for Playwright
+                if remaining <= 0:
+                    return -1
+                any_visible.first.wait_for(state="visible", timeout=remaining * 1000)
+            except PlaywrightTimeoutError:
+                pass
+            except PlaywrightError as e:
+                # the page can navigate or reload while it is checked, the locators are checked again until timeout
+                print(f"An unexpected error occurred: {e}")
+                if deadline - time.monotonic() <= 0:
+                    return -1
+                time.sleep(0.5)
+
     @staticmethod
     def click_button_until_enabled(page, button_selector):
         button_selector.wait_for(state="visible")
@@ -391,8 +467,7 @@ class Util:
             waiting_selector.wait_for(state="visible")
             if message:
                 print(message)
-            page.wait_for_timeout(3000)
-            current_condition = retry_selector.is_visible()
+            current_condition = Util.wait_for_visible(retry_selector, 3000)
 
         return current_condition
 
@@ -407,8 +482,7 @@ class Util:
 
     @staticmethod
     def clean_ansi_escape(line, is_bytes=True):
-        ansi_escape = re.compile(r'\x1B[@-_][0-?]*[ -/]*[@-~]')
         if is_bytes:
             line = line.decode("utf-8", errors="replace")
-        line = ansi_escape.sub('', line)
+        line = ANSI_ESCAPE_PATTERN.sub('', line)
         return line.strip()
@@ -0,0 +1,291 @@
+#  Copyright (c) 2025. Cloud Software Group, Inc. All Rights Reserved. Confidential & Proprietary
+"""
+Zygote style warm interpreter pool for automation cases, see TP_AUTO_WARM_POOL.
+"""
+import atexit
+import io
+import json
+import os
+import runpy
+import selectors
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+PRELOAD_MODULES = [
+    "pytz",
+    "colorama",
+    "playwright.sync_api",
+    "utils.color_logger",
+    "utils.helper",
+]
+
+class WarmProcess:
+    """A forked case process, exposes the part of subprocess.Popen used by server.py"""
+    def __init__(self, args, conn, stdout_fd):
+        self.args = args
+        self.returncode = None
+        self.stdout = open(stdout_fd, "rb")
+        self._conn = conn
+        self._buffer = b""
+        # poll/wait can be called from the job thread and the stop request at the same time
+        self._read_lock = threading.Lock()
+        self.pid = self._read_message(timeout=10)["pid"]
+
+    def poll(self):
+        # another thread is waiting for the exit code, the process is still running
+        if self.returncode is None and self._read_lock.acquire(blocking=False):
+            try:
+                if self.returncode is None:
+                    self._read_returncode(timeout=0)
+            finally:
+                self._read_lock.release()
+        return self.returncode
+
+    def wait(self, timeout=None):
+        if not self._read_lock.acquire(timeout=-1 if timeout is None else timeout):
+            raise subprocess.TimeoutExpired(self.args, timeout)
+        try:
+            if self.returncode is None and not self._read_returncode(timeout):
+                raise subprocess.TimeoutExpired(self.args, timeout)
+        finally:
+            self._read_lock.release()
+        return self.returncode
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+    def send_signal(self, sig):
+        if self.poll() is None:
+            try:
+                os.kill(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def _read_returncode(self, timeout):
+        try:
+            message = self._read_message(timeout)
+        except TimeoutError:
+            return False
+        except (ConnectionError, ValueError):
+            # zygote is gone, the exit code of the case is unknown
+            message = {"returncode": -1}
+        self.returncode = message["returncode"]
+        self._conn.close()
+        return True
+
+    def _read_message(self, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while b"\n" not in self._buffer:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            self._conn.settimeout(remaining)
+            try:
+                chunk = self._conn.recv(4096)
+            except (socket.timeout, BlockingIOError):
+                raise TimeoutError()
+            if not chunk:
+                raise ConnectionError("warm pool connection closed")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line)
+
+class WarmPool:
+    def __init__(self, preload_modules=None):
+        self.preload_modules = preload_modules or PRELOAD_MODULES
+        self.socket_path = os.path.join(tempfile.mkdtemp(prefix="tp-auto-warm-pool-"), "zygote.sock")
+        self._zygote = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_supported():
+        return hasattr(os, "fork") and hasattr(socket, "send_fds")
+
+    def start(self):
+        with self._lock:
+            if self._zygote is not None and self._zygote.poll() is None:
+                return
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+            print(f"[INFO] Starting warm pool zygote, preload: {', '.join(self.preload_modules)}")
+            self._zygote = subprocess.Popen(
+                [sys.executable, "-u", "-m", "utils.warm_pool", self.socket_path, *self.preload_modules],
+                stdin=subprocess.PIPE,
+                env={**os.environ, "PYTHONIOENCODING": "utf-8"}
+            )
+
+    def spawn(self, case, env_vars, cwd=None):
+        """Fork a child from the zygote to run `python -m <case>` with env_vars."""
+        self.start()
+        conn = self._connect()
+        read_fd, write_fd = os.pipe()
+        try:
+            payload = json.dumps({"case": case, "env": env_vars, "cwd": cwd or os.getcwd()}).encode() + b"\n"
+            sent = socket.send_fds(conn, [payload], [write_fd])
+            conn.sendall(payload[sent:])
+        except Exception:
+            os.close(read_fd)
+            conn.close()
+            raise
+        finally:
+            os.close(write_fd)
+        try:
+            return WarmProcess([sys.executable, "-u", "-m", case], conn, read_fd)
+        except Exception:
+            os.close(read_fd)
+            conn.close()
+            raise
+
+    def _connect(self, timeout=30):
+        deadline = time.monotonic() + timeout
+        while True:
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                conn.connect(self.socket_path)
+                return conn
+            except (FileNotFoundError, ConnectionRefusedError):
+                conn.close()
+                if self._zygote.poll() is not None:
+                    raise RuntimeError(f"warm pool zygote exited with code {self._zygote.returncode}")
+                if time.monotonic() > deadline:
+                    raise RuntimeError("warm pool zygote is not ready")
+                time.sleep(0.05)
+
+def _run_child(request, stdout_fd):
+    """Runs in the forked child, never returns."""
+    exit_code = 0
+    try:
+        os.dup2(stdout_fd, 1)
+        os.dup2(stdout_fd, 2)
+        os.close(stdout_fd)
+        # own session and process group, so the job can be stopped with all its processes
+        os.setsid()
+        os.environ.clear()
+        os.environ.update(request["env"])
+        os.chdir(request["cwd"])
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+        colorama = sys.modules.get("colorama")
+        if colorama is not None:
+            colorama.deinit()
+        # same as `python -u`, unbuffered binary layer and write through text layer
+        sys.stdout = io.TextIOWrapper(open(1, "wb", buffering=0, closefd=False),
+                                      encoding="utf-8", errors="replace", write_through=True)
+        sys.stderr = io.TextIOWrapper(open(2, "wb", buffering=0, closefd=False),
+                                      encoding="utf-8", errors="backslashreplace", write_through=True)
+        if colorama is not None and "utils.color_logger" in sys.modules:
+            colorama.init(autoreset=True)
+
+        sys.argv = [request["case"]]
+        runpy.run_module(request["case"], run_name="__main__", alter_sys=True)
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        try:
+            atexit._run_exitfuncs()
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(exit_code)
+
+def _receive_request(conn):
+    conn.settimeout(10)
+    data, fds, _flags, _addr = socket.recv_fds(conn, 1024 * 1024, 1)
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(1024 * 1024)
+        if not chunk:
+            break
+        data += chunk
+    if len(fds) != 1:
+        raise ValueError("stdout file descriptor is missing in warm pool request")
+    conn.settimeout(None)
+    return json.loads(data), fds[0]
+
+def _send_message(conn, message):
+    try:
+        conn.sendall(json.dumps(message).encode() + b"\n")
+    except OSError:
+        pass
+
+def serve(socket_path, preload_modules):
+    for module in preload_modules:
+        try:
+            __import__(module)
+        except Exception as e:
+            print(f"[WARNING] Warm pool can not preload {module}: {e}")
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(16)
+    selector = selectors.DefaultSelector()
+    selector.register(server, selectors.EVENT_READ, "accept")
+    # the bootstrap server holds the other end of stdin, EOF means the server is gone
+    selector.register(sys.stdin, selectors.EVENT_READ, "parent")
+    children = {}
+    print(f"[INFO] Warm pool zygote {os.getpid()} is ready on {socket_path}")
+
+    while True:
+        for key, _events in selector.select(timeout=0.2):
+            if key.data == "parent":
+                if not sys.stdin.buffer.read1(1024):
+                    for pid in children:
+                        try:
+                            os.kill(pid, signal.SIGTERM)
+                        except ProcessLookupError:
+                            pass
+                    os.remove(socket_path)
+                    return
+                continue
+
+            conn, _ = server.accept()
+            try:
+                request, stdout_fd = _receive_request(conn)
+            except Exception as e:
+                print(f"[ERROR] Invalid warm pool request: {e}")
+                conn.close()
+                continue
+
+            pid = os.fork()
+            if pid == 0:
+                selector.close()
+                server.close()
+                for child_conn in children.values():
+                    child_conn.close()
+                conn.close()
+                _run_child(request, stdout_fd)
+            os.close(stdout_fd)
+            children[pid] = conn
+            _send_message(conn, {"pid": pid})
+
+        # reap finished children and report exit code to the server
+        while children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            conn = children.pop(pid, None)
+            if conn is not None:
+                _send_message(conn, {"returncode": os.waitstatus_to_exitcode(status)})
+                conn.close()
+
+if __name__ == "__main__":
+    serve(sys.argv[1], sys.argv[2:])